@@ -0,0 +1,193 @@
+"""
+Active-learning sampler for ML training data
+Simulates in rounds, sending each new batch to the parameters where the forests disagree most
+Usage: python active_learning.py [--workers N] [--baseline]
+"""
+
+import json
+import yaml
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from sklearn.metrics import mean_absolute_error
+from utils.logger import Logger
+from utils.cache import RunCache
+from utils.checkpoint import GenerationCheckpoint
+from train_data import TrainingDataGenerator, NUMPY_BATCH_SIZE
+from train_models import ModelTrainer
+from utils.sampling import ParameterSampler
+
+
+class ActiveLearningSampler:
+    def __init__(self, config_path='config.yaml', backend=None):
+        with open(config_path) as f:
+            self.config = yaml.safe_load(f)
+        self.settings = self.config['training'].get('active_learning', {})
+        
+        self.output_dir = Path('outputs')
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.generator = TrainingDataGenerator(config_path, backend)
+        # Candidates are scored on cheap numpy-backend features, never on SUMO runs
+        self.surrogate = TrainingDataGenerator(config_path, backend='numpy')
+        self.trainer = ModelTrainer(config_path)
+        
+        # Candidates continue one sequence of the configured method; held-out runs are plain random draws
+        method = self.config['training'].get('sampling', 'legacy')
+        self.samplers = {
+            'candidates': self.make_sampler(1, 'random' if method == 'legacy' else method),
+            'test': self.make_sampler(2, 'random')
+        }
+        self.n_drawn = {name: 0 for name in self.samplers}
+        self.n_runs = 0
+    
+    def make_sampler(self, stream, method):
+        """Parameter sampler on its own stream of the master seed"""
+        seed = np.random.SeedSequence(self.config['training']['random_seed'], spawn_key=(stream,))
+        return ParameterSampler(self.config['training']['scenarios'], self.config['training']['train_lengths'],
+                                int(seed.generate_state(1)[0]), method)
+    
+    def sample_params(self, n, stream='candidates'):
+        """Next n parameter sets of a sampler stream"""
+        sampler = self.samplers[stream]
+        start = self.n_drawn[stream]
+        self.n_drawn[stream] += n
+        return sampler.to_dicts(sampler.sample(start + n, start, n))
+    
+    def simulate(self, params, workers, batch_size, cache, checkpoint=None):
+        """Simulate parameter sets under fresh run ids and return their feature rows"""
+        run_ids = range(self.n_runs, self.n_runs + len(params))
+        self.n_runs += len(params)
+        tasks = [(run_id, p, self.generator.run_seed(run_id)) for run_id, p in zip(run_ids, params)]
+        
+        rows = []
+        for (run_id, _, _), (trajectory_df, features) in zip(tasks, self.generator.iter_runs(tasks, workers, batch_size, cache)):
+            if checkpoint is not None:
+                checkpoint.add(run_id, trajectory_df, features)
+            if features is not None:
+                rows.append(features)
+        return pd.DataFrame(rows)
+    
+    def train(self, features):
+        """Fit the ETA and ETD forests on all features"""
+        X = features[ModelTrainer.FEATURE_COLS]
+        Logger.set_verbose(False)
+        try:
+            return {
+                'eta': self.trainer.train_eta_model(X, features['eta_actual']),
+                'etd': self.trainer.train_etd_model(X, features['etd_actual'])
+            }
+        finally:
+            Logger.set_verbose(True)
+    
+    def evaluate(self, models, test):
+        """Test MAE of both forests on the held-out runs"""
+        X = test[ModelTrainer.FEATURE_COLS]
+        return {name: float(mean_absolute_error(test[f'{name}_actual'], model.predict(X)))
+                for name, model in models.items()}
+    
+    def score_candidates(self, models, candidates):
+        """Tree disagreement per candidate (std across estimators_, relative to each MAE target)"""
+        features = self.surrogate.extract_features_batch(
+            pd.concat(self.surrogate.run_simulation_numpy(list(enumerate(candidates))).values(), ignore_index=True)
+        )
+        X = features[ModelTrainer.FEATURE_COLS].to_numpy(dtype=np.float32)
+        
+        scores = np.zeros(len(candidates))
+        valid = features['run_id'].to_numpy()
+        for name, model in models.items():
+            spread = np.stack([tree.predict(X) for tree in model.estimators_]).std(axis=0)
+            scores[valid] += spread / self.settings.get(f'target_{name}_mae', 0.05)
+        return scores
+    
+    def run(self, workers=None, baseline=False):
+        """Alternate simulate/train/select rounds until the MAE targets or max_runs are reached"""
+        settings = self.settings
+        if workers is None:
+            workers = self.config['training'].get('workers', 1)
+        batch_size = self.config['training'].get('batch_size', 1)
+        if self.generator.backend == 'numpy' and batch_size == 1:
+            batch_size = NUMPY_BATCH_SIZE
+        targets = {name: settings.get(f'target_{name}_mae', 0.05) for name in ('eta', 'etd')}
+        max_runs = settings.get('max_runs', self.config['training']['n_samples'])
+        
+        Logger.section(f"Active learning ({self.generator.backend} backend): targets ETA {targets['eta']}s, "
+                       f"ETD {targets['etd']}s, at most {max_runs} training runs")
+        
+        if self.generator.backend != 'numpy' and not self.generator.generate_network(batch_size):
+            return None
+        
+        cache = self.generator.open_cache()
+        checkpoint = GenerationCheckpoint(
+            self.output_dir / 'checkpoint',
+            RunCache.make_key({'active_learning': settings, 'backend': self.generator.backend}),
+            self.config['training'].get('checkpoint_every', 100),
+            self.generator.output_format
+        )
+        checkpoint.start()
+        
+        try:
+            test = self.simulate(self.sample_params(settings.get('test_runs', 200), 'test'), workers, batch_size, cache)
+            features = self.simulate(self.sample_params(settings.get('initial_runs', 200)), workers, batch_size, cache, checkpoint)
+            
+            rounds = []
+            while True:
+                models = self.train(features)
+                mae = self.evaluate(models, test)
+                rounds.append({'n_runs': len(features), 'eta_mae': mae['eta'], 'etd_mae': mae['etd']})
+                Logger.log(f"Round {len(rounds)}: {len(features)} runs, ETA MAE {mae['eta']:.4f}s, ETD MAE {mae['etd']:.4f}s")
+                
+                done = all(mae[name] <= targets[name] for name in targets)
+                if done or len(features) >= max_runs:
+                    break
+                
+                candidates = self.sample_params(settings.get('candidates', 5000))
+                scores = self.score_candidates(models, candidates)
+                n_next = min(settings.get('batch_runs', 100), max_runs - len(features))
+                chosen = [candidates[i] for i in np.argsort(scores)[::-1][:n_next]]
+                features = pd.concat([features, self.simulate(chosen, workers, batch_size, cache, checkpoint)],
+                                     ignore_index=True)
+            
+            report = {'targets': targets, 'reached': done, 'test_runs': len(test), 'rounds': rounds}
+            if baseline:
+                # Same number of runs straight from the sampler, without selection
+                uniform = self.simulate(self.sample_params(len(features)), workers, batch_size, cache)
+                report['uniform_baseline'] = dict(n_runs=len(uniform), **self.evaluate(self.train(uniform), test))
+        finally:
+            self.generator.close_traci()
+        
+        Logger.log(("Targets reached" if done else "Stopped at max_runs") + f" after {len(features)} training runs "
+                   f"({len(test)} test runs)")
+        if baseline:
+            uniform = report['uniform_baseline']
+            Logger.log(f"Uniform baseline with {uniform['n_runs']} runs: ETA MAE {uniform['eta']:.4f}s, "
+                       f"ETD MAE {uniform['etd']:.4f}s")
+        
+        checkpoint.finalize(self.output_dir)
+        checkpoint.remove()
+        if cache is not None:
+            cache.evict()
+        
+        report_path = self.output_dir / 'active_learning.json'
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        Logger.log(f"\nSaved:")
+        Logger.log(f"  {self.generator.trajectories_path()}")
+        Logger.log(f"  {self.generator.features_path()}")
+        Logger.log(f"  {report_path}")
+        
+        return report
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate training data by active learning')
+    parser.add_argument('--workers', type=int, help='Parallel SUMO processes (default: training.workers)')
+    parser.add_argument('--backend', choices=TrainingDataGenerator.BACKENDS, help='Simulation backend (default: training.backend)')
+    parser.add_argument('--baseline', action='store_true', help='Also train on as many unselected sampler runs and compare')
+    parser.add_argument('--config', default='config.yaml', help='Config file path')
+    args = parser.parse_args()
+    
+    sampler = ActiveLearningSampler(args.config, args.backend)
+    sampler.run(args.workers, args.baseline)
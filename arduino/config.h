@@ -36,7 +36,7 @@ inline unsigned long getDisplayUpdateInterval() {
 }
 
 inline float getDefaultTrainLength() {
-    return 0.15f;
+    return TRAIN_LENGTH;
 }
 
 // REVERSED: Servo moves up to close gate
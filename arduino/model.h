@@ -1,82 +1,554 @@
 #ifndef MODEL_H
 #define MODEL_H
 
-#define FEAT_TIME_01 0
-#define FEAT_TIME_12 1
-#define FEAT_SPEED_01 2
-#define FEAT_SPEED_12 3
-#define FEAT_ACCEL 4
-#define FEAT_DISTANCE 5
-
-#define FEAT_ETD_TIME_01 0
-#define FEAT_ETD_TIME_12 1
-#define FEAT_ETD_SPEED_01 2
-#define FEAT_ETD_SPEED_12 3
-#define FEAT_ETD_ACCEL 4
-#define FEAT_ETD_DISTANCE 5
-#define FEAT_ETD_TRAIN_LENGTH 6
-
-float predictETA(float features[6]) {
-    float speed = features[FEAT_SPEED_12];
-    float accel = features[FEAT_ACCEL];
-    float distance = features[FEAT_DISTANCE];
-    
-    if (speed <= 0 || distance <= 0) return -1;
-    
-    if (accel > -0.1 && accel < 0.1) {
-        return distance / speed;
-    }
-    
-    float discriminant = speed * speed + 2.0 * accel * distance;
-    
-    if (discriminant < 0) {
-        return distance / speed;
-    }
-    
-    float t = (-speed + sqrt(discriminant)) / accel;
-    
-    if (t > 0 && t < 1000) {
-        return t;
+#include <avr/pgmspace.h>
+#include "thresholds.h"
+
+#define NUM_FEATURES 14
+
+#define FEAT_DISTANCE_REMAINING 0
+#define FEAT_TRAIN_LENGTH 1
+#define FEAT_LAST_SPEED 2
+#define FEAT_SPEED_CHANGE 3
+#define FEAT_TIME_01 4
+#define FEAT_TIME_12 5
+#define FEAT_AVG_SPEED_01 6
+#define FEAT_AVG_SPEED_12 7
+#define FEAT_SPEED_0 8
+#define FEAT_SPEED_1 9
+#define FEAT_ACCEL_01 10
+#define FEAT_ACCEL_12 11
+#define FEAT_ACCEL_TREND 12
+#define FEAT_PREDICTED_CROSSING_SPEED 13
+
+// Features are computed in the training layout; demo seconds are scaled to model seconds
+#define MODEL_S0_POS 500.0f
+#define MODEL_S1_POS 1000.0f
+#define MODEL_S2_POS 1500.0f
+#define MODEL_CROSSING_POS 2000.0f
+#define MODEL_TIME_SCALE 11.428571701049805f
+#define MODEL_TRAIN_LENGTH 200.0f
+
+#define MODEL_IS_FOREST 1
+#define FOREST_LEAF 0xFF
+
+// Preorder layout: the left child of node i is i + 1; leaves hold their value instead of a threshold
+struct ForestNode {
+    uint8_t feature;
+    int16_t value;
+    uint16_t right;
+} __attribute__((packed));
+
+// int16 feature = floor((x - offset) / step), the same scale the thresholds were quantized with
+const float FEATURE_OFFSET[NUM_FEATURES] PROGMEM = {0.0f, 175.0f, 42.038936614990234f, 7.4307966232299805f, 14.529909133911133f, 13.0901517868042f, 38.26683044433594f, 40.51264572143555f, 33.916072845458984f, 39.61880874633789f, 0.566218376159668f, 0.25621533393859863f, -0.4011516571044922f, 43.27316665649414f};
+const float FEATURE_STEP[NUM_FEATURES] PROGMEM = {1.0f, 0.0015384615398943424f, 0.0002446379803586751f, 0.0001842665660660714f, 0.00013069160922896117f, 9.494087134953588e-05f, 0.00033419858664274216f, 0.00029151543276384473f, 0.0002995943941641599f, 0.00031818749266676605f, 1.0195434697379824e-05f, 7.379682301689172e-06f, 1.2776697076333221e-05f, 0.00020686046627815813f};
+
+// ETA forest: 10 trees, 2128 nodes, 10660 bytes
+#define ETA_N_TREES 10
+#define ETA_VALUE_OFFSET 12.340700149536133f
+#define ETA_VALUE_STEP 7.194028148660436e-05f
+
+const uint16_t ETA_ROOTS[ETA_N_TREES] PROGMEM = {0, 211, 422, 639, 852, 1051, 1266, 1477, 1682, 1901};
+
+const ForestNode ETA_NODES[2128] PROGMEM = {
+    {13, 19293, 106}, {2, -15958, 39}, {2, -26750, 14}, {2, -31747, 9}, {7, -32501, 6}, {255, 32184, 0}, {13, -27421, 8}, {255, 25096, 0},
+    {255, 22472, 0}, {2, -29127, 11}, {255, 18693, 0}, {13, -21092, 13}, {255, 17423, 0}, {255, 15213, 0}, {2, -20758, 24}, {2, -23447, 23},
+    {13, -19032, 18}, {255, 14072, 0}, {13, -15030, 22}, {1, 32500, 21}, {255, 11862, 0}, {255, 12588, 0}, {255, 11082, 0}, {255, 8467, 0},
+    {13, -9398, 32}, {13, -12384, 27}, {255, 7746, 0}, {2, -20218, 29}, {255, 6221, 0}, {6, -16034, 31}, {255, 5670, 0}, {255, 5281, 0},
+    {13, -3858, 38}, {2, -17457, 37}, {10, -20592, 36}, {255, 4297, 0}, {255, 3157, 0}, {255, 2900, 0}, {255, 1850, 0}, {2, -4798, 83},
+    {13, 3960, 62}, {2, -12877, 49}, {10, -25668, 46}, {2, -14433, 45}, {255, 1605, 0}, {255, 516, 0}, {11, 14639, 48}, {255, -249, 0},
+    {255, -1370, 0}, {13, 832, 57}, {2, -11145, 54}, {13, -601, 53}, {255, -1838, 0}, {255, -2459, 0}, {8, -5071, 56}, {255, -3288, 0},
+    {255, -4165, 0}, {5, 865, 59}, {255, -6168, 0}, {1, 32500, 61}, {255, -4698, 0}, {255, -3966, 0}, {2, -8554, 72}, {13, 7073, 69},
+    {2, -11714, 66}, {255, -4362, 0}, {1, 32500, 68}, {255, -5560, 0}, {255, -6061, 0}, {2, -9614, 71}, {255, -6154, 0}, {255, -7421, 0},
+    {13, 10823, 80}, {2, -5830, 77}, {4, 10258, 76}, {255, -7468, 0}, {255, -8392, 0}, {13, 6172, 79}, {255, -7971, 0}, {255, -8758, 0},
+    {10, -9917, 82}, {255, -9486, 0}, {255, -10902, 0}, {2, -260, 97}, {13, 10164, 88}, {2, -2661, 87}, {255, -9540, 0}, {255, -11209, 0},
+    {10, -14476, 94}, {7, -2344, 93}, {12, 32500, 92}, {255, -11808, 0}, {255, -12326, 0}, {255, -13080, 0}, {3, 26046, 96}, {255, -14096, 0},
+    {255, -13214, 0}, {8, 11441, 105}, {13, 14388, 102}, {9, -2844, 101}, {255, -13858, 0}, {255, -14821, 0}, {12, 31146, 104}, {255, -15880, 0},
+    {255, -14791, 0}, {255, -17229, 0}, {2, 15861, 152}, {2, 10134, 131}, {13, 26087, 120}, {2, 1789, 113}, {8, -21315, 112}, {255, -14802, 0},
+    {255, -16297, 0}, {2, 6986, 119}, {13, 20210, 116}, {255, -17559, 0}, {2, 2691, 118}, {255, -18175, 0}, {255, -18997, 0}, {255, -20448, 0},
+    {9, -7983, 122}, {255, -19774, 0}, {13, 29431, 128}, {6, -6479, 127}, {12, 31231, 126}, {255, -20757, 0}, {255, -21151, 0}, {255, -21748, 0},
+    {5, -9428, 130}, {255, -22847, 0}, {255, -22063, 0}, {13, 30246, 143}, {13, 23509, 134}, {255, -21530, 0}, {13, 27541, 138}, {1, -32500, 137},
+    {255, -22770, 0}, {255, -23247, 0}, {12, 30918, 140}, {255, -24454, 0}, {10, -18622, 142}, {255, -23743, 0}, {255, -23508, 0}, {2, 14454, 151},
+    {2, 13016, 148}, {1, -32500, 147}, {255, -24436, 0}, {255, -24896, 0}, {4, -7808, 150}, {255, -25329, 0}, {255, -25922, 0}, {255, -27301, 0},
+    {2, 22790, 172}, {2, 18096, 159}, {11, 18330, 156}, {255, -26730, 0}, {2, 16577, 158}, {255, -27415, 0}, {255, -28089, 0}, {11, 3792, 163},
+    {7, 18315, 162}, {255, -27763, 0}, {255, -28746, 0}, {2, 21818, 169}, {12, 31358, 166}, {255, -29188, 0}, {2, 20077, 168}, {255, -29534, 0},
+    {255, -29869, 0}, {11, 22787, 171}, {255, -30217, 0}, {255, -30708, 0}, {2, 26466, 184}, {3, -9167, 175}, {255, -30461, 0}, {2, 23933, 177},
+    {255, -30827, 0}, {10, -21811, 181}, {2, 25833, 180}, {255, -31074, 0}, {255, -31340, 0}, {2, 24869, 183}, {255, -31380, 0}, {255, -31595, 0},
+    {2, 29245, 196}, {2, 27578, 191}, {5, -25692, 188}, {255, -31645, 0}, {6, 9286, 190}, {255, -31933, 0}, {255, -31831, 0}, {3, -6709, 193},
+    {255, -32027, 0}, {2, 28579, 195}, {255, -32147, 0}, {255, -32236, 0}, {2, 32402, 204}, {2, 30221, 201}, {8, 31065, 200}, {255, -32348, 0},
+    {255, -32245, 0}, {9, 31944, 203}, {255, -32463, 0}, {255, -32420, 0}, {12, -4743, 208}, {5, -32478, 207}, {255, -32471, 0}, {255, -32433, 0},
+    {12, 2936, 210}, {255, -32478, 0}, {255, -32497, 0}, {2, -129, 299}, {13, -9259, 238}, {13, -24922, 219}, {13, -31051, 216}, {255, 32500, 0},
+    {5, 29013, 218}, {255, 22056, 0}, {255, 24830, 0}, {2, -25563, 229}, {2, -27551, 226}, {2, -29411, 223}, {255, 18986, 0}, {2, -28392, 225},
+    {255, 17267, 0}, {255, 16829, 0}, {10, -25336, 228}, {255, 14928, 0}, {255, 12971, 0}, {2, -21445, 233}, {12, 31354, 232}, {255, 12100, 0},
+    {255, 10482, 0}, {13, -12384, 235}, {255, 8373, 0}, {9, -18943, 237}, {255, 6508, 0}, {255, 5673, 0}, {13, 3837, 264}, {13, -2259, 251},
+    {2, -17230, 244}, {10, -20592, 243}, {255, 4108, 0}, {255, 3023, 0}, {2, -13957, 250}, {13, -5673, 247}, {255, 2565, 0}, {12, 31333, 249},
+    {255, 1557, 0}, {255, 1141, 0}, {255, -886, 0}, {2, -10060, 259}, {12, 31868, 258}, {1, 32500, 257}, {13, 256, 256}, {255, -2615, 0},
+    {255, -3674, 0}, {255, -2086, 0}, {255, -3475, 0}, {6, -9471, 263}, {13, -187, 262}, {255, -3543, 0}, {255, -4724, 0}, {255, -5916, 0},
+    {13, 10560, 286}, {2, -5728, 279}, {2, -9285, 272}, {2, -11714, 269}, {255, -4326, 0}, {13, 7874, 271}, {255, -5658, 0}, {255, -6586, 0},
+    {13, 6374, 276}, {5, 665, 275}, {255, -7034, 0}, {255, -6147, 0}, {8, -19575, 278}, {255, -8275, 0}, {255, -7643, 0}, {2, -3708, 283},
+    {3, 8238, 282}, {255, -8381, 0}, {255, -9397, 0}, {6, -6784, 285}, {255, -10245, 0}, {255, -11067, 0}, {13, 15831, 294}, {6, -18728, 289},
+    {255, -10676, 0}, {13, 12865, 291}, {255, -11730, 0}, {9, -10270, 293}, {255, -12356, 0}, {255, -12905, 0}, {12, 31174, 296}, {255, -13578, 0},
+    {13, 20918, 298}, {255, -14471, 0}, {255, -15292, 0}, {2, 14603, 355}, {2, 7322, 330}, {13, 21941, 315}, {2, 3076, 312}, {8, -7832, 307},
+    {12, 31434, 306}, {255, -16654, 0}, {255, -16309, 0}, {13, 14358, 309}, {255, -14207, 0}, {12, 31155, 311}, {255, -15390, 0}, {255, -15182, 0},
+    {13, 19641, 314}, {255, -17512, 0}, {255, -18225, 0}, {2, 5679, 329}, {2, 2763, 322}, {6, -17170, 319}, {255, -18467, 0}, {13, 22869, 321},
+    {255, -17267, 0}, {255, -17764, 0}, {13, 25910, 326}, {13, 23073, 325}, {255, -18841, 0}, {255, -19247, 0}, {12, 32273, 328}, {255, -19856, 0},
+    {255, -19393, 0}, {255, -21363, 0}, {13, 29876, 346}, {2, 9438, 339}, {6, 1438, 338}, {13, 26535, 337}, {11, 18212, 336}, {255, -20648, 0},
+    {255, -21179, 0}, {255, -22100, 0}, {255, -18982, 0}, {13, 23988, 341}, {255, -21436, 0}, {2, 10395, 343}, {255, -22288, 0}, {12, 31655, 345},
+    {255, -23518, 0}, {255, -23096, 0}, {2, 13191, 352}, {11, 31694, 351}, {1, -32500, 350}, {255, -24509, 0}, {255, -24886, 0}, {255, -23723, 0},
+    {11, 20251, 354}, {255, -25208, 0}, {255, -25975, 0}, {2, 23933, 383}, {2, 19266, 370}, {13, 32092, 361}, {2, 16090, 360}, {255, -25513, 0},
+    {255, -26461, 0}, {2, 17051, 365}, {1, 0, 364}, {255, -27495, 0}, {255, -27138, 0}, {9, 4752, 367}, {255, -28940, 0}, {12, 32093, 369},
+    {255, -27879, 0}, {255, -28300, 0}, {11, -1254, 372}, {255, -27981, 0}, {2, 21557, 378}, {3, 11227, 375}, {255, -28643, 0}, {6, 718, 377},
+    {255, -29987, 0}, {255, -29491, 0}, {4, -20432, 380}, {255, -29767, 0}, {9, 8852, 382}, {255, -30735, 0}, {255, -30405, 0}, {2, 27578, 397},
+    {2, 26470, 394}, {11, 80, 387}, {255, -30520, 0}, {3, -250, 391}, {2, 25836, 390}, {255, -31086, 0}, {255, -31292, 0}, {2, 25370, 393},
+    {255, -31394, 0}, {255, -31537, 0}, {7, 21984, 396}, {255, -31877, 0}, {255, -31731, 0}, {2, 29368, 407}, {5, -25238, 404}, {2, 29088, 403},
+    {2, 28388, 402}, {255, -31956, 0}, {255, -32053, 0}, {255, -32196, 0}, {2, 28569, 406}, {255, -32166, 0}, {255, -32290, 0}, {12, -4425, 415},
+    {5, -32478, 412}, {7, 32463, 411}, {255, -32461, 0}, {255, -32479, 0}, {11, -29331, 414}, {255, -32416, 0}, {255, -32468, 0}, {2, 32374, 419},
+    {2, 30523, 418}, {255, -32352, 0}, {255, -32437, 0}, {10, -17751, 421}, {255, -32499, 0}, {255, -32484, 0}, {2, 973, 520}, {13, -7527, 459},
+    {13, -19350, 438}, {13, -27369, 429}, {10, -31462, 428}, {255, 31465, 0}, {255, 24786, 0}, {13, -24824, 431}, {255, 21598, 0}, {2, -28392, 437},
+    {12, 30832, 434}, {255, 18997, 0}, {11, 5947, 436}, {255, 18058, 0}, {255, 17465, 0}, {255, 16018, 0}, {2, -21064, 450}, {13, -17582, 441},
+    {255, 13579, 0}, {2, -23447, 445}, {12, 31471, 444}, {255, 11562, 0}, {255, 10509, 0}, {13, -15497, 447}, {255, 10126, 0}, {4, 14615, 449},
+    {255, 8882, 0}, {255, 8158, 0}, {9, -18230, 454}, {10, -27229, 453}, {255, 7686, 0}, {255, 6038, 0}, {13, -9345, 458}, {2, -17447, 457},
+    {255, 5510, 0}, {255, 4782, 0}, {255, 3286, 0}, {13, 4099, 483}, {13, -1301, 472}, {7, -13503, 469}, {13, -3910, 466}, {8, -18090, 465},
+    {255, 3136, 0}, {255, 2153, 0}, {5, 11161, 468}, {255, 910, 0}, {255, 1799, 0}, {2, -11620, 471}, {255, 4, 0}, {255, -1611, 0},
+    {2, -12138, 476}, {6, -23777, 475}, {255, -1451, 0}, {255, -2834, 0}, {4, -2176, 478}, {255, -5796, 0}, {1, 32500, 482}, {13, -605, 481},
+    {255, -3444, 0}, {255, -3835, 0}, {255, -4410, 0}, {13, 10560, 505}, {2, -8020, 496}, {13, 7073, 491}, {2, -11714, 488}, {255, -4289, 0},
+    {4, 7652, 490}, {255, -6053, 0}, {255, -5561, 0}, {5, 5727, 495}, {10, -15320, 494}, {255, -7268, 0}, {255, -7571, 0}, {255, -6105, 0},
+    {5, -4628, 498}, {255, -10590, 0}, {2, -5783, 502}, {5, -348, 501}, {255, -7271, 0}, {255, -8013, 0}, {13, 6144, 504}, {255, -8297, 0},
+    {255, -8990, 0}, {13, 15330, 513}, {6, -7608, 512}, {5, 535, 511}, {13, 13537, 510}, {255, -11755, 0}, {255, -12269, 0}, {255, -10618, 0},
+    {255, -13279, 0}, {2, -1870, 515}, {255, -13099, 0}, {2, -992, 519}, {3, 27847, 518}, {255, -13957, 0}, {255, -14929, 0}, {255, -15590, 0},
+    {2, 14492, 570}, {2, 10349, 555}, {2, 3846, 538}, {13, 18213, 529}, {10, -24074, 526}, {255, -14293, 0}, {2, 2655, 528}, {255, -15323, 0},
+    {255, -15779, 0}, {13, 24258, 537}, {13, 21535, 534}, {13, 19993, 533}, {255, -16618, 0}, {255, -17260, 0}, {2, 2385, 536}, {255, -17486, 0},
+    {255, -17964, 0}, {255, -18670, 0}, {13, 24072, 546}, {13, 16807, 541}, {255, -17141, 0}, {2, 9396, 545}, {13, 22615, 544}, {255, -18467, 0},
+    {255, -19153, 0}, {255, -19984, 0}, {2, 7735, 552}, {5, -7683, 551}, {7, 2524, 550}, {255, -20965, 0}, {255, -20475, 0}, {255, -19692, 0},
+    {13, 26873, 554}, {255, -21501, 0}, {255, -22408, 0}, {13, 30592, 563}, {13, 23847, 558}, {255, -22537, 0}, {13, 27871, 560}, {255, -23147, 0},
+    {12, 31215, 562}, {255, -23730, 0}, {255, -23551, 0}, {2, 11543, 565}, {255, -24054, 0}, {11, 30438, 569}, {2, 13218, 568}, {255, -24981, 0},
+    {255, -25607, 0}, {255, -26191, 0}, {2, 23825, 596}, {2, 18703, 583}, {13, 32260, 576}, {9, 9242, 575}, {255, -25694, 0}, {255, -26550, 0},
+    {3, 23800, 582}, {1, 32500, 581}, {12, 31370, 580}, {255, -27092, 0}, {255, -27372, 0}, {255, -27808, 0}, {255, -28591, 0}, {2, 21605, 591},
+    {10, -31210, 586}, {255, -27634, 0}, {4, -19957, 588}, {255, -28684, 0}, {1, 0, 590}, {255, -29145, 0}, {255, -29526, 0}, {10, -20626, 593},
+    {255, -29722, 0}, {6, 6397, 595}, {255, -30624, 0}, {255, -30206, 0}, {2, 28130, 614}, {2, 25284, 601}, {10, -24156, 600}, {255, -30706, 0},
+    {255, -31336, 0}, {2, 26677, 609}, {7, 20973, 606}, {2, 26163, 605}, {255, -31588, 0}, {255, -31685, 0}, {11, 3559, 608}, {255, -31311, 0},
+    {255, -31434, 0}, {4, -21000, 613}, {2, 26936, 612}, {255, -31536, 0}, {255, -31819, 0}, {255, -31954, 0}, {2, 29595, 624}, {10, -27064, 619},
+    {2, 28709, 618}, {255, -31985, 0}, {255, -32084, 0}, {2, 28569, 621}, {255, -32173, 0}, {3, 6, 623}, {255, -32231, 0}, {255, -32297, 0},
+    {2, 32419, 632}, {2, 30568, 629}, {4, -23645, 628}, {255, -32335, 0}, {255, -32368, 0}, {9, 31093, 631}, {255, -32471, 0}, {255, -32423, 0},
+    {12, -8221, 636}, {5, -32475, 635}, {255, -32467, 0}, {255, -32434, 0}, {10, -17212, 638}, {255, -32500, 0}, {255, -32485, 0}, {2, 1172, 727},
+    {13, -7527, 670}, {7, -27595, 649}, {13, -30126, 644}, {255, 31035, 0}, {13, -25161, 648}, {5, 28488, 647}, {255, 23310, 0}, {255, 25027, 0},
+    {255, 19097, 0}, {2, -23447, 659}, {2, -25563, 656}, {13, -21092, 653}, {255, 16829, 0}, {1, 0, 655}, {255, 14529, 0}, {255, 15327, 0},
+    {13, -17582, 658}, {255, 12754, 0}, {255, 11046, 0}, {2, -20934, 663}, {7, -19241, 662}, {255, 7931, 0}, {255, 9198, 0}, {13, -12384, 665},
+    {255, 7830, 0}, {12, 31709, 669}, {1, 0, 668}, {255, 5570, 0}, {255, 4615, 0}, {255, 6120, 0}, {2, -8932, 698}, {2, -13261, 683},
+    {13, -1616, 682}, {2, -18410, 675}, {255, 3644, 0}, {13, -5673, 679}, {5, 8511, 678}, {255, 2241, 0}, {255, 3157, 0}, {2, -14299, 681},
+    {255, 1614, 0}, {255, 340, 0}, {255, -960, 0}, {13, 1496, 691}, {2, -10821, 688}, {3, 4832, 687}, {255, -1592, 0}, {255, -2551, 0},
+    {13, -438, 690}, {255, -3394, 0}, {255, -3771, 0}, {13, 6359, 697}, {2, -11200, 694}, {255, -4007, 0}, {2, -9709, 696}, {255, -4626, 0},
+    {255, -4925, 0}, {255, -5874, 0}, {2, -3660, 712}, {13, 12300, 709}, {13, 4450, 702}, {255, -5772, 0}, {13, 8486, 706}, {2, -5866, 705},
+    {255, -7544, 0}, {255, -8485, 0}, {9, -15343, 708}, {255, -8522, 0}, {255, -9705, 0}, {12, 30505, 711}, {255, -12517, 0}, {255, -10334, 0},
+    {13, 15330, 722}, {13, 12865, 719}, {11, 5772, 716}, {255, -11028, 0}, {3, 12686, 718}, {255, -12029, 0}, {255, -11473, 0}, {6, -10633, 721},
+    {255, -12555, 0}, {255, -13755, 0}, {2, -902, 726}, {10, -13192, 725}, {255, -13797, 0}, {255, -14792, 0}, {255, -15573, 0}, {2, 15861, 779},
+    {2, 6673, 750}, {13, 19992, 737}, {13, 18635, 736}, {2, 2655, 735}, {10, -24028, 734}, {255, -14293, 0}, {255, -15194, 0}, {255, -15764, 0},
+    {255, -16936, 0}, {2, 2872, 743}, {11, 31085, 742}, {11, 25601, 741}, {255, -16758, 0}, {255, -17420, 0}, {255, -18462, 0}, {10, -10008, 749},
+    {2, 6067, 748}, {13, 21951, 747}, {255, -18263, 0}, {255, -18691, 0}, {255, -19268, 0}, {255, -19788, 0}, {2, 10247, 764}, {13, 25541, 757},
+    {8, 14770, 756}, {1, -32500, 755}, {255, -20732, 0}, {255, -20465, 0}, {255, -19097, 0}, {13, 26873, 759}, {255, -21533, 0}, {12, 31554, 763},
+    {2, 7338, 762}, {255, -21957, 0}, {255, -22201, 0}, {255, -22631, 0}, {13, 28666, 770}, {13, 24067, 767}, {255, -22344, 0}, {12, 31714, 769},
+    {255, -23405, 0}, {255, -23120, 0}, {2, 12177, 774}, {12, 31600, 773}, {255, -24745, 0}, {255, -23723, 0}, {11, 31091, 778}, {12, 31411, 777},
+    {255, -25117, 0}, {255, -25756, 0}, {255, -27015, 0}, {2, 23933, 811}, {2, 19397, 792}, {10, -13090, 787}, {13, 32092, 784}, {255, -26698, 0},
+    {2, 16734, 786}, {255, -27210, 0}, {255, -27648, 0}, {2, 17632, 789}, {255, -27946, 0}, {11, 30238, 791}, {255, -28888, 0}, {255, -29174, 0},
+    {11, 11933, 800}, {7, 19748, 799}, {13, 31690, 796}, {255, -27911, 0}, {12, 31194, 798}, {255, -29157, 0}, {255, -28744, 0}, {255, -29903, 0},
+    {2, 21795, 808}, {11, 24055, 805}, {2, 20476, 804}, {255, -29449, 0}, {255, -29920, 0}, {2, 20123, 807}, {255, -29962, 0}, {255, -30122, 0},
+    {9, 10470, 810}, {255, -30709, 0}, {255, -30476, 0}, {2, 27096, 827}, {10, -18829, 820}, {12, 31390, 817}, {12, 31215, 816}, {255, -31159, 0},
+    {255, -30899, 0}, {9, 18802, 819}, {255, -31414, 0}, {255, -31284, 0}, {2, 26062, 824}, {2, 24840, 823}, {255, -31282, 0}, {255, -31586, 0},
+    {10, -13261, 826}, {255, -31828, 0}, {255, -31928, 0}, {2, 29416, 837}, {2, 28638, 832}, {1, 32500, 831}, {255, -31947, 0}, {255, -32113, 0},
+    {8, 29728, 836}, {7, 22038, 835}, {255, -32307, 0}, {255, -32234, 0}, {255, -32131, 0}, {2, 32419, 845}, {2, 30568, 842}, {2, 29813, 841},
+    {255, -32327, 0}, {255, -32371, 0}, {11, -32500, 844}, {255, -32422, 0}, {255, -32466, 0}, {12, -5384, 849}, {5, -32468, 848}, {255, -32467, 0},
+    {255, -32429, 0}, {2, 32460, 851}, {255, -32482, 0}, {255, -32497, 0}, {2, 2013, 936}, {13, -2259, 885}, {2, -23111, 866}, {13, -24427, 859},
+    {10, -31705, 858}, {255, 29669, 0}, {255, 23784, 0}, {2, -27551, 863}, {2, -29565, 862}, {255, 18827, 0}, {255, 16771, 0}, {13, -17915, 865},
+    {255, 14838, 0}, {255, 12558, 0}, {13, -7527, 874}, {2, -21275, 869}, {255, 9540, 0}, {13, -12384, 871}, {255, 7746, 0}, {1, 0, 873},
+    {255, 5614, 0}, {255, 4426, 0}, {2, -14433, 884}, {2, -17230, 879}, {11, 15361, 878}, {255, 3189, 0}, {255, 2237, 0}, {13, -6659, 881},
+    {255, 3010, 0}, {1, 32500, 883}, {255, 1755, 0}, {255, 1174, 0}, {255, 139, 0}, {2, -5818, 911}, {2, -8879, 902}, {13, 2587, 897},
+    {2, -12228, 890}, {255, -1208, 0}, {13, 196, 894}, {6, -14589, 893}, {255, -2632, 0}, {255, -3481, 0}, {2, -10007, 896}, {255, -3642, 0},
+    {255, -4008, 0}, {2, -9802, 901}, {10, -15963, 900}, {255, -4243, 0}, {255, -5461, 0}, {255, -6725, 0}, {8, -19443, 904}, {255, -9517, 0},
+    {13, 4530, 908}, {13, 896, 907}, {255, -5155, 0}, {255, -6101, 0}, {12, 31522, 910}, {255, -7739, 0}, {255, -6639, 0}, {13, 16913, 927},
+    {13, 12865, 920}, {13, 6265, 915}, {255, -8152, 0}, {2, -3632, 917}, {255, -10310, 0}, {11, 5772, 919}, {255, -11012, 0}, {255, -11836, 0},
+    {2, -1412, 924}, {12, 31442, 923}, {255, -12700, 0}, {255, -12068, 0}, {3, 7742, 926}, {255, -14048, 0}, {255, -13700, 0}, {2, -129, 933},
+    {2, -1683, 930}, {255, -13623, 0}, {7, -5540, 932}, {255, -15446, 0}, {255, -14706, 0}, {13, 18606, 935}, {255, -15425, 0}, {255, -16416, 0},
+    {2, 15861, 980}, {2, 10442, 963}, {13, 26087, 956}, {2, 6967, 953}, {13, 21535, 946}, {2, 4268, 945}, {7, 300, 944}, {255, -16885, 0},
+    {255, -15870, 0}, {255, -17703, 0}, {2, 2691, 950}, {6, -16355, 949}, {255, -18444, 0}, {255, -17784, 0}, {5, -8774, 952}, {255, -19325, 0},
+    {255, -18697, 0}, {11, -1959, 955}, {255, -19048, 0}, {255, -20387, 0}, {7, -1141, 958}, {255, -19774, 0}, {13, 29663, 962}, {6, -7114, 961},
+    {255, -20939, 0}, {255, -21619, 0}, {255, -22420, 0}, {13, 32052, 975}, {13, 28638, 968}, {8, 16242, 967}, {255, -23308, 0}, {255, -22239, 0},
+    {6, -1686, 972}, {8, 20, 971}, {255, -24051, 0}, {255, -23617, 0}, {6, -297, 974}, {255, -24690, 0}, {255, -25364, 0}, {2, 13442, 979},
+    {2, 12816, 978}, {255, -25077, 0}, {255, -25798, 0}, {255, -27019, 0}, {2, 23933, 1008}, {2, 19433, 995}, {11, 19068, 986}, {13, 31644, 985},
+    {255, -26719, 0}, {255, -27059, 0}, {2, 17752, 992}, {2, 16514, 989}, {255, -27403, 0}, {9, 4392, 991}, {255, -28515, 0}, {255, -28050, 0},
+    {12, 32143, 994}, {255, -29032, 0}, {255, -28657, 0}, {13, 31867, 997}, {255, -27921, 0}, {11, 11933, 1001}, {2, 21744, 1000}, {255, -28885, 0},
+    {255, -29684, 0}, {2, 21818, 1005}, {2, 20077, 1004}, {255, -29409, 0}, {255, -29984, 0}, {11, 21666, 1007}, {255, -30442, 0}, {255, -30662, 0},
+    {2, 26790, 1024}, {11, 80, 1011}, {255, -30560, 0}, {3, 5977, 1017}, {12, 31101, 1014}, {255, -31093, 0}, {5, -25996, 1016}, {255, -31549, 0},
+    {255, -31333, 0}, {2, 25715, 1021}, {7, 16517, 1020}, {255, -31431, 0}, {255, -31568, 0}, {12, 30941, 1023}, {255, -31674, 0}, {255, -31895, 0},
+    {2, 29300, 1036}, {2, 28008, 1029}, {6, 9120, 1028}, {255, -32043, 0}, {255, -31910, 0}, {10, -27064, 1033}, {10, -32501, 1032}, {255, -32053, 0},
+    {255, -32125, 0}, {2, 28569, 1035}, {255, -32212, 0}, {255, -32284, 0}, {12, -4467, 1044}, {7, 32424, 1041}, {9, 31240, 1040}, {255, -32467, 0},
+    {255, -32414, 0}, {7, 32461, 1043}, {255, -32460, 0}, {255, -32478, 0}, {2, 32364, 1048}, {2, 30587, 1047}, {255, -32363, 0}, {255, -32439, 0},
+    {2, 32460, 1050}, {255, -32479, 0}, {255, -32498, 0}, {2, 1824, 1145}, {13, -6777, 1080}, {13, -20919, 1067}, {13, -27288, 1060}, {9, -32501, 1057},
+    {255, 31519, 0}, {13, -29054, 1059}, {255, 26155, 0}, {255, 24653, 0}, {13, -24427, 1062}, {255, 21883, 0}, {5, 23939, 1066}, {2, -28392, 1065},
+    {255, 17897, 0}, {255, 16829, 0}, {255, 19423, 0}, {2, -22715, 1075}, {2, -26950, 1070}, {255, 15080, 0}, {2, -23950, 1074}, {8, -19757, 1073},
+    {255, 12180, 0}, {255, 13136, 0}, {255, 10990, 0}, {2, -20775, 1077}, {255, 8212, 0}, {13, -9720, 1079}, {255, 5990, 0}, {255, 4694, 0},
+    {2, -8149, 1110}, {13, -1320, 1093}, {2, -14433, 1090}, {2, -18403, 1085}, {255, 3434, 0}, {13, -5673, 1087}, {255, 2054, 0}, {2, -16770, 1089},
+    {255, 1760, 0}, {255, 1352, 0}, {5, 2299, 1092}, {255, -1398, 0}, {255, -21, 0}, {13, 4099, 1103}, {2, -12267, 1096}, {255, -1698, 0},
+    {13, 74, 1100}, {9, -13225, 1099}, {255, -2715, 0}, {255, -3407, 0}, {1, 0, 1102}, {255, -3659, 0}, {255, -4476, 0}, {2, -9325, 1109},
+    {1, 32500, 1108}, {2, -11306, 1107}, {255, -4916, 0}, {255, -5495, 0}, {255, -6153, 0}, {255, -7041, 0}, {13, 10377, 1124}, {2, -4798, 1121},
+    {13, 4311, 1114}, {255, -6146, 0}, {2, -5866, 1118}, {13, 8107, 1117}, {255, -7474, 0}, {255, -7818, 0}, {11, 6993, 1120}, {255, -8021, 0},
+    {255, -8675, 0}, {5, -4628, 1123}, {255, -10898, 0}, {255, -9159, 0}, {13, 16794, 1136}, {2, -2934, 1131}, {9, -14692, 1128}, {255, -9867, 0},
+    {11, 18420, 1130}, {255, -11543, 0}, {255, -12026, 0}, {12, 31249, 1135}, {12, 30418, 1134}, {255, -13930, 0}, {255, -13478, 0}, {255, -12379, 0},
+    {2, -1119, 1140}, {2, -1666, 1139}, {255, -13942, 0}, {255, -14902, 0}, {11, 21785, 1144}, {2, 1120, 1143}, {255, -15194, 0}, {255, -15494, 0},
+    {255, -15975, 0}, {2, 14548, 1199}, {2, 9406, 1176}, {13, 23674, 1161}, {13, 15096, 1150}, {255, -15589, 0}, {2, 3524, 1154}, {4, 1335, 1153},
+    {255, -16644, 0}, {255, -17744, 0}, {12, 31290, 1158}, {10, -21597, 1157}, {255, -17696, 0}, {255, -18559, 0}, {1, 16250, 1160}, {255, -18800, 0},
+    {255, -19266, 0}, {2, 5981, 1169}, {6, -17372, 1164}, {255, -18479, 0}, {13, 25910, 1166}, {255, -19154, 0}, {13, 26181, 1168}, {255, -19596, 0},
+    {255, -19931, 0}, {11, 28816, 1173}, {2, 7831, 1172}, {255, -20580, 0}, {255, -21488, 0}, {3, 32499, 1175}, {255, -22580, 0}, {255, -21913, 0},
+    {13, 30246, 1188}, {13, 27871, 1183}, {2, 13040, 1182}, {13, 27279, 1181}, {255, -22135, 0}, {255, -22664, 0}, {255, -23082, 0}, {12, 31215, 1185},
+    {255, -23730, 0}, {13, 29175, 1187}, {255, -23419, 0}, {255, -23594, 0}, {11, 31199, 1198}, {2, 13049, 1195}, {2, 11543, 1192}, {255, -24263, 0},
+    {10, -14348, 1194}, {255, -24764, 0}, {255, -24980, 0}, {7, 7618, 1197}, {255, -25862, 0}, {255, -25417, 0}, {255, -26465, 0}, {2, 23933, 1225},
+    {2, 19412, 1210}, {10, -8881, 1209}, {13, 31193, 1204}, {255, -26368, 0}, {2, 16514, 1206}, {255, -27188, 0}, {12, 32143, 1208}, {255, -27778, 0},
+    {255, -28162, 0}, {255, -28833, 0}, {3, -8919, 1214}, {13, 31690, 1213}, {255, -27852, 0}, {255, -28825, 0}, {4, -14249, 1222}, {2, 21533, 1219},
+    {6, 7022, 1218}, {255, -29577, 0}, {255, -28925, 0}, {2, 22305, 1221}, {255, -29817, 0}, {255, -30192, 0}, {5, -19140, 1224}, {255, -30738, 0},
+    {255, -30127, 0}, {2, 27578, 1241}, {2, 26702, 1238}, {11, 2981, 1231}, {5, -25380, 1230}, {255, -31212, 0}, {255, -30834, 0}, {3, 10729, 1235},
+    {2, 25202, 1234}, {255, -31187, 0}, {255, -31429, 0}, {5, -21680, 1237}, {255, -31578, 0}, {255, -31402, 0}, {11, 21876, 1240}, {255, -31870, 0},
+    {255, -31941, 0}, {2, 29508, 1251}, {8, 30996, 1250}, {6, 7910, 1247}, {5, -23701, 1246}, {255, -32301, 0}, {255, -32250, 0}, {2, 28452, 1249},
+    {255, -32122, 0}, {255, -32209, 0}, {255, -32039, 0}, {12, -4041, 1259}, {7, 32425, 1256}, {11, -29871, 1255}, {255, -32415, 0}, {255, -32467, 0},
+    {7, 32461, 1258}, {255, -32461, 0}, {255, -32477, 0}, {2, 32412, 1263}, {2, 30568, 1262}, {255, -32356, 0}, {255, -32447, 0}, {10, -20062, 1265},
+    {255, -32500, 0}, {255, -32487, 0}, {2, 1973, 1360}, {13, -4467, 1299}, {2, -24991, 1280}, {2, -31944, 1273}, {6, -31001, 1272}, {255, 26660, 0},
+    {255, 22329, 0}, {2, -27764, 1277}, {5, 21301, 1276}, {255, 17254, 0}, {255, 18749, 0}, {9, -27800, 1279}, {255, 12894, 0}, {255, 14490, 0},
+    {2, -20170, 1288}, {2, -23447, 1283}, {255, 11722, 0}, {13, -10657, 1287}, {2, -21176, 1286}, {255, 8832, 0}, {255, 8227, 0}, {255, 6767, 0},
+    {13, -8188, 1294}, {13, -9720, 1293}, {6, -16484, 1292}, {255, 5706, 0}, {255, 5281, 0}, {255, 4378, 0}, {10, -27473, 1296}, {255, 1664, 0},
+    {12, 31534, 1298}, {255, 3063, 0}, {255, 3504, 0}, {13, 8299, 1333}, {13, 2242, 1316}, {2, -13254, 1305}, {11, 14639, 1304}, {255, 511, 0},
+    {255, -1297, 0}, {2, -10328, 1311}, {8, -9056, 1310}, {1, -32500, 1309}, {255, -2419, 0}, {255, -3326, 0}, {255, -1685, 0}, {12, 31692, 1315},
+    {1, 0, 1314}, {255, -5241, 0}, {255, -4485, 0}, {255, -3600, 0}, {2, -9827, 1322}, {13, 5299, 1321}, {12, 31256, 1320}, {255, -4691, 0},
+    {255, -4213, 0}, {255, -5434, 0}, {2, -5871, 1330}, {12, 31274, 1327}, {7, -8705, 1326}, {255, -7106, 0}, {255, -7753, 0}, {11, 14562, 1329},
+    {255, -6139, 0}, {255, -6909, 0}, {9, -7341, 1332}, {255, -8505, 0}, {255, -9497, 0}, {13, 13021, 1343}, {2, -4158, 1340}, {2, -7070, 1337},
+    {255, -8385, 0}, {12, 30950, 1339}, {255, -10040, 0}, {255, -9247, 0}, {1, -32500, 1342}, {255, -12039, 0}, {255, -11666, 0}, {2, -2546, 1349},
+    {13, 15192, 1348}, {9, -13239, 1347}, {255, -11781, 0}, {255, -12239, 0}, {255, -12732, 0}, {13, 16113, 1353}, {9, -4769, 1352}, {255, -13652, 0},
+    {255, -14073, 0}, {2, -129, 1357}, {2, -1666, 1356}, {255, -14408, 0}, {255, -14739, 0}, {6, -12499, 1359}, {255, -16195, 0}, {255, -15352, 0},
+    {2, 16227, 1412}, {13, 27389, 1393}, {2, 6066, 1378}, {13, 18020, 1365}, {255, -15395, 0}, {13, 23736, 1373}, {4, -881, 1370}, {13, 22431, 1369},
+    {255, -18128, 0}, {255, -18821, 0}, {7, -1936, 1372}, {255, -17675, 0}, {255, -16732, 0}, {2, 3942, 1377}, {5, -4595, 1376}, {255, -19050, 0},
+    {255, -18453, 0}, {255, -19772, 0}, {13, 23088, 1384}, {2, 9778, 1383}, {13, 17738, 1382}, {255, -18265, 0}, {255, -19266, 0}, {255, -20939, 0},
+    {2, 9438, 1390}, {2, 8094, 1389}, {10, -14788, 1388}, {255, -20593, 0}, {255, -20972, 0}, {255, -21361, 0}, {2, 13037, 1392}, {255, -22254, 0},
+    {255, -23306, 0}, {2, 12062, 1401}, {2, 10677, 1398}, {6, -12479, 1397}, {255, -21623, 0}, {255, -22793, 0}, {5, -12125, 1400}, {255, -23675, 0},
+    {255, -24594, 0}, {13, 31550, 1407}, {2, 13904, 1406}, {2, 12846, 1405}, {255, -24236, 0}, {255, -24952, 0}, {255, -25527, 0}, {2, 13442, 1409},
+    {255, -25604, 0}, {10, -10017, 1411}, {255, -26944, 0}, {255, -27402, 0}, {2, 23956, 1438}, {2, 18373, 1419}, {11, 22422, 1418}, {9, 9417, 1417},
+    {255, -27118, 0}, {255, -26658, 0}, {255, -28230, 0}, {2, 21384, 1431}, {11, 11006, 1426}, {2, 20879, 1425}, {13, 31084, 1424}, {255, -27382, 0},
+    {255, -28137, 0}, {255, -28737, 0}, {12, 32470, 1430}, {10, -7113, 1429}, {255, -29318, 0}, {255, -30114, 0}, {255, -28621, 0}, {3, -64, 1433},
+    {255, -29329, 0}, {4, -14896, 1437}, {2, 22088, 1436}, {255, -29943, 0}, {255, -30365, 0}, {255, -30780, 0}, {2, 27493, 1450}, {3, -945, 1443},
+    {2, 25051, 1442}, {255, -30765, 0}, {255, -31168, 0}, {2, 26307, 1447}, {2, 25197, 1446}, {255, -31409, 0}, {255, -31521, 0}, {12, 31786, 1449},
+    {255, -31943, 0}, {255, -31850, 0}, {2, 29595, 1462}, {2, 28638, 1457}, {5, -25238, 1456}, {7, 24275, 1455}, {255, -32040, 0}, {255, -31944, 0},
+    {255, -32189, 0}, {5, -26838, 1459}, {255, -32198, 0}, {2, 29101, 1461}, {255, -32295, 0}, {255, -32328, 0}, {2, 32419, 1470}, {2, 30568, 1467},
+    {6, 17331, 1466}, {255, -32381, 0}, {255, -32339, 0}, {9, 31944, 1469}, {255, -32469, 0}, {255, -32422, 0}, {12, -14323, 1474}, {7, 32424, 1473},
+    {255, -32427, 0}, {255, -32463, 0}, {12, 1220, 1476}, {255, -32472, 0}, {255, -32496, 0}, {2, 2192, 1567}, {13, -7527, 1512}, {2, -27145, 1493},
+    {13, -28551, 1484}, {8, -31488, 1483}, {255, 32350, 0}, {255, 27507, 0}, {13, -24329, 1488}, {9, -30430, 1487}, {255, 23524, 0}, {255, 22255, 0},
+    {9, -29572, 1490}, {255, 18632, 0}, {13, -22547, 1492}, {255, 17921, 0}, {255, 16797, 0}, {2, -21163, 1505}, {2, -22761, 1504}, {13, -17584, 1499},
+    {10, -31699, 1498}, {255, 14072, 0}, {255, 12656, 0}, {10, -23566, 1503}, {2, -24009, 1502}, {255, 11826, 0}, {255, 11080, 0}, {255, 10649, 0},
+    {255, 9231, 0}, {12, 31364, 1509}, {1, 0, 1508}, {255, 5753, 0}, {255, 4416, 0}, {13, -12119, 1511}, {255, 7616, 0}, {255, 6335, 0},
+    {13, 5585, 1536}, {13, -1378, 1523}, {6, -17142, 1522}, {2, -18414, 1517}, {255, 3597, 0}, {13, -2181, 1521}, {2, -15288, 1520}, {255, 2301, 0},
+    {255, 1552, 0}, {255, 677, 0}, {255, -616, 0}, {2, -7569, 1533}, {2, -12138, 1526}, {255, -1749, 0}, {13, 2587, 1530}, {2, -11284, 1529},
+    {255, -3107, 0}, {255, -3858, 0}, {3, 20484, 1532}, {255, -5483, 0}, {255, -4321, 0}, {2, -6079, 1535}, {255, -6678, 0}, {255, -7206, 0},
+    {2, -5171, 1548}, {2, -6804, 1545}, {5, 5809, 1544}, {13, 9330, 1543}, {2, -8020, 1542}, {255, -7220, 0}, {255, -7650, 0}, {255, -8457, 0},
+    {255, -5649, 0}, {10, -16848, 1547}, {255, -8625, 0}, {255, -10245, 0}, {13, 12865, 1556}, {13, 10164, 1553}, {9, -5481, 1552}, {255, -9931, 0},
+    {255, -11128, 0}, {6, -12176, 1555}, {255, -11182, 0}, {255, -11986, 0}, {13, 19149, 1564}, {2, -2405, 1561}, {13, 15192, 1560}, {255, -12058, 0},
+    {255, -12878, 0}, {13, 16614, 1563}, {255, -13798, 0}, {255, -14554, 0}, {5, -3233, 1566}, {255, -16546, 0}, {255, -15659, 0}, {2, 15971, 1613},
+    {2, 10032, 1594}, {13, 23519, 1579}, {13, 16895, 1572}, {255, -16667, 0}, {7, -913, 1574}, {255, -17154, 0}, {2, 9396, 1578}, {12, 31290, 1577},
+    {255, -18406, 0}, {255, -19155, 0}, {255, -20012, 0}, {5, -7527, 1589}, {10, -8296, 1586}, {2, 7735, 1585}, {12, 30992, 1584}, {255, -21034, 0},
+    {255, -20522, 0}, {255, -21222, 0}, {7, 1406, 1588}, {255, -22042, 0}, {255, -22847, 0}, {13, 26181, 1593}, {2, 4039, 1592}, {255, -19015, 0},
+    {255, -19210, 0}, {255, -19797, 0}, {13, 31992, 1604}, {13, 28405, 1601}, {12, 31616, 1600}, {12, 31053, 1599}, {255, -22982, 0}, {255, -23429, 0},
+    {255, -22561, 0}, {8, 2621, 1603}, {255, -23788, 0}, {255, -25217, 0}, {2, 13442, 1610}, {5, -12804, 1609}, {6, -3757, 1608}, {255, -25995, 0},
+    {255, -25342, 0}, {255, -24424, 0}, {2, 14790, 1612}, {255, -26381, 0}, {255, -27301, 0}, {2, 24071, 1641}, {2, 19452, 1626}, {11, 18472, 1619},
+    {13, 32077, 1618}, {255, -26658, 0}, {255, -27663, 0}, {2, 17734, 1623}, {2, 16950, 1622}, {255, -27634, 0}, {255, -28209, 0}, {7, 13150, 1625},
+    {255, -29026, 0}, {255, -28631, 0}, {11, 11933, 1632}, {12, 30891, 1629}, {255, -29337, 0}, {2, 20861, 1631}, {255, -28103, 0}, {255, -28765, 0},
+    {2, 20077, 1634}, {255, -29302, 0}, {2, 21795, 1638}, {11, 24055, 1637}, {255, -29851, 0}, {255, -30092, 0}, {3, 16531, 1640}, {255, -30414, 0},
+    {255, -30701, 0}, {2, 28130, 1655}, {2, 26677, 1650}, {3, 1478, 1647}, {2, 26091, 1646}, {255, -31141, 0}, {255, -31424, 0}, {2, 25370, 1649},
+    {255, -31431, 0}, {255, -31610, 0}, {5, -26725, 1652}, {255, -31614, 0}, {9, 12252, 1654}, {255, -32052, 0}, {255, -31935, 0}, {2, 30221, 1667},
+    {10, -24529, 1660}, {2, 28995, 1659}, {255, -32036, 0}, {255, -32209, 0}, {2, 29232, 1664}, {2, 28579, 1663}, {255, -32211, 0}, {255, -32278, 0},
+    {11, 18872, 1666}, {255, -32324, 0}, {255, -32364, 0}, {12, -4467, 1675}, {7, 32421, 1672}, {11, -29356, 1671}, {255, -32415, 0}, {255, -32468, 0},
+    {7, 32461, 1674}, {255, -32459, 0}, {255, -32480, 0}, {2, 32418, 1679}, {13, 32178, 1678}, {255, -32404, 0}, {255, -32457, 0}, {12, 5173, 1681},
+    {255, -32482, 0}, {255, -32496, 0}, {2, 644, 1770}, {13, -9259, 1711}, {2, -27764, 1698}, {13, -29223, 1689}, {5, 32499, 1688}, {255, 27494, 0},
+    {255, 32184, 0}, {13, -24824, 1695}, {13, -27369, 1692}, {255, 24341, 0}, {3, 4251, 1694}, {255, 21420, 0}, {255, 22549, 0}, {13, -21739, 1697},
+    {255, 19245, 0}, {255, 16955, 0}, {2, -23111, 1704}, {2, -24513, 1703}, {12, 31172, 1702}, {255, 12025, 0}, {255, 13627, 0}, {255, 11027, 0},
+    {9, -18230, 1710}, {2, -21064, 1707}, {255, 8874, 0}, {11, 4612, 1709}, {255, 7701, 0}, {255, 6526, 0}, {255, 5151, 0}, {13, 4235, 1741},
+    {13, -1378, 1728}, {2, -14357, 1725}, {2, -18149, 1718}, {10, -20592, 1717}, {255, 4647, 0}, {255, 3224, 0}, {13, -5801, 1722}, {4, 8431, 1721},
+    {255, 2537, 0}, {255, 3597, 0}, {13, -2159, 1724}, {255, 1692, 0}, {255, 932, 0}, {7, -10094, 1727}, {255, 182, 0}, {255, -1352, 0},
+    {2, -12383, 1730}, {255, -1674, 0}, {2, -9314, 1738}, {13, 1385, 1735}, {2, -10857, 1734}, {255, -2781, 0}, {255, -3418, 0}, {2, -11200, 1737},
+    {255, -3725, 0}, {255, -4407, 0}, {2, -7991, 1740}, {255, -4583, 0}, {255, -6148, 0}, {13, 10434, 1757}, {2, -5969, 1752}, {2, -9285, 1747},
+    {2, -9825, 1746}, {255, -5542, 0}, {255, -6116, 0}, {13, 6428, 1749}, {255, -6684, 0}, {3, 25382, 1751}, {255, -7535, 0}, {255, -8053, 0},
+    {9, -5794, 1756}, {13, 6172, 1755}, {255, -8234, 0}, {255, -8713, 0}, {255, -11033, 0}, {13, 17000, 1767}, {2, -5254, 1762}, {13, 12300, 1761},
+    {255, -9485, 0}, {255, -10570, 0}, {5, -5541, 1764}, {255, -13336, 0}, {13, 14734, 1766}, {255, -11765, 0}, {255, -12735, 0}, {2, -1870, 1769},
+    {255, -13356, 0}, {255, -14514, 0}, {2, 15826, 1828}, {2, 10134, 1805}, {13, 26087, 1796}, {2, 4091, 1787}, {13, 21509, 1780}, {13, 16782, 1777},
+    {255, -14973, 0}, {13, 18265, 1779}, {255, -15775, 0}, {255, -16510, 0}, {8, -15380, 1784}, {6, -17461, 1783}, {255, -18436, 0}, {255, -18904, 0},
+    {2, 3271, 1786}, {255, -17719, 0}, {255, -18322, 0}, {13, 23886, 1793}, {13, 16450, 1790}, {255, -17300, 0}, {2, 9396, 1792}, {255, -18868, 0},
+    {255, -19649, 0}, {3, 19426, 1795}, {255, -20587, 0}, {255, -19721, 0}, {13, 28380, 1802}, {9, -6011, 1799}, {255, -19931, 0}, {4, -6073, 1801},
+    {255, -21686, 0}, {255, -20995, 0}, {5, -9428, 1804}, {255, -22786, 0}, {255, -22283, 0}, {13, 29792, 1813}, {13, 24067, 1808}, {255, -22108, 0},
+    {13, 27871, 1812}, {3, 4300, 1811}, {255, -23132, 0}, {255, -22816, 0}, {255, -23506, 0}, {2, 12755, 1819}, {12, 30875, 1816}, {255, -25090, 0},
+    {12, 32007, 1818}, {255, -24558, 0}, {255, -24175, 0}, {11, 28517, 1825}, {9, 4836, 1824}, {2, 13191, 1823}, {255, -24866, 0}, {255, -25338, 0},
+    {255, -25983, 0}, {6, -5020, 1827}, {255, -26380, 0}, {255, -27068, 0}, {2, 23956, 1858}, {2, 19433, 1843}, {3, 23430, 1840}, {13, 32069, 1833},
+    {255, -26658, 0}, {12, 32182, 1837}, {5, -18054, 1836}, {255, -27773, 0}, {255, -27426, 0}, {2, 17657, 1839}, {255, -28093, 0}, {255, -28620, 0},
+    {12, 31379, 1842}, {255, -28859, 0}, {255, -29228, 0}, {2, 21615, 1851}, {10, -14032, 1850}, {9, 15260, 1849}, {3, -452, 1848}, {255, -28740, 0},
+    {255, -29251, 0}, {255, -27962, 0}, {255, -30086, 0}, {10, -23496, 1853}, {255, -29868, 0}, {10, -11885, 1857}, {9, 12142, 1856}, {255, -30297, 0},
+    {255, -30486, 0}, {255, -30734, 0}, {2, 27592, 1876}, {11, 3218, 1863}, {2, 25051, 1862}, {255, -30580, 0}, {255, -31114, 0}, {2, 26677, 1871},
+    {2, 25284, 1868}, {5, -22713, 1867}, {255, -31153, 0}, {255, -31490, 0}, {9, 15718, 1870}, {255, -31661, 0}, {255, -31518, 0}, {5, -24962, 1873},
+    {255, -31799, 0}, {12, 31326, 1875}, {255, -31951, 0}, {255, -31919, 0}, {2, 29595, 1886}, {11, 6917, 1881}, {2, 29088, 1880}, {255, -32017, 0},
+    {255, -32179, 0}, {2, 28670, 1883}, {255, -32157, 0}, {2, 29216, 1885}, {255, -32281, 0}, {255, -32320, 0}, {12, -5147, 1894}, {7, 32425, 1891},
+    {9, 31282, 1890}, {255, -32469, 0}, {255, -32414, 0}, {7, 32461, 1893}, {255, -32461, 0}, {255, -32481, 0}, {2, 32402, 1898}, {2, 30568, 1897},
+    {255, -32371, 0}, {255, -32449, 0}, {12, 3388, 1900}, {255, -32478, 0}, {255, -32496, 0}, {2, 2013, 2005}, {2, -17230, 1936}, {2, -27637, 1913},
+    {7, -29822, 1910}, {9, -32501, 1907}, {255, 30105, 0}, {11, 544, 1909}, {255, 25802, 0}, {255, 23516, 0}, {2, -29565, 1912}, {255, 18497, 0},
+    {255, 16725, 0}, {2, -21064, 1925}, {13, -17582, 1918}, {7, -22106, 1917}, {255, 14870, 0}, {255, 12672, 0}, {2, -23111, 1922}, {5, 19711, 1921},
+    {255, 10795, 0}, {255, 12021, 0}, {6, -20857, 1924}, {255, 8306, 0}, {255, 10151, 0}, {13, -9259, 1931}, {2, -20170, 1930}, {10, -27229, 1929},
+    {255, 7724, 0}, {255, 6376, 0}, {255, 5636, 0}, {10, -20102, 1935}, {13, -7281, 1934}, {255, 4372, 0}, {255, 3475, 0}, {255, 2511, 0},
+    {13, 8134, 1976}, {13, 139, 1951}, {13, -1378, 1946}, {2, -14433, 1945}, {12, 30767, 1942}, {255, 2224, 0}, {1, 0, 1944}, {255, 1557, 0},
+    {255, 873, 0}, {255, -92, 0}, {4, 6693, 1950}, {5, 560, 1949}, {255, -4057, 0}, {255, -3217, 0}, {255, -1650, 0}, {2, -9187, 1965},
+    {13, 4112, 1960}, {2, -10508, 1957}, {1, 16250, 1956}, {255, -3621, 0}, {255, -2771, 0}, {1, 32500, 1959}, {255, -4436, 0}, {255, -4253, 0},
+    {2, -11714, 1962}, {255, -4306, 0}, {13, 7748, 1964}, {255, -5550, 0}, {255, -6559, 0}, {2, -5812, 1971}, {13, 3721, 1968}, {255, -6012, 0},
+    {5, 1400, 1970}, {255, -7353, 0}, {255, -6460, 0}, {12, 31068, 1973}, {255, -9683, 0}, {12, 31431, 1975}, {255, -8247, 0}, {255, -8625, 0},
+    {13, 15330, 1994}, {2, -3660, 1985}, {2, -7138, 1980}, {255, -8392, 0}, {13, 14472, 1984}, {13, 12275, 1983}, {255, -9904, 0}, {255, -10421, 0},
+    {255, -11618, 0}, {2, -260, 1993}, {11, 15504, 1990}, {2, -1598, 1989}, {255, -11368, 0}, {255, -12009, 0}, {12, 31737, 1992}, {255, -12539, 0},
+    {255, -12122, 0}, {255, -13896, 0}, {2, -902, 2000}, {2, -2610, 1997}, {255, -12999, 0}, {10, -13192, 1999}, {255, -13802, 0}, {255, -14565, 0},
+    {2, 1325, 2004}, {10, -11843, 2003}, {255, -15412, 0}, {255, -15878, 0}, {255, -16437, 0}, {2, 16271, 2055}, {2, 10349, 2030}, {13, 26025, 2021},
+    {13, 14146, 2010}, {255, -14928, 0}, {2, 7536, 2018}, {13, 21951, 2015}, {2, 3481, 2014}, {255, -16921, 0}, {255, -18070, 0}, {2, 5323, 2017},
+    {255, -18613, 0}, {255, -19501, 0}, {13, 18931, 2020}, {255, -18968, 0}, {255, -20525, 0}, {2, 6344, 2023}, {255, -20487, 0}, {13, 26945, 2025},
+    {255, -21444, 0}, {12, 31554, 2029}, {8, -11317, 2028}, {255, -22043, 0}, {255, -22261, 0}, {255, -22631, 0}, {13, 28666, 2036}, {1, 32500, 2035},
+    {12, 31949, 2034}, {255, -23396, 0}, {255, -23151, 0}, {255, -22737, 0}, {2, 13049, 2044}, {2, 12035, 2041}, {10, -11210, 2040}, {255, -23710, 0},
+    {255, -24507, 0}, {7, 7075, 2043}, {255, -25659, 0}, {255, -24864, 0}, {12, 31646, 2050}, {1, -32500, 2047}, {255, -25949, 0}, {12, 31000, 2049},
+    {255, -25239, 0}, {255, -25533, 0}, {2, 14175, 2052}, {255, -26145, 0}, {10, -10017, 2054}, {255, -26880, 0}, {255, -27479, 0}, {2, 23933, 2085},
+    {2, 19433, 2068}, {3, 20749, 2065}, {12, 32143, 2064}, {13, 32077, 2061}, {255, -26676, 0}, {2, 17019, 2063}, {255, -27187, 0}, {255, -27662, 0},
+    {255, -28258, 0}, {2, 17892, 2067}, {255, -28976, 0}, {255, -28784, 0}, {2, 21582, 2078}, {11, 13311, 2073}, {3, -10012, 2072}, {255, -27920, 0},
+    {255, -28713, 0}, {11, 23514, 2077}, {5, -20202, 2076}, {255, -29642, 0}, {255, -29255, 0}, {255, -29964, 0}, {4, -20432, 2080}, {255, -29699, 0},
+    {2, 21795, 2082}, {255, -30047, 0}, {3, 12120, 2084}, {255, -30486, 0}, {255, -30752, 0}, {2, 28130, 2103}, {2, 26396, 2096}, {3, 377, 2091},
+    {4, -23797, 2090}, {255, -31330, 0}, {255, -31068, 0}, {10, -17572, 2093}, {255, -31378, 0}, {7, 16502, 2095}, {255, -31402, 0}, {255, -31583, 0},
+    {1, -32500, 2098}, {255, -31574, 0}, {3, 6413, 2100}, {255, -31848, 0}, {2, 27107, 2102}, {255, -31939, 0}, {255, -31983, 0}, {2, 29508, 2113},
+    {3, -8401, 2108}, {2, 29128, 2107}, {255, -32018, 0}, {255, -32166, 0}, {2, 28569, 2110}, {255, -32165, 0}, {11, 24100, 2112}, {255, -32237, 0},
+    {255, -32293, 0}, {12, -4447, 2121}, {7, 32421, 2118}, {11, -29674, 2117}, {255, -32414, 0}, {255, -32469, 0}, {5, -32499, 2120}, {255, -32479, 0},
+    {255, -32462, 0}, {2, 32411, 2125}, {2, 30523, 2124}, {255, -32371, 0}, {255, -32449, 0}, {10, -14069, 2127}, {255, -32499, 0}, {255, -32486, 0}
+};
+
+// ETD forest: 5 trees, 1409 nodes, 7055 bytes
+#define ETD_N_TREES 5
+#define ETD_VALUE_OFFSET 16.30959701538086f
+#define ETD_VALUE_STEP 0.00013252247299533337f
+
+const uint16_t ETD_ROOTS[ETD_N_TREES] PROGMEM = {0, 277, 574, 863, 1152};
+
+const ForestNode ETD_NODES[1409] PROGMEM = {
+    {1, 0, 142}, {13, 12962, 41}, {9, -22465, 10}, {7, -32117, 5}, {255, 18978, 0}, {7, -26832, 7}, {255, 6991, 0}, {6, -25065, 9},
+    {255, -794, 0}, {255, 6326, 0}, {1, -32500, 26}, {2, -12877, 17}, {13, -7820, 16}, {13, -11971, 15}, {255, -8052, 0}, {255, -8727, 0},
+    {255, -11279, 0}, {13, 5312, 21}, {13, 2022, 20}, {255, -14133, 0}, {255, -16153, 0}, {9, -15544, 23}, {255, -17138, 0}, {5, -3909, 25},
+    {255, -19645, 0}, {255, -18515, 0}, {13, 726, 34}, {5, 7027, 33}, {13, -3118, 30}, {255, -2991, 0}, {13, -987, 32}, {255, -4918, 0},
+    {255, -5887, 0}, {255, 443, 0}, {2, -3653, 40}, {13, 8204, 39}, {2, -5514, 38}, {255, -7980, 0}, {255, -9411, 0}, {255, -10022, 0},
+    {255, -11729, 0}, {1, -32500, 101}, {2, 14374, 66}, {13, 20023, 49}, {2, 2290, 48}, {2, -2520, 47}, {255, -20471, 0}, {255, -21395, 0},
+    {255, -23081, 0}, {2, 5742, 53}, {4, -140, 52}, {255, -24815, 0}, {255, -24097, 0}, {13, 30218, 63}, {2, 11502, 60}, {10, -17518, 57},
+    {255, -25445, 0}, {12, 30873, 59}, {255, -26906, 0}, {255, -26199, 0}, {3, -5529, 62}, {255, -26282, 0}, {255, -27423, 0}, {4, -8467, 65},
+    {255, -28229, 0}, {255, -27664, 0}, {2, 23933, 74}, {2, 20686, 71}, {8, 8167, 70}, {255, -30474, 0}, {255, -29792, 0}, {11, 11933, 73},
+    {255, -30593, 0}, {255, -31403, 0}, {2, 28195, 76}, {255, -31987, 0}, {2, 32402, 86}, {2, 30244, 79}, {255, -32364, 0}, {5, -32474, 83},
+    {7, 32464, 82}, {255, -32469, 0}, {255, -32481, 0}, {4, -26631, 85}, {255, -32441, 0}, {255, -32483, 0}, {12, -1515, 94}, {4, -32243, 91},
+    {3, -11568, 90}, {255, -32438, 0}, {255, -32449, 0}, {12, -14335, 93}, {255, -32462, 0}, {255, -32483, 0}, {2, 32436, 98}, {9, 32499, 97},
+    {255, -32448, 0}, {255, -32487, 0}, {10, -17705, 100}, {255, -32495, 0}, {255, -32487, 0}, {2, 16065, 117}, {2, 6953, 108}, {13, 20244, 105},
+    {255, -14613, 0}, {4, 624, 107}, {255, -16510, 0}, {255, -17113, 0}, {13, 30221, 114}, {13, 27647, 113}, {8, 10923, 112}, {255, -18414, 0},
+    {255, -19329, 0}, {255, -20020, 0}, {2, 13016, 116}, {255, -20653, 0}, {255, -21493, 0}, {2, 22093, 121}, {2, 18096, 120}, {255, -22107, 0},
+    {255, -23119, 0}, {5, -21883, 141}, {2, 29309, 126}, {2, 28388, 125}, {255, -24661, 0}, {255, -24770, 0}, {12, -5868, 134}, {5, -32481, 131},
+    {5, -32498, 130}, {255, -24933, 0}, {255, -24921, 0}, {11, -30511, 133}, {255, -24887, 0}, {255, -24927, 0}, {2, 32411, 138}, {2, 30568, 137},
+    {255, -24876, 0}, {255, -24918, 0}, {10, -8802, 140}, {255, -24946, 0}, {255, -24932, 0}, {255, -24073, 0}, {2, 86, 196}, {13, -17484, 151},
+    {4, 28966, 148}, {7, -22654, 147}, {255, 18182, 0}, {255, 23827, 0}, {2, -32500, 150}, {255, 31781, 0}, {255, 26874, 0}, {5, 8511, 181},
+    {1, 32500, 164}, {13, 5379, 159}, {2, -14697, 156}, {255, 6494, 0}, {13, 1222, 158}, {255, 3468, 0}, {255, 1228, 0}, {13, 11290, 163},
+    {5, -243, 162}, {255, -2767, 0}, {255, -547, 0}, {255, -5511, 0}, {13, 12612, 176}, {13, 4154, 169}, {13, 1260, 168}, {255, 11018, 0},
+    {255, 9761, 0}, {13, 8964, 175}, {13, 6544, 172}, {255, 8385, 0}, {2, -9325, 174}, {255, 7785, 0}, {255, 7114, 0}, {255, 6219, 0},
+    {13, 15960, 178}, {255, 3461, 0}, {12, 31330, 180}, {255, 2333, 0}, {255, 1518, 0}, {1, 32500, 191}, {13, -9461, 190}, {2, -23447, 187},
+    {13, -15030, 186}, {255, 13883, 0}, {255, 12878, 0}, {5, 12535, 189}, {255, 11487, 0}, {255, 10434, 0}, {255, 7379, 0}, {13, -743, 195},
+    {13, -5970, 194}, {255, 16931, 0}, {255, 14620, 0}, {255, 11551, 0}, {1, 32500, 238}, {2, 12228, 207}, {13, 22059, 202}, {11, 10896, 201},
+    {255, -5236, 0}, {255, -7865, 0}, {2, 9202, 206}, {13, 25903, 205}, {255, -9153, 0}, {255, -10500, 0}, {255, -12144, 0}, {2, 24605, 215},
+    {2, 18116, 210}, {255, -14612, 0}, {10, -30321, 212}, {255, -15013, 0}, {2, 22305, 214}, {255, -15799, 0}, {255, -16247, 0}, {2, 27020, 223},
+    {2, 25849, 220}, {8, 25390, 219}, {255, -16669, 0}, {255, -16617, 0}, {2, 26466, 222}, {255, -16822, 0}, {255, -17037, 0}, {2, 29426, 225},
+    {255, -17162, 0}, {12, -7827, 233}, {7, 32429, 230}, {11, -27676, 229}, {255, -17335, 0}, {255, -17372, 0}, {12, -19328, 232}, {255, -17366, 0},
+    {255, -17378, 0}, {2, 30493, 235}, {255, -17306, 0}, {13, 32184, 237}, {255, -17324, 0}, {255, -17394, 0}, {2, 13218, 248}, {2, 10473, 247},
+    {13, 18264, 242}, {255, 1957, 0}, {13, 26081, 246}, {13, 23073, 245}, {255, -1494, 0}, {255, -2020, 0}, {255, -2776, 0}, {255, -5230, 0},
+    {2, 18158, 252}, {12, 32024, 251}, {255, -6657, 0}, {255, -7280, 0}, {2, 26451, 258}, {2, 23329, 255}, {255, -8616, 0}, {3, 7359, 257},
+    {255, -9048, 0}, {255, -9342, 0}, {12, -19860, 268}, {11, -31806, 267}, {7, 32400, 264}, {7, 32385, 263}, {255, -9770, 0}, {255, -9779, 0},
+    {10, 12948, 266}, {255, -9817, 0}, {255, -9792, 0}, {255, -9811, 0}, {2, 29202, 270}, {255, -9580, 0}, {8, 16963, 274}, {10, -5114, 273},
+    {255, -9786, 0}, {255, -9823, 0}, {2, 30954, 276}, {255, -9772, 0}, {255, -9848, 0}, {2, 1247, 379}, {2, -21289, 300}, {1, -32500, 281},
+    {255, -305, 0}, {1, 32500, 295}, {6, -32501, 286}, {4, 32499, 285}, {255, 22860, 0}, {255, 19311, 0}, {1, 0, 290}, {5, 22290, 289},
+    {255, 7116, 0}, {255, 11330, 0}, {2, -26750, 292}, {255, 17055, 0}, {2, -25077, 294}, {255, 13611, 0}, {255, 12614, 0}, {9, -29147, 297},
+    {255, 28423, 0}, {13, -15226, 299}, {255, 23625, 0}, {255, 21646, 0}, {1, 0, 340}, {1, -32500, 321}, {2, -12517, 308}, {11, 1041, 305},
+    {255, -8033, 0}, {13, -4738, 307}, {255, -10365, 0}, {255, -11966, 0}, {2, -5324, 316}, {12, 31692, 315}, {13, 6476, 314}, {12, 30971, 313},
+    {255, -16519, 0}, {255, -15734, 0}, {255, -17034, 0}, {255, -14264, 0}, {13, 10164, 318}, {255, -18869, 0}, {10, -14476, 320}, {255, -20264, 0},
+    {255, -21512, 0}, {13, -1325, 327}, {13, -10357, 324}, {255, 1800, 0}, {13, -5264, 326}, {255, -1132, 0}, {255, -2733, 0}, {13, 7157, 335},
+    {13, 3503, 332}, {2, -8936, 331}, {255, -6006, 0}, {255, -7071, 0}, {5, -1365, 334}, {255, -9301, 0}, {255, -8182, 0}, {5, -3795, 337},
+    {255, -10802, 0}, {13, 12453, 339}, {255, -11445, 0}, {255, -11997, 0}, {2, -4652, 370}, {1, 32500, 355}, {2, -12970, 348}, {13, -7186, 347},
+    {12, 31118, 346}, {255, 8358, 0}, {255, 10291, 0}, {255, 6133, 0}, {13, 5927, 354}, {13, 636, 351}, {255, 3474, 0}, {13, 2587, 353},
+    {255, 1882, 0}, {255, 1424, 0}, {255, -635, 0}, {13, 4154, 361}, {13, -1681, 358}, {255, 14942, 0}, {8, -6964, 360}, {255, 11093, 0},
+    {255, 9967, 0}, {13, 8433, 367}, {9, -19154, 364}, {255, 8885, 0}, {13, 6428, 366}, {255, 8167, 0}, {255, 7409, 0}, {12, 30776, 369},
+    {255, 4451, 0}, {255, 6425, 0}, {1, 32500, 374}, {8, -851, 373}, {255, -6923, 0}, {255, -2243, 0}, {10, -17557, 376}, {255, 3466, 0},
+    {13, 19634, 378}, {255, 1750, 0}, {255, 402, 0}, {1, 0, 491}, {1, -32500, 430}, {2, 14374, 399}, {13, 25148, 390}, {13, 16880, 385},
+    {255, -21621, 0}, {12, 31339, 389}, {12, 31138, 388}, {255, -25257, 0}, {255, -24592, 0}, {255, -23907, 0}, {2, 10462, 392}, {255, -26192, 0},
+    {10, -19096, 394}, {255, -27311, 0}, {2, 13269, 398}, {12, 32007, 397}, {255, -28168, 0}, {255, -27959, 0}, {255, -28662, 0}, {2, 23933, 405},
+    {2, 21164, 404}, {11, 21667, 403}, {255, -29899, 0}, {255, -30155, 0}, {255, -31421, 0}, {2, 28321, 407}, {255, -32018, 0}, {2, 32371, 415},
+    {2, 29733, 410}, {255, -32351, 0}, {11, 19636, 414}, {5, -32455, 413}, {255, -32446, 0}, {255, -32430, 0}, {255, -32482, 0}, {12, -4435, 423},
+    {4, -32051, 420}, {7, 32402, 419}, {255, -32436, 0}, {255, -32447, 0}, {12, -19921, 422}, {255, -32454, 0}, {255, -32478, 0}, {10, -17996, 427},
+    {6, 30957, 426}, {255, -32500, 0}, {255, -32489, 0}, {6, 32499, 429}, {255, -32486, 0}, {255, -32442, 0}, {2, 14563, 446}, {2, 7040, 437},
+    {10, -10438, 436}, {13, 20956, 435}, {255, -15111, 0}, {255, -16017, 0}, {255, -17084, 0}, {13, 30294, 443}, {7, 6499, 442}, {4, -4651, 441},
+    {255, -18414, 0}, {255, -19209, 0}, {255, -19441, 0}, {13, 31319, 445}, {255, -20401, 0}, {255, -21053, 0}, {2, 24738, 456}, {2, 21934, 453},
+    {9, 11436, 452}, {12, 32168, 451}, {255, -22984, 0}, {255, -22651, 0}, {255, -21921, 0}, {6, 12197, 455}, {255, -23904, 0}, {255, -23432, 0},
+    {2, 29493, 462}, {2, 27254, 459}, {255, -24499, 0}, {10, -21798, 461}, {255, -24669, 0}, {255, -24791, 0}, {12, -5059, 478}, {7, 32428, 471},
+    {9, 31612, 468}, {4, -26541, 467}, {255, -24935, 0}, {255, -24923, 0}, {7, 32396, 470}, {255, -24882, 0}, {255, -24893, 0}, {7, 32467, 475},
+    {5, -32492, 474}, {255, -24927, 0}, {255, -24916, 0}, {10, -6737, 477}, {255, -24941, 0}, {255, -24935, 0}, {2, 32411, 484}, {10, -26198, 481},
+    {255, -24932, 0}, {13, 32322, 483}, {255, -24907, 0}, {255, -24887, 0}, {10, -14509, 488}, {7, 32473, 487}, {255, -24954, 0}, {255, -24944, 0},
+    {10, 5058, 490}, {255, -24939, 0}, {255, -24929, 0}, {1, 32500, 533}, {13, 28982, 504}, {13, 24023, 499}, {12, 31787, 498}, {13, 19483, 497},
+    {255, -7317, 0}, {255, -8142, 0}, {255, -6082, 0}, {5, -12328, 501}, {255, -11607, 0}, {12, 31884, 503}, {255, -10716, 0}, {255, -9832, 0},
+    {5, -23407, 528}, {2, 27020, 513}, {2, 26495, 512}, {2, 25202, 509}, {255, -16533, 0}, {11, 2981, 511}, {255, -16685, 0}, {255, -16809, 0},
+    {255, -16991, 0}, {2, 29426, 515}, {255, -17183, 0}, {12, -355, 523}, {7, 32429, 520}, {11, -29165, 519}, {255, -17336, 0}, {255, -17378, 0},
+    {7, 32473, 522}, {255, -17369, 0}, {255, -17388, 0}, {2, 30523, 525}, {255, -17310, 0}, {3, 5651, 527}, {255, -17401, 0}, {255, -17387, 0},
+    {2, 17661, 530}, {255, -14086, 0}, {12, 31489, 532}, {255, -15687, 0}, {255, -15277, 0}, {2, 15983, 545}, {2, 9620, 542}, {10, -20238, 537},
+    {255, -528, 0}, {13, 25841, 541}, {13, 23073, 540}, {255, -1527, 0}, {255, -1973, 0}, {255, -2944, 0}, {13, 28720, 544}, {255, -4066, 0},
+    {255, -5923, 0}, {2, 23950, 557}, {2, 18685, 550}, {13, 32092, 549}, {255, -6542, 0}, {255, -7075, 0}, {3, -9599, 552}, {255, -7403, 0},
+    {2, 19847, 554}, {255, -8244, 0}, {2, 21785, 556}, {255, -8520, 0}, {255, -8675, 0}, {2, 26927, 559}, {255, -9193, 0}, {2, 29202, 561},
+    {255, -9628, 0}, {12, -18290, 569}, {11, -29707, 566}, {5, -32461, 565}, {255, -9798, 0}, {255, -9776, 0}, {10, 32499, 568}, {255, -9822, 0},
+    {255, -9807, 0}, {5, -26799, 573}, {10, -2483, 572}, {255, -9851, 0}, {255, -9831, 0}, {255, -9761, 0}, {7, -6718, 652}, {1, 0, 603},
+    {2, -20469, 586}, {7, -27686, 579}, {255, 9844, 0}, {1, -32500, 583}, {13, -20646, 582}, {255, 138, 0}, {255, -3865, 0}, {7, -21282, 585},
+    {255, 4632, 0}, {255, 1824, 0}, {13, -631, 596}, {1, -32500, 593}, {13, -7820, 592}, {13, -12180, 591}, {255, -7721, 0}, {255, -8650, 0},
+    {255, -11335, 0}, {5, 3911, 595}, {255, -4208, 0}, {255, -721, 0}, {1, -32500, 602}, {13, 6277, 601}, {13, 2115, 600}, {255, -13775, 0},
+    {255, -15957, 0}, {255, -18372, 0}, {255, -9342, 0}, {5, 13070, 631}, {2, -12294, 616}, {11, 1255, 609}, {5, 10710, 608}, {255, 17404, 0},
+    {255, 12203, 0}, {1, 32500, 613}, {13, -7525, 612}, {255, 9708, 0}, {255, 6458, 0}, {10, -18824, 615}, {255, 14213, 0}, {255, 10575, 0},
+    {1, 32500, 622}, {13, 5042, 621}, {13, 824, 620}, {255, 3375, 0}, {255, 1820, 0}, {255, -545, 0}, {13, 11280, 628}, {13, 4052, 625},
+    {255, 10242, 0}, {13, 8433, 627}, {255, 7881, 0}, {255, 6320, 0}, {2, -5029, 630}, {255, 4192, 0}, {255, 1622, 0}, {2, -28711, 641},
+    {1, 32500, 636}, {11, -1713, 635}, {255, 27435, 0}, {255, 22149, 0}, {5, 28166, 640}, {13, -21688, 639}, {255, 28188, 0}, {255, 27076, 0},
+    {255, 32500, 0}, {1, 32500, 647}, {2, -26117, 644}, {255, 16992, 0}, {2, -23447, 646}, {255, 13028, 0}, {255, 10154, 0}, {11, 12837, 651},
+    {13, -13713, 650}, {255, 22867, 0}, {255, 20483, 0}, {255, 14717, 0}, {1, 0, 764}, {1, -32500, 709}, {2, 13430, 676}, {2, 2184, 663},
+    {2, -4377, 658}, {255, -16761, 0}, {13, 12493, 660}, {255, -19844, 0}, {2, 1518, 662}, {255, -21128, 0}, {255, -21698, 0}, {2, 6235, 669},
+    {13, 22076, 668}, {13, 19959, 667}, {255, -22914, 0}, {255, -23516, 0}, {255, -24177, 0}, {7, 2046, 671}, {255, -25990, 0}, {2, 12901, 675},
+    {7, 4147, 674}, {255, -27000, 0}, {255, -27597, 0}, {255, -26777, 0}, {2, 21451, 684}, {2, 14790, 679}, {255, -29175, 0}, {7, 17029, 683},
+    {12, 31680, 682}, {255, -30593, 0}, {255, -30160, 0}, {255, -29999, 0}, {2, 27972, 688}, {9, 10915, 687}, {255, -31448, 0}, {255, -32024, 0},
+    {2, 32389, 696}, {2, 29422, 691}, {255, -32296, 0}, {12, 31294, 695}, {4, -29611, 694}, {255, -32440, 0}, {255, -32473, 0}, {255, -32403, 0},
+    {12, -1515, 704}, {9, 31908, 701}, {10, 10609, 700}, {255, -32486, 0}, {255, -32477, 0}, {5, -32479, 703}, {255, -32476, 0}, {255, -32443, 0},
+    {2, 32404, 706}, {255, -32467, 0}, {7, 32497, 708}, {255, -32491, 0}, {255, -32498, 0}, {13, 28086, 729}, {2, 438, 716}, {13, 9354, 715},
+    {12, 31244, 714}, {255, -10056, 0}, {255, -8910, 0}, {255, -12269, 0}, {2, 6967, 726}, {13, 20244, 721}, {2, 3076, 720}, {255, -14534, 0},
+    {255, -15370, 0}, {13, 23611, 725}, {5, -6681, 724}, {255, -16470, 0}, {255, -16017, 0}, {255, -17023, 0}, {12, 31234, 728}, {255, -19335, 0},
+    {255, -18023, 0}, {2, 21590, 741}, {2, 16065, 738}, {2, 11576, 733}, {255, -20250, 0}, {12, 31795, 737}, {12, 30885, 736}, {255, -20816, 0},
+    {255, -21058, 0}, {255, -21605, 0}, {2, 18682, 740}, {255, -22120, 0}, {255, -23066, 0}, {2, 25049, 745}, {11, 14287, 744}, {255, -23459, 0},
+    {255, -23901, 0}, {2, 29309, 749}, {2, 28388, 748}, {255, -24632, 0}, {255, -24724, 0}, {2, 32415, 757}, {7, 32431, 754}, {8, 18182, 753},
+    {255, -24918, 0}, {255, -24887, 0}, {8, 32499, 756}, {255, -24914, 0}, {255, -24929, 0}, {12, -11825, 761}, {5, -32474, 760}, {255, -24924, 0},
+    {255, -24899, 0}, {12, 888, 763}, {255, -24933, 0}, {255, -24946, 0}, {1, 32500, 820}, {2, 12009, 779}, {13, 18903, 772}, {13, 14291, 769},
+    {255, -3791, 0}, {7, 3657, 771}, {255, -6169, 0}, {255, -8026, 0}, {5, -11656, 774}, {255, -12179, 0}, {13, 23997, 776}, {255, -8804, 0},
+    {12, 31725, 778}, {255, -10410, 0}, {255, -9736, 0}, {2, 22305, 789}, {2, 17661, 784}, {13, 32500, 783}, {255, -13719, 0}, {255, -14508, 0},
+    {5, -22914, 786}, {255, -15105, 0}, {12, 31118, 788}, {255, -15551, 0}, {255, -15790, 0}, {2, 27096, 799}, {2, 25600, 794}, {2, 24535, 793},
+    {255, -16247, 0}, {255, -16589, 0}, {10, -20496, 798}, {11, 1925, 797}, {255, -16737, 0}, {255, -16863, 0}, {255, -16989, 0}, {2, 30493, 805},
+    {2, 29426, 804}, {12, 30990, 803}, {255, -17266, 0}, {255, -17175, 0}, {255, -17307, 0}, {12, -7827, 813}, {5, -32480, 810}, {7, 32466, 809},
+    {255, -17369, 0}, {255, -17381, 0}, {9, 31320, 812}, {255, -17375, 0}, {255, -17336, 0}, {10, -15855, 817}, {4, -32501, 816}, {255, -17398, 0},
+    {255, -17405, 0}, {10, 9719, 819}, {255, -17390, 0}, {255, -17374, 0}, {2, 12916, 832}, {13, 17587, 825}, {11, 15267, 824}, {255, 6238, 0},
+    {255, 1471, 0}, {13, 23079, 829}, {3, 24768, 828}, {255, -1111, 0}, {255, -168, 0}, {2, 7735, 831}, {255, -2206, 0}, {255, -3998, 0},
+    {2, 21247, 838}, {7, 9022, 835}, {255, -6066, 0}, {2, 19771, 837}, {255, -7122, 0}, {255, -7792, 0}, {2, 26927, 844}, {2, 23329, 841},
+    {255, -8659, 0}, {6, 11033, 843}, {255, -9324, 0}, {255, -9048, 0}, {2, 29391, 848}, {10, -12152, 847}, {255, -9642, 0}, {255, -9728, 0},
+    {12, -18590, 856}, {11, -28815, 853}, {7, 32430, 852}, {255, -9782, 0}, {255, -9818, 0}, {10, 26293, 855}, {255, -9822, 0}, {255, -9814, 0},
+    {10, -10061, 860}, {7, 26127, 859}, {255, -9819, 0}, {255, -9854, 0}, {2, 32296, 862}, {255, -9782, 0}, {255, -9836, 0}, {1, 0, 1015},
+    {7, -3672, 906}, {13, -19071, 871}, {13, -32500, 868}, {255, 18779, 0}, {7, -29421, 870}, {255, 4368, 0}, {255, 9505, 0}, {13, -605, 889},
+    {1, -32500, 880}, {13, -15570, 875}, {255, -3913, 0}, {13, -7820, 879}, {13, -12180, 878}, {255, -7487, 0}, {255, -8472, 0}, {255, -10666, 0},
+    {13, -6592, 884}, {5, 14807, 883}, {255, 323, 0}, {255, 3036, 0}, {4, 5105, 886}, {255, -5220, 0}, {3, 20734, 888}, {255, -2532, 0},
+    {255, -1619, 0}, {1, -32500, 897}, {13, 8068, 894}, {13, 2245, 893}, {255, -14461, 0}, {255, -16113, 0}, {13, 11626, 896}, {255, -18252, 0},
+    {255, -19798, 0}, {13, 9714, 903}, {2, -7569, 900}, {255, -6943, 0}, {7, -6064, 902}, {255, -8503, 0}, {255, -9390, 0}, {11, 24036, 905},
+    {255, -12092, 0}, {255, -15059, 0}, {1, -32500, 960}, {2, 14374, 923}, {13, 21179, 916}, {13, 13824, 913}, {5, -7033, 912}, {255, -21402, 0},
+    {255, -19767, 0}, {13, 16880, 915}, {255, -22231, 0}, {255, -23462, 0}, {13, 26626, 920}, {2, 6659, 919}, {255, -24364, 0}, {255, -25904, 0},
+    {13, 30218, 922}, {255, -27032, 0}, {255, -28242, 0}, {2, 23933, 933}, {2, 18144, 926}, {255, -30005, 0}, {12, 31675, 930}, {9, 13064, 929},
+    {255, -30846, 0}, {255, -30487, 0}, {2, 21117, 932}, {255, -30846, 0}, {255, -31374, 0}, {2, 27727, 935}, {255, -31902, 0}, {2, 32417, 945},
+    {2, 29470, 938}, {255, -32290, 0}, {7, 32424, 942}, {8, 19926, 941}, {255, -32475, 0}, {255, -32437, 0}, {5, -32497, 944}, {255, -32480, 0},
+    {255, -32470, 0}, {12, -5660, 953}, {5, -32472, 950}, {7, 32466, 949}, {255, -32473, 0}, {255, -32486, 0}, {5, -32451, 952}, {255, -32444, 0},
+    {255, -32476, 0}, {2, 32450, 957}, {3, -32501, 956}, {255, -32444, 0}, {255, -32483, 0}, {7, 32499, 959}, {255, -32490, 0}, {255, -32500, 0},
+    {2, 16807, 980}, {13, 24293, 969}, {13, 20201, 964}, {255, -14015, 0}, {6, -1955, 968}, {13, 22200, 967}, {255, -16366, 0}, {255, -16787, 0},
+    {255, -17569, 0}, {9, -1693, 973}, {9, -3834, 972}, {255, -19377, 0}, {255, -18893, 0}, {13, 28666, 975}, {255, -19463, 0}, {2, 12268, 977},
+    {255, -20124, 0}, {12, 31186, 979}, {255, -20852, 0}, {255, -21278, 0}, {2, 24163, 988}, {2, 21934, 985}, {11, 16242, 984}, {255, -22338, 0},
+    {255, -23064, 0}, {6, 12197, 987}, {255, -23944, 0}, {255, -23518, 0}, {2, 28515, 992}, {2, 26369, 991}, {255, -24353, 0}, {255, -24638, 0},
+    {2, 32412, 1002}, {2, 29309, 995}, {255, -24789, 0}, {7, 32431, 999}, {2, 29868, 998}, {255, -24861, 0}, {255, -24891, 0}, {13, 32215, 1001},
+    {255, -24934, 0}, {255, -24926, 0}, {12, -24353, 1008}, {7, 32427, 1007}, {5, -32460, 1006}, {255, -24894, 0}, {255, -24887, 0}, {255, -24918, 0},
+    {12, 464, 1012}, {6, 31758, 1011}, {255, -24933, 0}, {255, -24884, 0}, {10, -8589, 1014}, {255, -24947, 0}, {255, -24937, 0}, {2, -270, 1071},
+    {2, -16229, 1038}, {9, -26867, 1023}, {12, 31069, 1020}, {255, 28790, 0}, {8, -32500, 1022}, {255, 26037, 0}, {255, 22127, 0}, {1, 32500, 1033},
+    {13, -14462, 1028}, {13, -17899, 1027}, {255, 16565, 0}, {255, 13608, 0}, {2, -19485, 1032}, {10, -27175, 1031}, {255, 11584, 0}, {255, 9859, 0},
+    {255, 7565, 0}, {13, -11407, 1035}, {255, 21704, 0}, {10, -24162, 1037}, {255, 17296, 0}, {255, 14172, 0}, {1, 32500, 1054}, {13, 4548, 1049},
+    {13, -1301, 1044}, {13, -4531, 1043}, {255, 6415, 0}, {255, 4675, 0}, {13, 1496, 1048}, {10, -24221, 1047}, {255, 2559, 0}, {255, 3297, 0},
+    {255, 1344, 0}, {13, 7934, 1053}, {13, 6956, 1052}, {255, -47, 0}, {255, -806, 0}, {255, -3726, 0}, {13, 8703, 1062}, {13, 4154, 1059},
+    {8, -11678, 1058}, {255, 10799, 0}, {255, 13811, 0}, {13, 6544, 1061}, {255, 8317, 0}, {255, 7188, 0}, {13, 12688, 1066}, {9, -14943, 1065},
+    {255, 6211, 0}, {255, 4770, 0}, {11, 32500, 1070}, {13, 15312, 1069}, {255, 3347, 0}, {255, 2221, 0}, {255, 531, 0}, {1, 32500, 1115},
+    {13, 30584, 1086}, {13, 21918, 1079}, {13, 16311, 1076}, {255, -5424, 0}, {12, 31637, 1078}, {255, -8219, 0}, {255, -6730, 0}, {9, -204, 1083},
+    {5, -10508, 1082}, {255, -10614, 0}, {255, -9941, 0}, {12, 31626, 1085}, {255, -11546, 0}, {255, -12406, 0}, {2, 23712, 1092}, {5, -17575, 1091},
+    {3, 3328, 1090}, {255, -15319, 0}, {255, -15923, 0}, {255, -14557, 0}, {2, 27096, 1100}, {2, 26663, 1099}, {12, 31390, 1098}, {3, -6648, 1097},
+    {255, -16613, 0}, {255, -16686, 0}, {255, -16749, 0}, {255, -17035, 0}, {2, 29426, 1102}, {255, -17202, 0}, {12, -2483, 1110}, {7, 32412, 1107},
+    {9, 31277, 1106}, {255, -17377, 0}, {255, -17335, 0}, {12, -19875, 1109}, {255, -17361, 0}, {255, -17379, 0}, {2, 30523, 1112}, {255, -17310, 0},
+    {2, 32459, 1114}, {255, -17387, 0}, {255, -17400, 0}, {13, 28353, 1123}, {13, 22778, 1120}, {13, 18354, 1119}, {255, 1802, 0}, {255, -492, 0},
+    {2, 7735, 1122}, {255, -2136, 0}, {255, -3620, 0}, {2, 19397, 1129}, {2, 15826, 1126}, {255, -5915, 0}, {13, 32092, 1128}, {255, -6609, 0},
+    {255, -7063, 0}, {2, 24876, 1135}, {2, 21247, 1134}, {6, 2332, 1133}, {255, -8493, 0}, {255, -7932, 0}, {255, -8716, 0}, {2, 27969, 1137},
+    {255, -9420, 0}, {2, 32452, 1145}, {2, 29910, 1142}, {12, 31318, 1141}, {255, -9705, 0}, {255, -9750, 0}, {12, -13914, 1144}, {255, -9786, 0},
+    {255, -9836, 0}, {10, -1569, 1149}, {10, -17806, 1148}, {255, -9854, 0}, {255, -9846, 0}, {12, -32501, 1151}, {255, -9784, 0}, {255, -9828, 0},
+    {1, 0, 1284}, {13, 20828, 1195}, {9, -22493, 1162}, {5, 22856, 1159}, {10, -32112, 1158}, {255, 7430, 0}, {255, -2013, 0}, {12, 31457, 1161},
+    {255, 14968, 0}, {255, 7540, 0}, {2, -5336, 1182}, {1, -32500, 1175}, {2, -17109, 1168}, {2, -19085, 1167}, {255, -6054, 0}, {255, -8800, 0},
+    {13, -422, 1170}, {255, -12094, 0}, {12, 31171, 1172}, {255, -16500, 0}, {13, 448, 1174}, {255, -14461, 0}, {255, -15421, 0}, {13, 726, 1179},
+    {13, -2608, 1178}, {255, -2707, 0}, {255, -5495, 0}, {13, 8204, 1181}, {255, -7747, 0}, {255, -10349, 0}, {1, -32500, 1190}, {5, -7876, 1185},
+    {255, -23842, 0}, {13, 13150, 1189}, {13, 10164, 1188}, {255, -18950, 0}, {255, -19774, 0}, {255, -20529, 0}, {2, 3076, 1194}, {13, 14988, 1193},
+    {255, -12253, 0}, {255, -13851, 0}, {255, -16247, 0}, {1, -32500, 1247}, {2, 13430, 1208}, {2, 5742, 1201}, {9, -5777, 1200}, {255, -23999, 0},
+    {255, -24754, 0}, {13, 30527, 1207}, {13, 27738, 1206}, {12, 31777, 1205}, {255, -25820, 0}, {255, -26777, 0}, {255, -26781, 0}, {255, -28096, 0},
+    {2, 21829, 1216}, {5, -18582, 1213}, {12, 31365, 1212}, {255, -30475, 0}, {255, -30985, 0}, {2, 16815, 1215}, {255, -29557, 0}, {255, -30176, 0},
+    {2, 28319, 1222}, {2, 23933, 1219}, {255, -31481, 0}, {7, 18561, 1221}, {255, -31920, 0}, {255, -32006, 0}, {2, 32419, 1232}, {2, 30746, 1225},
+    {255, -32342, 0}, {7, 32421, 1229}, {9, 30751, 1228}, {255, -32482, 0}, {255, -32437, 0}, {5, -32499, 1231}, {255, -32485, 0}, {255, -32470, 0},
+    {12, -5541, 1240}, {7, 32432, 1237}, {11, -31188, 1236}, {255, -32444, 0}, {255, -32477, 0}, {5, -32501, 1239}, {255, -32485, 0}, {255, -32471, 0},
+    {12, 18706, 1244}, {7, 32493, 1243}, {255, -32486, 0}, {255, -32496, 0}, {2, 32499, 1246}, {255, -32492, 0}, {255, -32500, 0}, {2, 16065, 1259},
+    {2, 9510, 1254}, {4, -3843, 1251}, {255, -18368, 0}, {13, 23261, 1253}, {255, -16309, 0}, {255, -17063, 0}, {13, 32052, 1258}, {2, 13903, 1257},
+    {255, -19888, 0}, {255, -20943, 0}, {255, -21548, 0}, {2, 23929, 1263}, {5, -20202, 1262}, {255, -23657, 0}, {255, -22673, 0}, {2, 27279, 1265},
+    {255, -24448, 0}, {2, 29343, 1269}, {12, 31653, 1268}, {255, -24713, 0}, {255, -24809, 0}, {12, -5139, 1277}, {5, -32475, 1274}, {7, 32457, 1273},
+    {255, -24917, 0}, {255, -24934, 0}, {11, -30511, 1276}, {255, -24890, 0}, {255, -24927, 0}, {2, 32438, 1281}, {2, 30513, 1280}, {255, -24881, 0},
+    {255, -24923, 0}, {10, -12396, 1283}, {255, -24949, 0}, {255, -24939, 0}, {2, -129, 1326}, {5, 8464, 1311}, {2, -7929, 1298}, {1, 32500, 1295},
+    {13, -1927, 1292}, {13, -4531, 1291}, {255, 6415, 0}, {255, 4734, 0}, {13, 1697, 1294}, {255, 2794, 0}, {255, 1398, 0}, {13, 4666, 1297},
+    {255, 11666, 0}, {255, 6708, 0}, {1, 32500, 1304}, {13, 7618, 1301}, {255, -510, 0}, {13, 16032, 1303}, {255, -3861, 0}, {255, -6371, 0},
+    {13, 12688, 1306}, {255, 6198, 0}, {13, 14574, 1308}, {255, 3541, 0}, {12, 31330, 1310}, {255, 2246, 0}, {255, 1553, 0}, {6, -31764, 1315},
+    {12, 31168, 1314}, {255, 30354, 0}, {255, 24308, 0}, {11, 1169, 1319}, {12, 30809, 1318}, {255, 21514, 0}, {255, 16146, 0}, {1, 32500, 1323},
+    {5, 18879, 1322}, {255, 8785, 0}, {255, 14792, 0}, {13, -3910, 1325}, {255, 15844, 0}, {255, 13764, 0}, {1, 32500, 1370}, {13, 30584, 1339},
+    {13, 24358, 1334}, {13, 15239, 1331}, {255, -5152, 0}, {12, 31397, 1333}, {255, -8248, 0}, {255, -7160, 0}, {8, 673, 1338}, {12, 31884, 1337},
+    {255, -10611, 0}, {255, -9832, 0}, {255, -12303, 0}, {2, 24777, 1349}, {5, -17575, 1348}, {10, -30321, 1343}, {255, -15013, 0}, {2, 20493, 1345},
+    {255, -15533, 0}, {7, 16249, 1347}, {255, -16071, 0}, {255, -15904, 0}, {255, -14682, 0}, {2, 26880, 1353}, {2, 25928, 1352}, {255, -16688, 0},
+    {255, -16968, 0}, {2, 29426, 1357}, {2, 28283, 1356}, {255, -17096, 0}, {255, -17238, 0}, {12, -2483, 1365}, {7, 32426, 1362}, {11, -29312, 1361},
+    {255, -17333, 0}, {255, -17375, 0}, {7, 32461, 1364}, {255, -17370, 0}, {255, -17384, 0}, {2, 30629, 1367}, {255, -17311, 0}, {10, -15293, 1369},
+    {255, -17401, 0}, {255, -17391, 0}, {2, 13045, 1378}, {2, 10473, 1377}, {13, 22778, 1376}, {2, 1155, 1375}, {255, 1238, 0}, {255, -657, 0},
+    {255, -2021, 0}, {255, -5142, 0}, {2, 21620, 1388}, {11, 32399, 1387}, {6, 13750, 1386}, {12, 32024, 1385}, {5, -18336, 1384}, {255, -6591, 0},
+    {255, -6046, 0}, {255, -7271, 0}, {255, -7399, 0}, {255, -8472, 0}, {2, 26451, 1394}, {2, 25299, 1393}, {4, -18543, 1392}, {255, -8783, 0},
+    {255, -9059, 0}, {255, -9355, 0}, {2, 29135, 1396}, {255, -9618, 0}, {12, -14276, 1404}, {5, -32477, 1401}, {6, 25894, 1400}, {255, -9832, 0},
+    {255, -9816, 0}, {11, -31806, 1403}, {255, -9779, 0}, {255, -9815, 0}, {2, 30874, 1406}, {255, -9786, 0}, {10, -2758, 1408}, {255, -9851, 0},
+    {255, -9830, 0}
+};
+
+void quantizeFeatures(const float *features, int16_t *qx) {
+    for (uint8_t f = 0; f < NUM_FEATURES; f++) {
+        float q = floor((features[f] - pgm_read_float(&FEATURE_OFFSET[f])) / pgm_read_float(&FEATURE_STEP[f]));
+        if (q < -32768.0f) q = -32768.0f;
+        if (q > 32767.0f) q = 32767.0f;
+        qx[f] = (int16_t)q;
     }
-    
-    return distance / speed;
 }
 
-float predictETD(float features[7]) {
-    float speed = features[FEAT_ETD_SPEED_12];
-    float accel = features[FEAT_ETD_ACCEL];
-    float distance = features[FEAT_ETD_DISTANCE];
-    float train_length = features[FEAT_ETD_TRAIN_LENGTH];
-    
-    if (speed <= 0 || distance <= 0 || train_length <= 0) return -1;
-    
-    float total_distance = distance + train_length;
-    
-    if (accel > -0.1 && accel < 0.1) {
-        return total_distance / speed;
-    }
-    
-    float discriminant = speed * speed + 2.0 * accel * total_distance;
+float predictForest(const ForestNode *nodes, const uint16_t *roots, uint8_t n_trees,
+                    const int16_t *qx, float value_offset, float value_step) {
+    int32_t total = 0;
     
-    if (discriminant < 0) {
-        return total_distance / speed;
+    for (uint8_t t = 0; t < n_trees; t++) {
+        uint16_t i = pgm_read_word(&roots[t]);
+        uint8_t feature;
+        
+        while ((feature = pgm_read_byte(&nodes[i].feature)) != FOREST_LEAF) {
+            int16_t threshold = (int16_t)pgm_read_word(&nodes[i].value);
+            i = (qx[feature] <= threshold) ? i + 1 : pgm_read_word(&nodes[i].right);
+        }
+        total += (int16_t)pgm_read_word(&nodes[i].value);
     }
     
-    float t = (-speed + sqrt(discriminant)) / accel;
-    
-    if (t > 0 && t < 1000) {
-        return t;
-    }
-    
-    return total_distance / speed;
+    return value_offset + value_step * ((float)total / n_trees);
+}
+
+float predictETA(const float *features) {
+    int16_t qx[NUM_FEATURES];
+    quantizeFeatures(features, qx);
+    return predictForest(ETA_NODES, ETA_ROOTS, ETA_N_TREES, qx, ETA_VALUE_OFFSET, ETA_VALUE_STEP);
+}
+
+float predictETD(const float *features) {
+    int16_t qx[NUM_FEATURES];
+    quantizeFeatures(features, qx);
+    return predictForest(ETD_NODES, ETD_ROOTS, ETD_N_TREES, qx, ETD_VALUE_OFFSET, ETD_VALUE_STEP);
 }
 
 float estimateETD(float eta, float last_speed) {
-    const float AVG_TRAIN_LENGTH = 0.15f;
-    
     if (eta <= 0 || last_speed <= 0) return -1;
     
-    float crossing_time = AVG_TRAIN_LENGTH / last_speed;
+    float crossing_time = TRAIN_LENGTH / last_speed;
     return eta + crossing_time;
 }
 
@@ -169,8 +169,50 @@ void checkSensors() {
     }
 }
 
+/*
+ * Same 14 features as extract_features() in train_data.py, in model units.
+ * Only trigger timestamps are measured, so speeds at the sensors come from
+ * a constant-acceleration fit (export_arduino.py mirrors this to report accuracy).
+ */
+void computeFeatures(float time_01, float time_12, float train_length, float *features) {
+    float distance_01 = MODEL_S1_POS - MODEL_S0_POS;
+    float distance_12 = MODEL_S2_POS - MODEL_S1_POS;
+    float distance_remaining = MODEL_CROSSING_POS - MODEL_S2_POS;
+    
+    float avg_speed_01 = distance_01 / time_01;
+    float avg_speed_12 = distance_12 / time_12;
+    float accel = 2.0f * (avg_speed_12 - avg_speed_01) / (time_01 + time_12);
+    
+    float speed_0 = avg_speed_01 - accel * time_01 / 2.0f;
+    float speed_1 = avg_speed_01 + accel * time_01 / 2.0f;
+    float speed_2 = avg_speed_12 + accel * time_12 / 2.0f;
+    
+    float accel_01 = (speed_1 - speed_0) / time_01;
+    float accel_12 = (speed_2 - speed_1) / time_12;
+    
+    float time_to_crossing = speed_2 > 0 ? distance_remaining / speed_2 : 0.0f;
+    float predicted_crossing_speed = speed_2 + accel_12 * time_to_crossing;
+    if (predicted_crossing_speed < 5.0f) predicted_crossing_speed = 5.0f;
+    if (predicted_crossing_speed > 50.0f) predicted_crossing_speed = 50.0f;
+    
+    features[FEAT_DISTANCE_REMAINING] = distance_remaining;
+    features[FEAT_TRAIN_LENGTH] = train_length;
+    features[FEAT_LAST_SPEED] = speed_2;
+    features[FEAT_SPEED_CHANGE] = speed_2 - speed_0;
+    features[FEAT_TIME_01] = time_01;
+    features[FEAT_TIME_12] = time_12;
+    features[FEAT_AVG_SPEED_01] = avg_speed_01;
+    features[FEAT_AVG_SPEED_12] = avg_speed_12;
+    features[FEAT_SPEED_0] = speed_0;
+    features[FEAT_SPEED_1] = speed_1;
+    features[FEAT_ACCEL_01] = accel_01;
+    features[FEAT_ACCEL_12] = accel_12;
+    features[FEAT_ACCEL_TREND] = accel_12 - accel_01;
+    features[FEAT_PREDICTED_CROSSING_SPEED] = predicted_crossing_speed;
+}
+
 void calculatePredictions() {
-    Serial.println("\n[ML] Computing ETA and ETD...");
+    Serial.println(MODEL_IS_FOREST ? "\n[ML] Computing ETA and ETD (Random Forest)..." : "\n[ML] Computing ETA and ETD (physics)...");
     
     float time_01 = (sensor_times[1] - sensor_times[0]) / 1000.0;
     float time_12 = (sensor_times[2] - sensor_times[1]) / 1000.0;
@@ -189,24 +231,24 @@ void calculatePredictions() {
     float speed_12 = distance_12 / time_12;
     float accel = (speed_12 - speed_01) / time_12;
     
-    float eta_features[6] = {
-        time_01, time_12, speed_01, speed_12, accel, distance_to_crossing
-    };
+#if MODEL_IS_FOREST
+    // The forests work in training units; their outputs are scaled back to demo seconds
+    float features[NUM_FEATURES];
+    computeFeatures(time_01 * MODEL_TIME_SCALE, time_12 * MODEL_TIME_SCALE, MODEL_TRAIN_LENGTH, features);
     
-    float eta = predictETA(eta_features);
+    float eta = predictETA(features) / MODEL_TIME_SCALE;
+    float etd = predictETD(features) / MODEL_TIME_SCALE;
+#else
+    // Physics needs no unit mapping: measured demo speeds and the real distance to the crossing
+    float eta = physicsETA(speed_12, accel, distance_to_crossing);
+    float etd = physicsETD(speed_12, accel, distance_to_crossing, getDefaultTrainLength());
+#endif
     
     if (eta <= 0 || eta > 100) {
         Serial.println("[WARNING] Invalid ETA, using fallback");
         eta = distance_to_crossing / speed_12;
     }
     
-    float etd_features[7] = {
-        time_01, time_12, speed_01, speed_12, accel,
-        distance_to_crossing, getDefaultTrainLength()
-    };
-    
-    float etd = predictETD(etd_features);
-    
     if (etd <= 0 || etd > 100 || etd < eta) {
         Serial.println("[WARNING] Invalid ETD, using estimate");
         etd = estimateETD(eta, speed_12);
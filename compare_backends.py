@@ -0,0 +1,136 @@
+"""
+Compare regressor backends for ETA/ETD on the training split
+Random forest, extra-trees, histogram gradient boosting, linear model on physics residuals and the physics estimate
+Usage: python compare_backends.py [--backends random_forest,physics,...]
+"""
+
+import yaml
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+from utils.logger import Logger
+from utils.backends import BACKENDS, make_backend
+from train_models import ModelTrainer, SEARCH_PARAMS
+
+
+class BackendComparison:
+    def __init__(self, config_path='config.yaml'):
+        with open(config_path) as f:
+            self.config = yaml.safe_load(f)
+        self.settings = self.config['model'].get('backends', {})
+        self.random_state = self.config['model']['random_state']
+        
+        self.output_dir = Path('outputs')
+        self.trainer = ModelTrainer(config_path)
+    
+    def backend_params(self, backend, name):
+        """Configured parameters of a backend; the random forest reuses the trained model's settings"""
+        if backend == 'random_forest':
+            return {param: self.config['model'][f'{name}_{param}'] for param in SEARCH_PARAMS}
+        return self.settings.get(backend) or {}
+    
+    @staticmethod
+    def single_row_latency(backend, X, physics, n_rows=2000):
+        """p50 and p99 of single-row prediction in microseconds"""
+        rows = X[:n_rows].tolist()
+        estimates = physics[:n_rows].tolist()
+        timings = np.empty(len(rows))
+        for i, (x, estimate) in enumerate(zip(rows, estimates)):
+            start = perf_counter_ns()
+            backend.predict_one(x, estimate)
+            timings[i] = perf_counter_ns() - start
+        return np.percentile(timings, 50) / 1e3, np.percentile(timings, 99) / 1e3
+    
+    @staticmethod
+    def batch_throughput(backend, X, physics, repeats=3):
+        """Rows per second predicting the whole test set at once (best of repeats)"""
+        best = np.inf
+        for _ in range(repeats):
+            start = perf_counter()
+            backend.predict(X, physics)
+            best = min(best, perf_counter() - start)
+        return len(X) / best
+    
+    @staticmethod
+    def pareto_mask(results, objectives=('test_mae', 'single_p50_us', 'bytes')):
+        """Backends no other backend matches or beats on every objective while beating it on one"""
+        values = results[list(objectives)].to_numpy(dtype=float)
+        dominated = [np.any(np.all(values <= row, axis=1) & np.any(values < row, axis=1)) for row in values]
+        return ~np.array(dominated)
+    
+    def compare_target(self, name, features_df, backends):
+        """Train and measure every backend for one target"""
+        Logger.section(f"Comparing backends for {name.upper()}")
+        X_train, X_test, y_train, y_test, _ = self.trainer.prepare_data(features_df, f'{name}_actual')
+        physics_train = features_df.loc[X_train.index, f'{name}_physics'].to_numpy()
+        physics_test = features_df.loc[X_test.index, f'{name}_physics'].to_numpy()
+        X_train = X_train.to_numpy(dtype=np.float32)
+        X_test = X_test.to_numpy(dtype=np.float32)
+        y_train = y_train.to_numpy()
+        y_test = y_test.to_numpy()
+        
+        rows = []
+        for backend_name in backends:
+            backend = make_backend(backend_name, self.backend_params(backend_name, name), self.random_state,
+                                   self.trainer.n_jobs)
+            start = perf_counter()
+            backend.fit(X_train, y_train, physics_train)
+            fit_seconds = perf_counter() - start
+            
+            predictions = backend.predict(X_test, physics_test)
+            p50, p99 = self.single_row_latency(backend, X_test, physics_test)
+            rows.append({
+                'model': name,
+                'backend': backend_name,
+                'test_mae': float(np.mean(np.abs(predictions - y_test))),
+                'single_p50_us': p50,
+                'single_p99_us': p99,
+                'batch_rows_per_s': self.batch_throughput(backend, X_test, physics_test),
+                'bytes': backend.serialized_bytes(),
+                'fit_seconds': fit_seconds
+            })
+        
+        results = pd.DataFrame(rows)
+        results['pareto'] = self.pareto_mask(results)
+        
+        Logger.log(f"Split: {len(X_train)} train, {len(X_test)} test")
+        Logger.log(f"\n{'backend':<24}{'MAE':>8}{'p50 us':>9}{'p99 us':>9}{'rows/s':>12}{'bytes':>10}{'fit s':>8}")
+        for row in results.sort_values('test_mae').itertuples():
+            Logger.log(f"{row.backend:<24}{row.test_mae:>8.4f}{row.single_p50_us:>9.1f}{row.single_p99_us:>9.1f}"
+                       f"{row.batch_rows_per_s:>12.0f}{row.bytes:>10}{row.fit_seconds:>8.2f}"
+                       f"{'  (pareto)' if row.pareto else ''}")
+        
+        return results
+    
+    def run(self, backends=None):
+        """Compare the backends on both targets and save the report"""
+        backends = list(backends or self.settings or BACKENDS)
+        for backend in backends:
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown backend '{backend}', expected one of {tuple(BACKENDS)}")
+        
+        features_df = self.trainer.load_features()
+        if features_df is None:
+            return None
+        
+        results = pd.concat([self.compare_target(name, features_df, backends) for name in ('eta', 'etd')],
+                            ignore_index=True)
+        results_path = self.output_dir / 'backends.csv'
+        results.to_csv(results_path, index=False)
+        Logger.log("\nPareto: lowest test MAE, p50 single-row latency and bytes with nothing better on all three")
+        Logger.log(f"Saved: {results_path}")
+        
+        return results
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Compare regressor backends')
+    parser.add_argument('--backends', help=f"Comma-separated subset of {','.join(BACKENDS)} (default: model.backends)")
+    parser.add_argument('--config', default='config.yaml', help='Config file path')
+    args = parser.parse_args()
+    
+    comparison = BackendComparison(args.config)
+    comparison.run(args.backends.split(',') if args.backends else None)
@@ -0,0 +1,196 @@
+"""
+Compile the trained Random Forests into flat array forests for fast inference
+Writes the outputs/eta_model/ and outputs/etd_model/ artifacts (and shared_model/) from the pickles
+Usage: python compile_models.py [--verify] [--benchmark]
+"""
+
+import subprocess
+import sys
+import yaml
+import numpy as np
+from pathlib import Path
+from time import perf_counter
+from utils.logger import Logger
+from utils.forest import FlatForest
+from train_models import ModelTrainer
+
+
+MODELS = ('eta', 'etd')
+
+COLD_START_PICKLE = """
+import pickle, sys
+import numpy as np
+with open(sys.argv[1], 'rb') as f:
+    model = pickle.load(f)['model']
+model.predict(np.zeros((1, model.n_features_in_)))
+"""
+
+COLD_START_ARTIFACT = """
+import sys
+from utils.forest import FlatForest
+forest = FlatForest.load(sys.argv[1])
+forest.predict_one([0.0] * forest.n_features)
+"""
+
+
+class ModelCompiler:
+    def __init__(self, config_path='config.yaml'):
+        with open(config_path) as f:
+            self.config = yaml.safe_load(f)
+        self.config_path = config_path
+        self.output_dir = Path('outputs')
+        self.trainer = ModelTrainer(config_path)
+    
+    def load_model_data(self, name):
+        """Load a pickled model dict (model, metrics, config), or None if it has not been trained"""
+        return self.trainer.load_model_data(name)
+    
+    def load_model(self, name):
+        """Load a pickled sklearn forest, or None if it has not been trained"""
+        model_data = self.load_model_data(name)
+        return None if model_data is None else model_data['model']
+    
+    def targets(self, name, metrics):
+        """Target columns of a model's outputs"""
+        if name != 'shared':
+            return [f'{name}_actual']
+        return ['eta_actual', 'etd_actual - eta_actual' if metrics.get('target') == 'residual' else 'etd_actual']
+    
+    def compile(self):
+        """Pack the pickled forests into flat artifacts (re-creates them for pickles from older versions)"""
+        Logger.section("Compiling Random Forests to flat arrays")
+        
+        forests = {}
+        # The shared multi-output model is compiled too when train_models.py produced one
+        shared = ('shared',) if (self.output_dir / 'shared_model.pkl').exists() else ()
+        for name in MODELS + shared:
+            model_data = self.load_model_data(name)
+            if model_data is None:
+                return None
+            
+            metadata = self.trainer.artifact_metadata(model_data['metrics'], self.targets(name, model_data['metrics']),
+                                                      model_data.get('sklearn_version'))
+            forest_path = FlatForest.from_sklearn(model_data['model']).save(self.output_dir / f'{name}_model', **metadata)
+            
+            # Everything below runs on the artifact as loaded from disk
+            forest = FlatForest.load(forest_path)
+            Logger.log(f"{name.upper()}: {forest.n_trees} trees, {forest.n_nodes} nodes, depth {forest.max_depth}")
+            Logger.log(f"Saved: {forest_path}/")
+            forests[name] = forest
+        
+        return forests
+    
+    def load_X(self):
+        """Stored feature columns in training order, or None if they are missing"""
+        features = self.trainer.load_features()
+        if features is None:
+            return None
+        return features[list(ModelTrainer.FEATURE_COLS)].astype(np.float32)
+    
+    def verify(self, forests):
+        """Check the flat forests reproduce sklearn's predictions exactly"""
+        Logger.section("Verifying against sklearn")
+        X = self.load_X()
+        if X is None:
+            return False
+        
+        ok = True
+        for name, forest in forests.items():
+            model = self.load_model(name)
+            # Single-threaded so sklearn also sums trees in order
+            model.set_params(n_jobs=1)
+            expected = model.predict(X)
+            
+            batch = forest.predict(X)
+            single = np.array([forest.predict_one(x) for x in X.to_numpy()[:1000]])
+            batch_diff = np.abs(batch - expected).max()
+            single_diff = np.abs(single - expected[:1000]).max()
+            
+            match = batch_diff == 0 and single_diff == 0
+            ok &= match
+            Logger.log(f"{name.upper()}: {len(X)} rows batch max diff {batch_diff:.3g}, "
+                       f"{len(single)} rows single max diff {single_diff:.3g} -> {'OK' if match else 'MISMATCH'}")
+        
+        return ok
+    
+    @staticmethod
+    def time_call(fn, *args):
+        """Wall time of one call in seconds"""
+        start = perf_counter()
+        fn(*args)
+        return perf_counter() - start
+    
+    @staticmethod
+    def cold_start(snippet, path):
+        """Run a load-and-predict snippet in a new Python process"""
+        subprocess.run([sys.executable, '-c', snippet, str(path)], check=True)
+    
+    def benchmark(self, forests, n_single=2000, batch_sizes=(1000, 100000), repeats=3):
+        """Latency of single-row and batch prediction, sklearn vs flat arrays"""
+        Logger.section("Benchmarking prediction latency")
+        X = self.load_X()
+        if X is None:
+            return None
+        
+        results = {}
+        for name, forest in forests.items():
+            # Cold start: a fresh interpreter loading the model and predicting one row
+            pickle_start = min(self.time_call(self.cold_start, COLD_START_PICKLE, self.output_dir / f'{name}_model.pkl')
+                               for _ in range(repeats))
+            artifact_start = min(self.time_call(self.cold_start, COLD_START_ARTIFACT, self.output_dir / f'{name}_model')
+                                 for _ in range(repeats))
+            artifact_load = min(self.time_call(FlatForest.load, self.output_dir / f'{name}_model') for _ in range(repeats))
+            Logger.log(f"{name.upper()} cold start: pickle + sklearn {pickle_start * 1e3:.0f}ms, "
+                       f"artifact {artifact_start * 1e3:.0f}ms (load alone {artifact_load * 1e3:.2f}ms)")
+            
+            model = self.load_model(name)
+            model.set_params(n_jobs=1)
+            rows = X.to_numpy()[:n_single]
+            
+            start = perf_counter()
+            for i in range(200):
+                model.predict(X.iloc[i:i + 1])
+            sklearn_single = (perf_counter() - start) / 200
+            
+            start = perf_counter()
+            for x in rows:
+                forest.predict_one(x)
+            flat_single = (perf_counter() - start) / len(rows)
+            
+            Logger.log(f"{name.upper()} single row: sklearn {sklearn_single * 1e6:.1f}us, "
+                       f"flat {flat_single * 1e6:.1f}us ({sklearn_single / flat_single:.0f}x)")
+            results[name] = {'cold_start_pickle_s': pickle_start, 'cold_start_artifact_s': artifact_start,
+                             'load_artifact_s': artifact_load,
+                             'single_sklearn_s': sklearn_single, 'single_flat_s': flat_single}
+            
+            for batch_size in batch_sizes:
+                batch = X.iloc[np.arange(batch_size) % len(X)]
+                values = batch.to_numpy()
+                sklearn_batch = min(self.time_call(model.predict, batch) for _ in range(repeats))
+                flat_batch = min(self.time_call(forest.predict, values) for _ in range(repeats))
+                
+                Logger.log(f"{name.upper()} batch of {batch_size}: sklearn {sklearn_batch * 1e3:.2f}ms, "
+                           f"flat {flat_batch * 1e3:.2f}ms ({sklearn_batch / flat_batch:.1f}x)")
+                results[name][f'batch_{batch_size}_sklearn_s'] = sklearn_batch
+                results[name][f'batch_{batch_size}_flat_s'] = flat_batch
+        
+        return results
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Compile trained forests to flat arrays')
+    parser.add_argument('--verify', action='store_true', help='Check predictions match sklearn exactly')
+    parser.add_argument('--benchmark', action='store_true', help='Compare single-row and batch latency with sklearn')
+    parser.add_argument('--config', default='config.yaml', help='Config file path')
+    args = parser.parse_args()
+    
+    compiler = ModelCompiler(args.config)
+    forests = compiler.compile()
+    if forests is None:
+        sys.exit(1)
+    if args.verify and not compiler.verify(forests):
+        sys.exit(1)
+    if args.benchmark:
+        compiler.benchmark(forests)
@@ -0,0 +1,196 @@
+"""
+Compress the trained ETA/ETD forests and map accuracy against model size
+Prunes trees, merges near-identical leaves and distills into small trees on synthetic samples
+Usage: python compress_models.py
+"""
+
+import itertools
+import yaml
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from time import perf_counter
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.tree import DecisionTreeRegressor
+from utils.logger import Logger
+from utils.forest import FlatForest, NODE_BYTES
+from train_models import ModelTrainer
+
+
+class ModelCompressor:
+    def __init__(self, config_path='config.yaml'):
+        with open(config_path) as f:
+            self.config = yaml.safe_load(f)
+        self.config_path = config_path
+        self.settings = self.config['model'].get('compression', {})
+        self.random_state = self.config['model']['random_state']
+        
+        self.output_dir = Path('outputs')
+        self.trainer = ModelTrainer(config_path)
+    
+    def load_forest(self, name):
+        """Trained forest as flat arrays, or None if it has not been trained"""
+        forest = FlatForest.load_trained(self.output_dir, name)
+        if forest is None:
+            Logger.log(f"ERROR: Model not found: {self.output_dir / f'{name}_model'}")
+            Logger.log("Run: python train_models.py")
+        return forest
+    
+    def pruned(self, forest):
+        """Fewer trees and/or shallower trees"""
+        tree_counts = [n for n in self.settings.get('tree_counts', [1, 2, 3, 5]) if n < forest.n_trees] + [forest.n_trees]
+        depths = [d for d in self.settings.get('depths', [3, 4, 5, 6, 8]) if d < forest.max_depth] + [None]
+        
+        for n_trees, depth in itertools.product(tree_counts, depths):
+            if n_trees == forest.n_trees and depth is None:
+                yield 'full', 'original forest', forest
+            else:
+                yield 'prune', f'trees={n_trees} depth={depth or forest.max_depth}', forest.compress(n_trees, depth)
+    
+    def merged(self, forest):
+        """Subtrees whose leaves agree within a tolerance collapsed into one leaf"""
+        for tolerance in self.settings.get('merge_tolerances', [0.01, 0.02, 0.05, 0.1]):
+            yield 'merge', f'tolerance={tolerance}s', forest.compress(merge_tolerance=tolerance)
+    
+    def synthetic_samples(self, X_train):
+        """Training rows jittered by a fraction of each feature's spread, for the teacher to label"""
+        rng = np.random.default_rng(self.random_state)
+        n = self.settings.get('distill_samples', 50000)
+        noise = self.settings.get('distill_noise', 0.05)
+        
+        X = X_train[rng.integers(len(X_train), size=n)]
+        X = X + rng.normal(size=X.shape) * (noise * X_train.std(axis=0))
+        return np.vstack([X_train, X]).astype(np.float32)
+    
+    def distilled(self, forest, X_train):
+        """Single trees or small forests fit to the forest's predictions on dense synthetic samples"""
+        X = self.synthetic_samples(X_train)
+        y = forest.predict(X)
+        
+        for n_trees, depth in itertools.product(self.settings.get('distill_trees', [1, 3]),
+                                                self.settings.get('distill_depths', [4, 6, 8, 10, 12])):
+            if n_trees == 1:
+                student = DecisionTreeRegressor(max_depth=depth, min_samples_leaf=5, random_state=self.random_state)
+            else:
+                student = RandomForestRegressor(n_estimators=n_trees, max_depth=depth, min_samples_leaf=5,
+                                                random_state=self.random_state, n_jobs=self.trainer.n_jobs)
+            student.fit(X, y)
+            yield 'distill', f'trees={n_trees} depth={depth}', FlatForest.from_sklearn(student)
+    
+    def evaluate(self, forest, X_test, y_test, n_single=200):
+        """Test MAE, size and prediction latency of one candidate"""
+        start = perf_counter()
+        for x in X_test[:n_single]:
+            forest.predict_one(x)
+        single = (perf_counter() - start) / min(n_single, len(X_test))
+        
+        start = perf_counter()
+        predictions = forest.predict(X_test)
+        batch = (perf_counter() - start) / len(X_test)
+        
+        return {
+            'n_trees': forest.n_trees,
+            'max_depth': forest.max_depth,
+            'n_nodes': forest.n_nodes,
+            'flash_bytes': forest.n_nodes * NODE_BYTES + 2 * forest.n_trees,
+            'test_mae': float(np.mean(np.abs(predictions - y_test))),
+            'single_us': single * 1e6,
+            'batch_us_per_row': batch * 1e6
+        }
+    
+    @staticmethod
+    def pareto_mask(results):
+        """Candidates no other candidate beats on both size and MAE"""
+        order = results.sort_values(['flash_bytes', 'test_mae']).index
+        mask = pd.Series(False, index=results.index)
+        best = np.inf
+        for i in order:
+            if results.at[i, 'test_mae'] < best:
+                mask[i] = True
+                best = results.at[i, 'test_mae']
+        return mask
+    
+    def compress_model(self, name, features_df):
+        """Evaluate every candidate for one target and save the smallest acceptable one"""
+        Logger.section(f"Compressing {name.upper()} forest")
+        forest = self.load_forest(name)
+        if forest is None:
+            return None
+        
+        # Score on the rows the forest never saw, under the split it was trained with
+        split = forest.header.get('metrics', {}).get('split', 'rows')
+        X_train, X_test, y_train, y_test, _ = self.trainer.split_data(features_df, f'{name}_actual', split)
+        physics = float(np.mean(np.abs(y_test - features_df.loc[y_test.index, f'{name}_physics'])))
+        X_train = X_train.to_numpy(dtype=np.float32)
+        X_test = X_test.to_numpy(dtype=np.float32)
+        y_test = y_test.to_numpy()
+        
+        candidates = itertools.chain(self.pruned(forest), self.merged(forest), self.distilled(forest, X_train))
+        rows, models = [], []
+        for method, params, candidate in candidates:
+            rows.append(dict(model=name, method=method, params=params, **self.evaluate(candidate, X_test, y_test)))
+            models.append(candidate)
+        
+        results = pd.DataFrame(rows)
+        results['beats_physics'] = results['test_mae'] < physics
+        results['pareto'] = self.pareto_mask(results)
+        
+        # Smallest Pareto model within max_mae_ratio of the full forest that still beats physics
+        full_mae = results.loc[results['method'] == 'full', 'test_mae'].iloc[0]
+        limit = full_mae * self.settings.get('max_mae_ratio', 1.5)
+        acceptable = results[results['pareto'] & (results['test_mae'] <= limit) & results['beats_physics']]
+        selected = acceptable['flash_bytes'].idxmin() if len(acceptable) else None
+        results['selected'] = results.index == selected
+        
+        compact_path = self.output_dir / f'{name}_model_compact'
+        if selected is not None:
+            metrics = results.loc[selected].to_dict()
+            metrics['physics_baseline'] = physics
+            metadata = self.trainer.artifact_metadata(metrics, [f'{name}_actual'],
+                                                      forest.header.get('sklearn_version'))
+            models[selected].save(compact_path, **metadata)
+        
+        Logger.log(f"Physics baseline: {physics:.3f}s, full forest: {full_mae:.3f}s ({len(results)} candidates, "
+                   f"{split} split)")
+        Logger.log(f"\n{'method':<9}{'params':<24}{'nodes':>7}{'bytes':>8}{'MAE':>8}{'1 row us':>10}{'us/row':>8}")
+        for row in results[results['pareto']].sort_values('flash_bytes').itertuples():
+            marker = '  <- selected' if row.selected else ('' if row.beats_physics else '  (worse than physics)')
+            Logger.log(f"{row.method:<9}{row.params:<24}{row.n_nodes:>7}{row.flash_bytes:>8}{row.test_mae:>8.3f}"
+                       f"{row.single_us:>10.1f}{row.batch_us_per_row:>8.2f}{marker}")
+        if selected is None:
+            Logger.log(f"No candidate within {limit:.3f}s MAE that beats physics, not saving {compact_path}/")
+            # An earlier run's compact model no longer matches this forest, so export must not pick it up
+            if FlatForest.remove(compact_path):
+                Logger.log(f"Removed stale: {compact_path}/")
+        else:
+            Logger.log(f"Saved: {compact_path}/ (flat forest directory)")
+        
+        return results
+    
+    def run(self):
+        """Compress both forests and save the Pareto table"""
+        features_df = self.trainer.load_features()
+        if features_df is None:
+            return None
+        
+        results = [self.compress_model(name, features_df) for name in ('eta', 'etd')]
+        if any(r is None for r in results):
+            return None
+        
+        results = pd.concat(results, ignore_index=True)
+        results_path = self.output_dir / 'compression.csv'
+        results.to_csv(results_path, index=False)
+        Logger.log(f"\nSaved: {results_path}")
+        
+        return results
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Compress trained forests')
+    parser.add_argument('--config', default='config.yaml', help='Config file path')
+    args = parser.parse_args()
+    
+    compressor = ModelCompressor(args.config)
+    compressor.run()
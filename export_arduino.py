@@ -3,16 +3,64 @@ Export models and configuration to Arduino C headers
 Usage: python export_arduino.py
 """
 
-import pickle
 import yaml
+import numpy as np
 from pathlib import Path
 from utils.logger import Logger
+from utils.forest import FlatForest, QuantizedForest, FEATURE_COLS, feature_scale, NODE_BYTES, MAX_NODES
+
+
+def c_float(value):
+    """C float literal that reads back to the same float32"""
+    return f"{float(np.float32(value))!r}f"
+
+
+# Demo-unit sanity fallback used by the sketch when a prediction is out of range
+ESTIMATE_ETD = """float estimateETD(float eta, float last_speed) {
+    if (eta <= 0 || last_speed <= 0) return -1;
+    
+    float crossing_time = TRAIN_LENGTH / last_speed;
+    return eta + crossing_time;
+}
+"""
+
+
+# Kinematic fallback in demo units: measured speed/acceleration and the real sensor-to-crossing distance
+PHYSICS_FUNCTIONS = """float physicsETA(float speed, float accel, float distance) {
+    if (speed <= 0 || distance <= 0) return -1;
+    
+    if (accel > -0.1 && accel < 0.1) {
+        return distance / speed;
+    }
+    
+    float discriminant = speed * speed + 2.0 * accel * distance;
+    
+    if (discriminant < 0) {
+        return distance / speed;
+    }
+    
+    float t = (-speed + sqrt(discriminant)) / accel;
+    
+    if (t > 0 && t < 1000) {
+        return t;
+    }
+    
+    return distance / speed;
+}
+
+float physicsETD(float speed, float accel, float distance, float train_length) {
+    if (train_length <= 0) return -1;
+    return physicsETA(speed, accel, distance + train_length);
+}
+
+""" + ESTIMATE_ETD
 
 
 class ArduinoExporter:
     def __init__(self, config_path='config.yaml'):
         with open(config_path) as f:
             self.config = yaml.safe_load(f)
+        self.config_path = config_path
         
         self.hardware_dir = Path('arduino')
         self.hardware_dir.mkdir(parents=True, exist_ok=True)
@@ -48,6 +96,7 @@ class ArduinoExporter:
 #define CROSSING_TO_INTERSECTION {demo['crossing_to_intersection']}f
 
 #define EXPECTED_HAND_SPEED {demo['expected_hand_speed']}f
+#define TRAIN_LENGTH {demo['train_length']}f
 
 #endif
 """
@@ -64,111 +113,304 @@ class ArduinoExporter:
         Logger.log(f"  Train length: {demo['train_length']}m ({demo['train_length']*100:.0f}cm)")
         Logger.log(f"  Expected speed: {demo['expected_hand_speed']}m/s ({demo['expected_hand_speed']*100:.0f}cm/s)")
     
-    def export_model(self):
-        """Export ML model functions"""
-        Logger.section("Exporting ML model")
+    def model_geometry(self):
+        """Training sensor layout plus the mapping from demo units to model units"""
+        sensors = self.config['sensors']
+        demo = self.config['demo']
+        settings = self.config.get('arduino', {})
         
-        eta_path = self.output_dir / 'eta_model.pkl'
-        etd_path = self.output_dir / 'etd_model.pkl'
+        # Demo metres -> training metres, from the sensor spacing
+        distance_scale = (sensors['s1'] - sensors['s0']) / demo['sensor_spacing']
+        time_scale = settings.get('time_scale')
+        if time_scale is None:
+            # Map the expected hand speed onto the middle of the training speed ranges
+            speeds = [np.mean(s['speed']) for s in self.config['training']['scenarios'].values()]
+            time_scale = demo['expected_hand_speed'] * distance_scale / float(np.mean(speeds))
         
-        if eta_path.exists() and etd_path.exists():
-            Logger.log("Found trained Random Forest models")
-            Logger.log("NOTE: Full models too large for Arduino Uno")
-            Logger.log("Generating physics-based fallback")
-        else:
-            Logger.log("No trained models found")
-            Logger.log("Generating physics-based predictions")
-        
-        header = """#ifndef MODEL_H
-#define MODEL_H
-
-#define FEAT_TIME_01 0
-#define FEAT_TIME_12 1
-#define FEAT_SPEED_01 2
-#define FEAT_SPEED_12 3
-#define FEAT_ACCEL 4
-#define FEAT_DISTANCE 5
-
-#define FEAT_ETD_TIME_01 0
-#define FEAT_ETD_TIME_12 1
-#define FEAT_ETD_SPEED_01 2
-#define FEAT_ETD_SPEED_12 3
-#define FEAT_ETD_ACCEL 4
-#define FEAT_ETD_DISTANCE 5
-#define FEAT_ETD_TRAIN_LENGTH 6
-
-float predictETA(float features[6]) {
-    float speed = features[FEAT_SPEED_12];
-    float accel = features[FEAT_ACCEL];
-    float distance = features[FEAT_DISTANCE];
+        return {
+            's0': float(sensors['s0']),
+            's1': float(sensors['s1']),
+            's2': float(sensors['s2']),
+            'crossing': float(sensors['crossing']),
+            'time_scale': float(time_scale),
+            'train_length': float(demo['train_length'] * distance_scale),
+            # Demo sensors are equally spaced, so the training gaps must be too and the crossing gap must scale
+            'proportional': bool(np.isclose(sensors['s2'] - sensors['s1'], sensors['s1'] - sensors['s0'])
+                                 and np.isclose((sensors['crossing'] - sensors['s2']) * demo['sensor_spacing'],
+                                                demo['last_sensor_to_crossing'] * (sensors['s1'] - sensors['s0'])))
+        }
     
-    if (speed <= 0 || distance <= 0) return -1;
-    
-    if (accel > -0.1 && accel < 0.1) {
-        return distance / speed;
-    }
+    def unmappable_geometry(self, geometry):
+        """Reasons the demo layout cannot be expressed in training units (empty if it can)"""
+        reasons = []
+        demo = self.config['demo']
+        if not geometry['proportional']:
+            sensors = self.config['sensors']
+            reasons.append(f"sensors {demo['sensor_spacing']}m apart and {demo['last_sensor_to_crossing']}m before the "
+                           f"crossing are not a scaled copy of the training layout "
+                           f"({sensors['s0']}/{sensors['s1']}/{sensors['s2']}/{sensors['crossing']}m)")
+        lengths = self.config['training']['train_lengths']
+        if not min(lengths) <= geometry['train_length'] <= max(lengths):
+            reasons.append(f"train length maps to {geometry['train_length']:.0f}m, outside the training lengths {lengths}")
+        return reasons
     
-    float discriminant = speed * speed + 2.0 * accel * distance;
+    def firmware_features(self, time_01, time_12, train_length):
+        """Mirror of computeFeatures() in sketch.ino: the 14 features from three trigger timestamps"""
+        geometry = self.model_geometry()
+        f32 = np.float32
+        time_01 = np.asarray(time_01, dtype=f32)
+        time_12 = np.asarray(time_12, dtype=f32)
+        
+        distance_01 = f32(geometry['s1']) - f32(geometry['s0'])
+        distance_12 = f32(geometry['s2']) - f32(geometry['s1'])
+        distance_remaining = f32(geometry['crossing']) - f32(geometry['s2'])
+        
+        # Only timestamps are measured, so point speeds come from a constant-acceleration fit
+        avg_speed_01 = distance_01 / time_01
+        avg_speed_12 = distance_12 / time_12
+        accel = f32(2.0) * (avg_speed_12 - avg_speed_01) / (time_01 + time_12)
+        
+        speed_0 = avg_speed_01 - accel * time_01 / f32(2.0)
+        speed_1 = avg_speed_01 + accel * time_01 / f32(2.0)
+        speed_2 = avg_speed_12 + accel * time_12 / f32(2.0)
+        
+        accel_01 = (speed_1 - speed_0) / time_01
+        accel_12 = (speed_2 - speed_1) / time_12
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            time_to_crossing = np.where(speed_2 > 0, distance_remaining / speed_2, f32(0.0))
+        predicted_crossing_speed = np.clip(speed_2 + accel_12 * time_to_crossing, f32(5.0), f32(50.0))
+        
+        columns = {
+            'distance_remaining': np.full_like(time_01, distance_remaining),
+            'train_length': np.broadcast_to(np.asarray(train_length, dtype=f32), time_01.shape),
+            'last_speed': speed_2,
+            'speed_change': speed_2 - speed_0,
+            'time_01': time_01,
+            'time_12': time_12,
+            'avg_speed_01': avg_speed_01,
+            'avg_speed_12': avg_speed_12,
+            'speed_0': speed_0,
+            'speed_1': speed_1,
+            'accel_01': accel_01,
+            'accel_12': accel_12,
+            'accel_trend': accel_12 - accel_01,
+            'predicted_crossing_speed': predicted_crossing_speed
+        }
+        return np.column_stack([columns[name] for name in FEATURE_COLS]).astype(f32)
     
-    if (discriminant < 0) {
-        return distance / speed;
-    }
+    def load_forests(self, compact=False):
+        """Trained (or compress_models.py compact) ETA/ETD forests as flat arrays, or None if missing"""
+        forests = {}
+        for name in ('eta', 'etd'):
+            if compact:
+                path = self.output_dir / f'{name}_model_compact'
+                forests[name] = FlatForest.load(path) if path.exists() else None
+            else:
+                forests[name] = FlatForest.load_trained(self.output_dir, name)
+            if forests[name] is None:
+                return None
+        return forests
     
-    float t = (-speed + sqrt(discriminant)) / accel;
+    def report_accuracy(self, forests, quantized):
+        """MAE of the float forests, the int16 tables, and the tables on firmware-computed features"""
+        # Only needed for the accuracy report, so the training stack loads lazily
+        from train_models import ModelTrainer
+        features = ModelTrainer(self.config_path).load_features()
+        if features is None:
+            return
+        
+        X = features[FEATURE_COLS].to_numpy(dtype=np.float32)
+        X_firmware = self.firmware_features(features['time_01'], features['time_12'], features['train_length'])
+        
+        Logger.log(f"Accuracy on {len(features)} stored runs (MAE):")
+        for name, forest in forests.items():
+            actual = features[f'{name}_actual'].to_numpy()
+            Logger.log(f"  {name.upper()}: float {np.mean(np.abs(forest.predict(X) - actual)):.3f}s, "
+                       f"int16 {np.mean(np.abs(quantized[name].predict(X) - actual)):.3f}s, "
+                       f"int16 + firmware features {np.mean(np.abs(quantized[name].predict(X_firmware) - actual)):.3f}s")
     
-    if (t > 0 && t < 1000) {
-        return t;
-    }
+    def feature_defines(self):
+        """Feature index defines (training column order) and model-unit geometry"""
+        geometry = self.model_geometry()
+        lines = [f"#define NUM_FEATURES {len(FEATURE_COLS)}", ""]
+        lines += [f"#define FEAT_{name.upper()} {i}" for i, name in enumerate(FEATURE_COLS)]
+        lines += [
+            "",
+            "// Features are computed in the training layout; demo seconds are scaled to model seconds",
+            f"#define MODEL_S0_POS {c_float(geometry['s0'])}",
+            f"#define MODEL_S1_POS {c_float(geometry['s1'])}",
+            f"#define MODEL_S2_POS {c_float(geometry['s2'])}",
+            f"#define MODEL_CROSSING_POS {c_float(geometry['crossing'])}",
+            f"#define MODEL_TIME_SCALE {c_float(geometry['time_scale'])}",
+            f"#define MODEL_TRAIN_LENGTH {c_float(geometry['train_length'])}"
+        ]
+        return "\n".join(lines)
     
-    return distance / speed;
-}
+    def physics_header(self):
+        """model.h with kinematic predictions in demo units"""
+        return f"""#ifndef MODEL_H
+#define MODEL_H
 
-float predictETD(float features[7]) {
-    float speed = features[FEAT_ETD_SPEED_12];
-    float accel = features[FEAT_ETD_ACCEL];
-    float distance = features[FEAT_ETD_DISTANCE];
-    float train_length = features[FEAT_ETD_TRAIN_LENGTH];
-    
-    if (speed <= 0 || distance <= 0 || train_length <= 0) return -1;
-    
-    float total_distance = distance + train_length;
-    
-    if (accel > -0.1 && accel < 0.1) {
-        return total_distance / speed;
-    }
-    
-    float discriminant = speed * speed + 2.0 * accel * total_distance;
-    
-    if (discriminant < 0) {
-        return total_distance / speed;
-    }
-    
-    float t = (-speed + sqrt(discriminant)) / accel;
-    
-    if (t > 0 && t < 1000) {
-        return t;
-    }
+#include "thresholds.h"
+
+{self.feature_defines()}
+
+#define MODEL_IS_FOREST 0
+
+{PHYSICS_FUNCTIONS}
+#endif
+"""
+
+    def forest_table(self, prefix, forest):
+        """PROGMEM roots and node table of one quantized forest"""
+        nodes = [f"{{{f}, {v}, {r}}}" for f, v, r in zip(forest.feature.tolist(), forest.value.tolist(), forest.right.tolist())]
+        rows = [", ".join(nodes[i:i + 8]) for i in range(0, len(nodes), 8)]
+        roots = ", ".join(str(r) for r in forest.roots.tolist())
+        
+        return f"""// {prefix} forest: {forest.n_trees} trees, {forest.n_nodes} nodes, {forest.flash_bytes} bytes
+#define {prefix}_N_TREES {forest.n_trees}
+#define {prefix}_VALUE_OFFSET {c_float(forest.value_offset)}
+#define {prefix}_VALUE_STEP {c_float(forest.value_step)}
+
+const uint16_t {prefix}_ROOTS[{prefix}_N_TREES] PROGMEM = {{{roots}}};
+
+const ForestNode {prefix}_NODES[{forest.n_nodes}] PROGMEM = {{
+    """ + ",\n    ".join(rows) + "\n};\n"
     
-    return total_distance / speed;
-}
+    def forest_header(self, quantized, offset, step):
+        """model.h with both forests as PROGMEM tables and an iterative traversal"""
+        offsets = ", ".join(c_float(v) for v in offset)
+        steps = ", ".join(c_float(v) for v in step)
+        
+        return f"""#ifndef MODEL_H
+#define MODEL_H
+
+#include <avr/pgmspace.h>
+#include "thresholds.h"
+
+{self.feature_defines()}
+
+#define MODEL_IS_FOREST 1
+#define FOREST_LEAF 0xFF
 
-float estimateETD(float eta, float last_speed) {
-    const float AVG_TRAIN_LENGTH = 0.15f;
+// Preorder layout: the left child of node i is i + 1; leaves hold their value instead of a threshold
+struct ForestNode {{
+    uint8_t feature;
+    int16_t value;
+    uint16_t right;
+}} __attribute__((packed));
+
+// int16 feature = floor((x - offset) / step), the same scale the thresholds were quantized with
+const float FEATURE_OFFSET[NUM_FEATURES] PROGMEM = {{{offsets}}};
+const float FEATURE_STEP[NUM_FEATURES] PROGMEM = {{{steps}}};
+
+{self.forest_table('ETA', quantized['eta'])}
+{self.forest_table('ETD', quantized['etd'])}
+void quantizeFeatures(const float *features, int16_t *qx) {{
+    for (uint8_t f = 0; f < NUM_FEATURES; f++) {{
+        float q = floor((features[f] - pgm_read_float(&FEATURE_OFFSET[f])) / pgm_read_float(&FEATURE_STEP[f]));
+        if (q < -32768.0f) q = -32768.0f;
+        if (q > 32767.0f) q = 32767.0f;
+        qx[f] = (int16_t)q;
+    }}
+}}
+
+float predictForest(const ForestNode *nodes, const uint16_t *roots, uint8_t n_trees,
+                    const int16_t *qx, float value_offset, float value_step) {{
+    int32_t total = 0;
     
-    if (eta <= 0 || last_speed <= 0) return -1;
+    for (uint8_t t = 0; t < n_trees; t++) {{
+        uint16_t i = pgm_read_word(&roots[t]);
+        uint8_t feature;
+        
+        while ((feature = pgm_read_byte(&nodes[i].feature)) != FOREST_LEAF) {{
+            int16_t threshold = (int16_t)pgm_read_word(&nodes[i].value);
+            i = (qx[feature] <= threshold) ? i + 1 : pgm_read_word(&nodes[i].right);
+        }}
+        total += (int16_t)pgm_read_word(&nodes[i].value);
+    }}
     
-    float crossing_time = AVG_TRAIN_LENGTH / last_speed;
-    return eta + crossing_time;
-}
+    return value_offset + value_step * ((float)total / n_trees);
+}}
 
+float predictETA(const float *features) {{
+    int16_t qx[NUM_FEATURES];
+    quantizeFeatures(features, qx);
+    return predictForest(ETA_NODES, ETA_ROOTS, ETA_N_TREES, qx, ETA_VALUE_OFFSET, ETA_VALUE_STEP);
+}}
+
+float predictETD(const float *features) {{
+    int16_t qx[NUM_FEATURES];
+    quantizeFeatures(features, qx);
+    return predictForest(ETD_NODES, ETD_ROOTS, ETD_N_TREES, qx, ETD_VALUE_OFFSET, ETD_VALUE_STEP);
+}}
+
+{ESTIMATE_ETD}
 #endif
 """
+
+    def export_model(self):
+        """Export the trained forests as PROGMEM tables, or the physics fallback"""
+        Logger.section("Exporting ML model")
         
+        settings = self.config.get('arduino', {})
+        budget = settings.get('flash_budget', 20480)
+        over_budget = settings.get('over_budget', 'fallback')
         output_path = self.hardware_dir / 'model.h'
-        output_path.write_text(header)
+        
+        geometry = self.model_geometry()
+        Logger.log(f"Demo -> model units: 1s = {geometry['time_scale']:.2f} model s, "
+                   f"train length {geometry['train_length']:.0f}m")
+        # The forests only see the training layout, so the demo must be a scaled copy of it
+        unmappable = self.unmappable_geometry(geometry)
+        for reason in unmappable:
+            Logger.log(f"Demo cannot use the forests: {reason}")
+        
+        model = settings.get('model', 'forest')
+        forests = self.load_forests(compact=model == 'compact') if model != 'physics' and not unmappable else None
+        if forests is None:
+            if model == 'physics':
+                Logger.log("arduino.model is 'physics'")
+            elif model == 'compact' and not unmappable:
+                Logger.log(f"Compact models not found ({self.output_dir}/eta_model_compact/, etd_model_compact/)")
+                Logger.log("Run: python compress_models.py")
+            elif not unmappable:
+                Logger.log("No trained models found")
+            Logger.log("Generating physics-based predictions")
+            output_path.write_text(self.physics_header())
+            Logger.log(f"Saved: {output_path}")
+            return True
+        
+        offset, step = feature_scale(forests.values(), len(FEATURE_COLS))
+        
+        # Quantizing keeps every node, so the table sizes are known before building them
+        flash = sum(forest.n_nodes * NODE_BYTES + 2 * forest.n_trees for forest in forests.values()) + 8 * len(offset)
+        # Prediction only needs the feature array and its int16 copy on the stack; tables stay in flash
+        sram = 4 * len(offset) + 2 * len(offset) + 16
+        for name, forest in forests.items():
+            Logger.log(f"{name.upper()}: {forest.n_trees} trees, {forest.n_nodes} nodes, "
+                       f"{forest.n_nodes * NODE_BYTES + 2 * forest.n_trees} bytes ({NODE_BYTES} bytes/node)")
+        Logger.log(f"Flash: {flash} bytes of model tables (budget {budget}), SRAM: ~{sram} bytes of stack per prediction")
+        
+        too_large = flash > budget or max(forest.n_nodes for forest in forests.values()) > MAX_NODES
+        if too_large and over_budget == 'fail':
+            Logger.log(f"ERROR: Forests need {flash} bytes, over arduino.flash_budget ({budget}), "
+                       f"or more than {MAX_NODES} nodes")
+            return False
+        
+        if too_large:
+            Logger.log(f"WARNING: Forests exceed arduino.flash_budget ({budget} bytes) or {MAX_NODES} nodes")
+            Logger.log("Generating physics-based fallback")
+            output_path.write_text(self.physics_header())
+        else:
+            quantized = {name: QuantizedForest(forest, offset, step) for name, forest in forests.items()}
+            self.report_accuracy(forests, quantized)
+            output_path.write_text(self.forest_header(quantized, offset, step))
         
         Logger.log(f"Saved: {output_path}")
         Logger.log("  Functions: predictETA(), predictETD(), estimateETD()")
+        return True
     
     def export_config(self):
         """Export configuration helpers"""
@@ -213,7 +455,7 @@ inline unsigned long getDisplayUpdateInterval() {
 }
 
 inline float getDefaultTrainLength() {
-    return 0.15f;
+    return TRAIN_LENGTH;
 }
 
 // REVERSED: Servo moves up to close gate
@@ -235,7 +477,8 @@ inline float getDefaultTrainLength() {
         Logger.section("Exporting to Arduino")
         
         self.export_thresholds()
-        self.export_model()
+        if not self.export_model():
+            return False
         self.export_config()
         
         Logger.log("\nArduino export complete!")
@@ -243,6 +486,7 @@ inline float getDefaultTrainLength() {
         Logger.log(f"  {self.hardware_dir / 'model.h'}")
         Logger.log(f"  {self.hardware_dir / 'thresholds.h'}")
         Logger.log(f"  {self.hardware_dir / 'config.h'}")
+        return True
 
 
 if __name__ == '__main__':
@@ -253,4 +497,5 @@ if __name__ == '__main__':
     args = parser.parse_args()
     
     exporter = ArduinoExporter(args.config)
-    exporter.export_all()
\ No newline at end of file
+    if not exporter.export_all():
+        raise SystemExit(1)
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Sweep sensor layouts over stored training trajectories
+Re-extracts features and retrains the ETA/ETD forests per layout, no new SUMO runs
+Usage: python sweep_sensors.py [--workers N]
+"""
+
+import itertools
+import yaml
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.metrics import mean_absolute_error
+from utils.logger import Logger
+from train_data import TrainingDataGenerator
+from train_models import ModelTrainer
+
+
+_sweep = None
+
+
+def _init_worker(config_path, trajectories):
+    """Create a quiet per-process sweep holding the shared trajectories"""
+    global _sweep
+    Logger.set_verbose(False)
+    _sweep = SensorSweep(config_path)
+    _sweep.trajectories = trajectories
+
+
+def _evaluate_task(layout):
+    """Evaluate one layout in a pool worker"""
+    return _sweep.evaluate_layout(layout)
+
+
+class SensorSweep:
+    def __init__(self, config_path='config.yaml'):
+        with open(config_path) as f:
+            self.config = yaml.safe_load(f)
+        self.config_path = config_path
+        
+        self.output_dir = Path('outputs')
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Feature extraction only, so no SUMO is needed
+        self.generator = TrainingDataGenerator(config_path, backend='numpy')
+        self.trainer = ModelTrainer(config_path)
+        self.trainer.n_jobs = 1
+        self.trajectories = None
+    
+    def layouts(self):
+        """Sensor layouts from the sweep grid (the crossing stays where it is)"""
+        sensors = self.config['sensors']
+        grid = self.config.get('sweep', {})
+        values = [grid.get(name, [sensors[name]]) for name in ('s0', 's1', 's2')]
+        
+        return [
+            {'s0': s0, 's1': s1, 's2': s2, 'crossing': sensors['crossing']}
+            for s0, s1, s2 in itertools.product(*values)
+            if s0 < s1 < s2 < sensors['crossing']
+        ]
+    
+    def load_trajectories(self):
+        """Load the stored trajectories once (memory-mapped for the npy format)"""
+        mode = self.config['training'].get('retention', {}).get('mode', 'full')
+        if mode != 'full':
+            Logger.log(f"ERROR: Sweeping needs full trajectories, but training.retention.mode is '{mode}'")
+            return None
+        
+        path = self.generator.trajectories_path()
+        if not path.exists():
+            Logger.log(f"ERROR: Trajectories not found: {path}")
+            Logger.log("Run: python train_data.py")
+            return None
+        
+        return self.generator.load_trajectories()
+    
+    def evaluate_layout(self, layout):
+        """Re-extract features for one layout and train/evaluate both forests"""
+        self.generator.sensors = layout
+        features = self.generator.extract_features_batch(self.trajectories)
+        
+        row = dict(layout, n_samples=len(features))
+        for name, train in (('eta', self.trainer.train_eta_model), ('etd', self.trainer.train_etd_model)):
+            X_train, X_test, y_train, y_test, _ = self.trainer.prepare_data(features, f'{name}_actual')
+            model = train(X_train, y_train)
+            row[f'{name}_mae'] = float(mean_absolute_error(y_test, model.predict(X_test)))
+            row[f'{name}_physics_mae'] = float(np.mean(np.abs(features[f'{name}_actual'] - features[f'{name}_physics'])))
+        
+        return row
+    
+    def run(self, workers=None):
+        """Evaluate every layout and save the MAE-vs-layout table"""
+        if workers is None:
+            workers = self.config.get('sweep', {}).get('workers', 1)
+        layouts = self.layouts()
+        Logger.section(f"Sweeping {len(layouts)} sensor layouts ({workers} workers)")
+        
+        trajectories = self.load_trajectories()
+        if trajectories is None:
+            return None
+        Logger.log(f"Loaded {trajectories['run_id'].nunique()} trajectories ({len(trajectories)} samples)")
+        
+        # Stored trajectories may start late (FCD window), and s0 needs a sample before it
+        first_pos = float(trajectories.groupby('run_id', sort=False)['pos'].min().max())
+        usable = [layout for layout in layouts if layout['s0'] > first_pos]
+        if len(usable) < len(layouts):
+            Logger.log(f"Skipping {len(layouts) - len(usable)} layouts with s0 <= {first_pos:.1f}m "
+                       f"(before the stored trajectories start)")
+        if not usable:
+            return None
+        
+        if workers <= 1 or len(usable) <= 1:
+            self.trajectories = trajectories
+            rows = [self.evaluate_layout(layout) for layout in usable]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.config_path, trajectories)
+            ) as pool:
+                rows = list(pool.map(_evaluate_task, usable))
+        
+        results = pd.DataFrame(rows).sort_values(['eta_mae', 'etd_mae'], ignore_index=True)
+        results_path = self.output_dir / 'sensor_sweep.csv'
+        results.to_csv(results_path, index=False)
+        
+        configured = {name: self.config['sensors'][name] for name in ('s0', 's1', 's2')}
+        Logger.log(f"\n{'s0':>7}{'s1':>7}{'s2':>7}{'samples':>9}{'ETA MAE':>10}{'ETD MAE':>10}"
+                   f"{'ETA phys':>10}{'ETD phys':>10}")
+        for row in results.itertuples():
+            marker = '  (current)' if {'s0': row.s0, 's1': row.s1, 's2': row.s2} == configured else ''
+            Logger.log(f"{row.s0:>7}{row.s1:>7}{row.s2:>7}{row.n_samples:>9}{row.eta_mae:>10.3f}{row.etd_mae:>10.3f}"
+                       f"{row.eta_physics_mae:>10.3f}{row.etd_physics_mae:>10.3f}{marker}")
+        Logger.log(f"\nSaved: {results_path}")
+        
+        return results
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Sweep sensor layouts over stored trajectories')
+    parser.add_argument('--workers', type=int, help='Parallel layouts (default: sweep.workers)')
+    parser.add_argument('--config', default='config.yaml', help='Config file path')
+    args = parser.parse_args()
+    
+    sweep = SensorSweep(args.config)
+    sweep.run(args.workers)
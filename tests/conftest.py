@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+from utils.forest import FlatForest
+
+
+N_FEATURES = 6
+
+
+@pytest.fixture(scope='session')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, N_FEATURES)).astype(np.float32)
+    y = np.sin(X[:, 0]) * 3 + X[:, 1] * X[:, 2] + rng.normal(scale=0.1, size=len(X))
+    return X, y
+
+
+@pytest.fixture(scope='session')
+def model(data):
+    X, y = data
+    return RandomForestRegressor(n_estimators=7, max_depth=9, min_samples_leaf=2, random_state=0, n_jobs=1).fit(X, y)
+
+
+@pytest.fixture(scope='session')
+def forest(model):
+    return FlatForest.from_sklearn(model)
+
+
+@pytest.fixture(scope='session')
+def assert_matches():
+    def check(forest, X, expected):
+        """Batch and single-row predictions equal the reference bit for bit"""
+        np.testing.assert_array_equal(forest.predict(X), expected)
+        np.testing.assert_array_equal(np.array([forest.predict_one(x) for x in X[:300]]), expected[:300])
+    return check
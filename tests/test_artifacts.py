@@ -0,0 +1,59 @@
+import numpy as np
+
+from utils.forest import FlatForest
+
+
+def test_save_load_round_trip(model, forest, data, tmp_path, assert_matches):
+    X, _ = data
+    path = forest.save(tmp_path / 'eta_model', feature_names=[f'f{i}' for i in range(X.shape[1])])
+    loaded = FlatForest.load(path)
+    
+    # Arrays stay views of the memory-mapped files rather than copies
+    assert all(isinstance(getattr(loaded, name).base, np.memmap) for name in FlatForest.ARRAYS)
+    assert loaded.header['feature_names'][0] == 'f0'
+    assert (loaded.n_trees, loaded.n_nodes, loaded.max_depth) == (forest.n_trees, forest.n_nodes, forest.max_depth)
+    assert_matches(loaded, X, model.predict(X))
+
+
+def test_save_replaces_existing_artifact(model, forest, data, tmp_path, assert_matches):
+    X, _ = data
+    forest.compress(n_trees=2).save(tmp_path / 'eta_model')
+    loaded = FlatForest.load(forest.save(tmp_path / 'eta_model'))
+    assert_matches(loaded, X, model.predict(X))
+
+
+def test_save_swaps_version_symlink(model, forest, data, tmp_path, assert_matches):
+    X, _ = data
+    small = FlatForest.load(forest.compress(n_trees=2).save(tmp_path / 'eta_model'))
+    for _ in range(3):
+        loaded = FlatForest.load(forest.save(tmp_path / 'eta_model'))
+    assert_matches(loaded, X, model.predict(X))
+    
+    # The path is a symlink to the newest version; only it and the one before are kept
+    assert (tmp_path / 'eta_model').is_symlink()
+    assert len(list(tmp_path.glob('.eta_model.v*'))) == 2
+    # Mappings of a replaced version stay readable
+    assert small.n_trees == 2 and np.isfinite(small.predict(X)).all()
+
+
+def test_save_replaces_unversioned_directory(model, forest, data, tmp_path, assert_matches):
+    X, _ = data
+    legacy = tmp_path / 'eta_model'
+    forest.compress(n_trees=2).save(legacy)
+    (tmp_path / legacy.readlink()).rename(tmp_path / 'plain')
+    legacy.unlink()
+    (tmp_path / 'plain').rename(legacy)
+    
+    assert_matches(FlatForest.load(forest.save(legacy)), X, model.predict(X))
+    assert legacy.is_symlink()
+
+
+def test_remove_deletes_link_and_versions(forest, tmp_path):
+    path = tmp_path / 'eta_model_compact'
+    forest.save(path)
+    forest.save(path)
+    
+    assert FlatForest.remove(path)
+    assert not path.exists() and not path.is_symlink()
+    assert not list(tmp_path.glob('.eta_model_compact.v*'))
+    assert not FlatForest.remove(path)
@@ -0,0 +1,59 @@
+import copy
+
+import numpy as np
+import pytest
+
+from utils.forest import FlatForest
+
+
+def depth_cut_reference(model, X, max_depth):
+    """sklearn's value at the node each row reaches when every tree stops at max_depth"""
+    total = np.zeros(len(X))
+    for estimator in model.estimators_:
+        paths = estimator.decision_path(X).tolil().rows
+        # Node ids grow along a root-to-leaf path, so the path sorted by id is ordered by depth
+        nodes = [path[min(max_depth, len(path) - 1)] for path in paths]
+        total += estimator.tree_.value[nodes, 0, 0]
+    return total / len(model.estimators_)
+
+
+def test_compress_without_changes_is_identical(model, forest, data, assert_matches):
+    X, _ = data
+    assert_matches(forest.compress(), X, model.predict(X))
+
+
+def test_compress_fewer_trees(model, forest, data, assert_matches):
+    X, _ = data
+    truncated = copy.deepcopy(model)
+    truncated.estimators_ = truncated.estimators_[:3]
+    truncated.n_estimators = 3
+    
+    compressed = forest.compress(n_trees=3)
+    assert compressed.n_trees == 3
+    assert_matches(compressed, X, truncated.predict(X))
+
+
+@pytest.mark.parametrize('max_depth', [1, 3, 5])
+def test_compress_depth(model, forest, data, max_depth, assert_matches):
+    X, _ = data
+    compressed = forest.compress(max_depth=max_depth)
+    assert compressed.max_depth <= max_depth
+    assert_matches(compressed, X, depth_cut_reference(model, X, max_depth))
+
+
+def test_compress_merge_stays_within_tolerance(model, forest, data):
+    X, _ = data
+    tolerance = 0.3
+    compressed = forest.compress(merge_tolerance=tolerance)
+    
+    assert compressed.n_nodes < forest.n_nodes
+    predictions = compressed.predict(X)
+    np.testing.assert_array_equal(np.array([compressed.predict_one(x) for x in X[:300]]), predictions[:300])
+    assert np.abs(predictions - model.predict(X)).max() <= tolerance
+
+
+def test_compressed_round_trip(forest, data, tmp_path, assert_matches):
+    X, _ = data
+    compressed = forest.compress(n_trees=4, max_depth=4)
+    loaded = FlatForest.load(compressed.save(tmp_path / 'eta_model_compact'))
+    assert_matches(loaded, X, compressed.predict(X))
@@ -0,0 +1,20 @@
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+
+from utils.forest import FlatForest
+
+
+def test_matches_sklearn(model, forest, data, assert_matches):
+    X, _ = data
+    assert_matches(forest, X, model.predict(X))
+
+
+def test_matches_sklearn_multi_output(data):
+    X, y = data
+    Y = np.column_stack([y, X[:, 3] - y])
+    model = RandomForestRegressor(n_estimators=4, max_depth=7, random_state=1, n_jobs=1).fit(X, Y)
+    forest = FlatForest.from_sklearn(model)
+    
+    expected = model.predict(X)
+    np.testing.assert_array_equal(forest.predict(X), expected)
+    np.testing.assert_array_equal(np.array([forest.predict_one(x) for x in X[:300]]), expected[:300])
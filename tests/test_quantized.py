@@ -0,0 +1,43 @@
+import re
+
+import numpy as np
+import pytest
+
+from export_arduino import ArduinoExporter
+from utils.forest import FlatForest, QuantizedForest, MAX_NODES, feature_scale
+
+
+@pytest.fixture(scope='module')
+def quantized(forest, data):
+    X, _ = data
+    offset, step = feature_scale([forest], X.shape[1])
+    return QuantizedForest(forest, offset, step)
+
+
+def test_quantized_predictions_stay_close(forest, quantized, data):
+    X, y = data
+    errors = np.abs(quantized.predict(X) - forest.predict(X))
+    # int16 leaves are off by at most half a value step; the few rows whose feature lands in the same
+    # quantization bucket as a threshold may take the other branch, so only 99% are held to one step
+    assert np.quantile(errors, 0.99) <= quantized.value_step
+    assert errors.mean() <= 0.001 * y.std()
+
+
+def test_quantized_rejects_more_nodes_than_uint16_indices():
+    # One leaf per tree: every node is a root, so the node count alone overflows the uint16 indices
+    n = MAX_NODES + 1
+    leaves = np.arange(n)
+    forest = FlatForest(np.full(n, -2), np.zeros(n), leaves, leaves, np.zeros((n, 1)), leaves, 0, 1)
+    with pytest.raises(ValueError, match='uint16'):
+        QuantizedForest(forest, np.zeros(1, dtype=np.float32), np.ones(1, dtype=np.float32))
+
+
+def test_forest_header_tables_match_quantized_forest(quantized):
+    header = ArduinoExporter().forest_header({'eta': quantized, 'etd': quantized}, quantized.offset, quantized.step)
+    table = re.search(r'ETA_NODES\[(\d+)\] PROGMEM = \{(.*?)\n\};', header, re.S)
+    nodes = np.array(re.findall(r'\{(-?\d+), (-?\d+), (\d+)\}', table.group(2)), dtype=np.int64)
+    roots = re.search(r'ETA_ROOTS\[ETA_N_TREES\] PROGMEM = \{(.*?)\};', header).group(1)
+    
+    assert int(table.group(1)) == quantized.n_nodes
+    np.testing.assert_array_equal(nodes, np.column_stack([quantized.feature, quantized.value, quantized.right]))
+    assert [int(r) for r in roots.split(', ')] == quantized.roots.tolist()
@@ -1,23 +1,66 @@
 """
 Generate ML training data from SUMO simulations
 Matches poster: 2000 train runs, 14 features
-Usage: python train_data.py [--samples N]
+Usage: python train_data.py [--samples N] [--workers N] [--batch-size K] [--backend sumo|traci|numpy] [--resume]
+       python train_data.py --queue DIR [--queue-action coordinate|work|status]
 """
 
+import os
+import math
+import shutil
+import json
 import subprocess
+import tracemalloc
 import pandas as pd
 import numpy as np
 import yaml
 import matplotlib.pyplot as plt
 from pathlib import Path
+from time import perf_counter, sleep
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
 import xml.etree.ElementTree as ET
 from utils.logger import Logger
+from utils.cache import RunCache
+from utils.checkpoint import GenerationCheckpoint
+from utils.columnar import read_table, read_partition, write_table
+from utils.sampling import ParameterSampler
+from utils.work_queue import WorkQueue
+
+
+TRACK_SPACING = 100
+KRAUSS_SIGMA = 0.5      # SUMO default driver imperfection
+DEPART_POS_EPS = 0.1    # departPos="base" puts the rear just past the edge start
+NUMPY_BATCH_SIZE = 2048
+FCD_WINDOW_PAD = 10.0   # metres around the FCD window on top of one step at max speed
+STEP_LENGTHS = (0.1, 0.2, 0.5, 1.0)
+FCD_COLUMNS = ('time', 'pos', 'speed', 'acceleration')
+
+_worker = None
+
+
+def _init_worker(config_path, scratch_root, backend):
+    """Create a per-process generator with its own scratch directory"""
+    global _worker
+    _worker = TrainingDataGenerator(config_path, backend)
+    _worker.work_dir = Path(scratch_root) / f'worker_{os.getpid()}'
+    _worker.work_dir.mkdir(parents=True, exist_ok=True)
+    Finalize(_worker, _worker.close_traci, exitpriority=10)
+
+
+def _simulate_task(task):
+    """Run one (batch, seed) simulation in a pool worker"""
+    batch, seed = task
+    return _worker.simulate_batch(batch, seed)
 
 
 class TrainingDataGenerator:
-    def __init__(self, config_path='config.yaml'):
+    BACKENDS = ('sumo', 'traci', 'numpy')
+    
+    def __init__(self, config_path='config.yaml', backend=None):
         with open(config_path) as f:
             self.config = yaml.safe_load(f)
+        self.config_path = config_path
         
         self.output_dir = Path('outputs')
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -25,8 +68,20 @@ class TrainingDataGenerator:
         self.plots_dir = self.output_dir / 'plots'
         self.plots_dir.mkdir(parents=True, exist_ok=True)
         
+        self.work_dir = Path('.')
+        self.net_file = Path('training.net.xml').resolve()
+        
+        self.output_format = self.config['training'].get('output_format', 'csv')
+        self.step_length = self.config['training'].get('step_length', 0.1)
+        self.interpolate = self.config['training'].get('interpolate_triggers', True)
+        self.backend = backend or self.config['training'].get('backend', 'sumo')
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{self.backend}', expected one of {self.BACKENDS}")
+        self.traci = None
+        
         self.sensors = self.config['sensors']
-        self.check_sumo()
+        if self.backend != 'numpy':
+            self.check_sumo()
     
     def check_sumo(self):
         """Verify SUMO is installed"""
@@ -36,31 +91,36 @@ class TrainingDataGenerator:
             Logger.log("ERROR: SUMO not found. Install: sudo apt-get install sumo sumo-tools")
             raise
     
-    def generate_network(self):
-        """Create linear track for training"""
+    def generate_network(self, n_tracks=1):
+        """Create linear track for training (plus parallel copies for batching)"""
         Logger.section("Generating SUMO network")
         
-        nodes = f"""<?xml version="1.0" encoding="UTF-8"?>
-<nodes>
-    <node id="start" x="{self.config['network']['start_x']}" y="0"/>
-    <node id="end" x="{self.config['network']['end_x']}" y="0"/>
-</nodes>"""
+        net = self.config['network']
+        node_lines = []
+        edge_lines = []
+        for slot in range(n_tracks):
+            suffix = '' if slot == 0 else f'_{slot}'
+            y = slot * TRACK_SPACING
+            node_lines.append(f"""    <node id="start{suffix}" x="{net['start_x']}" y="{y}"/>""")
+            node_lines.append(f"""    <node id="end{suffix}" x="{net['end_x']}" y="{y}"/>""")
+            edge_lines.append(f"""    <edge id="{self.track_edge(slot)}" from="start{suffix}" to="end{suffix}" priority="1" numLanes="1" 
+          speed="{net['max_speed']}"/>""")
         
-        edges = f"""<?xml version="1.0" encoding="UTF-8"?>
-<edges>
-    <edge id="track" from="start" to="end" priority="1" numLanes="1" 
-          speed="{self.config['network']['max_speed']}"/>
-</edges>"""
+        nodes = '<?xml version="1.0" encoding="UTF-8"?>\n<nodes>\n' + '\n'.join(node_lines) + '\n</nodes>'
+        edges = '<?xml version="1.0" encoding="UTF-8"?>\n<edges>\n' + '\n'.join(edge_lines) + '\n</edges>'
         
-        Path('training.nod.xml').write_text(nodes)
-        Path('training.edg.xml').write_text(edges)
+        # Queue workers may share this directory, so build under private names and swap the files in
+        tmp = f'{os.getpid()}.tmp'
+        Path(f'training.nod.xml.{tmp}').write_text(nodes)
+        Path(f'training.edg.xml.{tmp}').write_text(edges)
         
         result = subprocess.run([
             'netconvert',
-            '--node-files=training.nod.xml',
-            '--edge-files=training.edg.xml',
-            '--output-file=training.net.xml',
+            f'--node-files=training.nod.xml.{tmp}',
+            f'--edge-files=training.edg.xml.{tmp}',
+            f'--output-file=training.net.xml.{tmp}',
             '--no-turnarounds',
+            '--offset.disable-normalization',
             '--no-warnings'
         ], capture_output=True)
         
@@ -68,17 +128,81 @@ class TrainingDataGenerator:
             Logger.log("Network generation failed")
             return False
         
-        Logger.log("Network created: training.net.xml")
+        self.write_fcd_window(n_tracks, f'training.add.xml.{tmp}')
+        for name in ('training.nod.xml', 'training.edg.xml', 'training.net.xml', 'training.add.xml'):
+            os.replace(f'{name}.{tmp}', name)
+        
+        Logger.log(f"Network created: training.net.xml ({n_tracks} parallel tracks)")
         return True
     
-    def generate_train_params(self, n_samples):
-        """Generate realistic train parameters"""
+    def write_fcd_window(self, n_tracks, path='training.add.xml'):
+        """Write one polygon per track covering s0 to crossing + longest train (FCD filter)"""
+        net = self.config['network']
+        pad = FCD_WINDOW_PAD + net['max_speed'] * self.step_length
+        x_min = net['start_x'] + self.sensors['s0'] - pad
+        x_max = net['start_x'] + self.sensors['crossing'] + max(self.config['training']['train_lengths']) + pad
+        
+        polys = []
+        for slot in range(n_tracks):
+            y_min = slot * TRACK_SPACING - TRACK_SPACING / 2
+            y_max = slot * TRACK_SPACING + TRACK_SPACING / 2
+            shape = f"{x_min},{y_min} {x_max},{y_min} {x_max},{y_max} {x_min},{y_max} {x_min},{y_min}"
+            polys.append(f"""    <poly id="fcd_window_{slot}" shape="{shape}"/>""")
+        
+        additional = '<?xml version="1.0" encoding="UTF-8"?>\n<additional>\n' + '\n'.join(polys) + '\n</additional>'
+        Path(path).write_text(additional)
+    
+    def early_stop(self):
+        """training.early_stop settings (disabled when missing)"""
+        return self.config['training'].get('early_stop', {})
+    
+    def clearing_pos(self, params):
+        """Front position at which the rear of the train has cleared the crossing"""
+        return self.sensors['crossing'] + params['length']
+    
+    def end_time(self, batch):
+        """Simulation end for a batch: slowest-case rear clearing time plus margin"""
+        sim_duration = self.config['training']['sim_duration']
+        settings = self.early_stop()
+        if not settings.get('enabled', False):
+            return sim_duration
+        
+        max_speed = self.config['network']['max_speed']
+        end = 0.0
+        for _, p in batch:
+            # Without a leader Krauss never drops below the departure speed minus one dawdle step
+            v_max = min(max_speed, max_speed * p['speed_factor'])
+            min_speed = max(min(p['depart_speed'], v_max - KRAUSS_SIGMA * p['accel'] * self.step_length), 0.1)
+            distance = self.clearing_pos(p) - (p['length'] + DEPART_POS_EPS)
+            end = max(end, distance / min_speed * (1 + settings.get('margin', 0.2)) + 1.0 + self.step_length)
+        
+        return min(sim_duration, math.ceil(end / self.step_length) * self.step_length)
+    
+    def param_sampler(self, method=None):
+        """Vectorized parameter sampler for training.sampling"""
+        return ParameterSampler(
+            self.config['training']['scenarios'],
+            self.config['training']['train_lengths'],
+            self.config['training']['random_seed'],
+            method or self.config['training'].get('sampling', 'legacy')
+        )
+    
+    def generate_train_params(self, n_samples, start=0, count=None):
+        """Generate realistic train parameters (runs start .. start + count of an n_samples design)"""
+        if self.config['training'].get('sampling', 'legacy') != 'legacy':
+            sampler = self.param_sampler()
+            return sampler.to_dicts(sampler.sample(n_samples, start, count))
+        
+        # Original per-sample loop on the global RNG, kept to reproduce existing datasets
         np.random.seed(self.config['training']['random_seed'])
         scenarios = self.config['training']['scenarios']
+        # Unweighted scenarios keep the original uniform draw, so existing datasets reproduce exactly
+        weights = np.array([s.get('weight', 1.0) for s in scenarios.values()], dtype=float)
+        probabilities = weights / weights.sum() if np.any(weights != 1.0) else None
         
         params = []
         for _ in range(n_samples):
-            scenario_name = np.random.choice(list(scenarios.keys()))
+            scenario_name = np.random.choice(list(scenarios.keys()), p=probabilities)
             s = scenarios[scenario_name]
             
             params.append({
@@ -90,91 +214,491 @@ class TrainingDataGenerator:
                 'scenario': scenario_name
             })
         
-        return params
+        return params[start:None if count is None else start + count]
     
-    def create_route_file(self, train_params, run_id):
-        """Create SUMO route file for one train"""
-        p = train_params
-        
-        routes = f"""<?xml version="1.0" encoding="UTF-8"?>
-<routes>
-    <vType id="train_{run_id}" length="{p['length']}" 
+    def run_seed_sequence(self, run_id):
+        """Independent random stream for one run (child run_id of the master seed)"""
+        return np.random.SeedSequence(self.config['training']['random_seed'], spawn_key=(run_id,))
+    
+    def run_seed(self, run_id):
+        """SUMO seed for one run"""
+        return int(self.run_seed_sequence(run_id).generate_state(1)[0] % 2**31)
+    
+    def generate_run_seeds(self, n_samples):
+        """Derive one independent SUMO seed per run from the master seed"""
+        return [self.run_seed(i) for i in range(n_samples)]
+    
+    def track_edge(self, slot):
+        """Edge id of one parallel copy of the training track"""
+        return 'track' if slot == 0 else f'track_{slot}'
+    
+    def make_batches(self, tasks, batch_size):
+        """Group (run_id, params, seed) tasks into (batch, seed) simulations"""
+        batches = []
+        for i in range(0, len(tasks), batch_size):
+            chunk = tasks[i:i + batch_size]
+            batch = [(run_id, params) for run_id, params, _ in chunk]
+            batches.append((batch, chunk[0][2]))
+        return batches
+    
+    def create_route_file(self, batch):
+        """Create SUMO route file with one train per (run_id, params) entry"""
+        entries = []
+        for slot, (run_id, p) in enumerate(batch):
+            entries.append(f"""    <vType id="train_{run_id}" length="{p['length']}" 
            maxSpeed="{self.config['network']['max_speed']}" 
            accel="{p['accel']}" decel="{p['decel']}" 
            speedFactor="{p['speed_factor']}" speedDev="0" color="1,0,0"/>
-    <route id="route_{run_id}" edges="track"/>
+    <route id="route_{run_id}" edges="{self.track_edge(slot)}"/>
     <vehicle id="train_{run_id}" type="train_{run_id}" route="route_{run_id}" 
-             depart="0" departSpeed="{p['depart_speed']}"/>
-</routes>"""
+             depart="0" departSpeed="{p['depart_speed']}"/>""")
         
-        route_file = f'temp_route_{run_id}.rou.xml'
-        Path(route_file).write_text(routes)
+        routes = '<?xml version="1.0" encoding="UTF-8"?>\n<routes>\n' + '\n'.join(entries) + '\n</routes>'
+        
+        route_file = (self.work_dir / f'temp_route_{batch[0][0]}.rou.xml').resolve()
+        route_file.write_text(routes)
         return route_file
     
-    def create_config_file(self, route_file, run_id):
+    def create_config_file(self, route_file, run_id, end=None, n_tracks=1):
         """Create SUMO configuration file"""
+        additional = ''
+        fcd_filter = ''
+        if self.early_stop().get('fcd_window', False):
+            shapes = ','.join(f'fcd_window_{slot}' for slot in range(n_tracks))
+            additional = f"""
+        <additional-files value="{Path('training.add.xml').resolve()}"/>"""
+            fcd_filter = f"""
+        <fcd-output.filter-shapes value="{shapes}"/>
+        <fcd-output.skip-empty value="true"/>"""
+        
         config = f"""<?xml version="1.0" encoding="UTF-8"?>
 <configuration>
     <input>
-        <net-file value="training.net.xml"/>
-        <route-files value="{route_file}"/>
+        <net-file value="{self.net_file}"/>
+        <route-files value="{route_file}"/>{additional}
     </input>
     <time>
         <begin value="0"/>
-        <end value="{self.config['training']['sim_duration']}"/>
-        <step-length value="0.1"/>
+        <end value="{end or self.config['training']['sim_duration']}"/>
+        <step-length value="{self.step_length}"/>
     </time>
     <output>
-        <fcd-output value="temp_fcd_{run_id}.xml"/>
+        <fcd-output value="{self.fcd_path(run_id)}"/>{fcd_filter}
     </output>
     <processing>
         <time-to-teleport value="-1"/>
     </processing>
 </configuration>"""
-        
-        config_file = f'temp_config_{run_id}.sumocfg'
-        Path(config_file).write_text(config)
+
+        config_file = (self.work_dir / f'temp_config_{run_id}.sumocfg').resolve()
+        config_file.write_text(config)
         return config_file
     
-    def run_simulation(self, train_params, run_id):
-        """Run SUMO simulation for one train"""
-        route_file = self.create_route_file(train_params, run_id)
-        config_file = self.create_config_file(route_file, run_id)
+    def fcd_path(self, run_id):
+        """FCD output path for one run inside the scratch directory"""
+        return (self.work_dir / f'temp_fcd_{run_id}.xml').resolve()
+    
+    def run_simulation(self, batch, seed=None):
+        """Run one SUMO simulation for a batch of trains"""
+        batch_id = batch[0][0]
+        route_file = self.create_route_file(batch)
+        config_file = self.create_config_file(route_file, batch_id, self.end_time(batch), len(batch))
         
-        result = subprocess.run(
-            ['sumo', '-c', config_file, '--no-step-log', '--no-warnings'],
-            capture_output=True
-        )
+        cmd = ['sumo', '-c', str(config_file), '--no-step-log', '--no-warnings']
+        if seed is not None:
+            cmd += ['--seed', str(seed)]
+        
+        result = subprocess.run(cmd, capture_output=True)
         
-        Path(route_file).unlink(missing_ok=True)
-        Path(config_file).unlink(missing_ok=True)
+        route_file.unlink(missing_ok=True)
+        config_file.unlink(missing_ok=True)
         
         if result.returncode != 0:
-            return None
+            return {}
+        
+        fcd_file = self.fcd_path(batch_id)
+        if not fcd_file.exists():
+            return {}
+        
+        data = self.parse_fcd(fcd_file, batch)
+        fcd_file.unlink(missing_ok=True)
+        
+        return data
+    
+    def sumo_args(self, seed=None, end=None):
+        """Command-line options for a TraCI-driven training simulation"""
+        args = [
+            '-n', str(self.net_file),
+            '--begin', '0',
+            '--end', str(end or self.config['training']['sim_duration']),
+            '--step-length', str(self.step_length),
+            '--time-to-teleport', '-1',
+            '--no-step-log', '--no-warnings'
+        ]
+        if seed is not None:
+            args += ['--seed', str(seed)]
+        return args
+    
+    def connect_traci(self, seed=None, end=None):
+        """Start the persistent SUMO connection, or reset it with traci.load"""
+        if self.traci is None:
+            import traci
+            traci.start(['sumo'] + self.sumo_args(seed, end))
+            self.traci = traci
+        else:
+            self.traci.load(self.sumo_args(seed, end))
+        return self.traci
+    
+    def close_traci(self):
+        """Shut down the persistent SUMO connection, if any"""
+        if self.traci is not None:
+            self.traci.close()
+            self.traci = None
+    
+    def run_simulation_traci(self, batch, seed=None):
+        """Run a batch on the persistent SUMO connection, collecting state by subscription"""
+        import traci.constants as tc
+        
+        end = self.end_time(batch)
+        traci = self.connect_traci(seed, end)
+        
+        slots = {}
+        for slot, (run_id, p) in enumerate(batch):
+            vehicle_id = f'train_{run_id}'
+            traci.vehicletype.copy('DEFAULT_VEHTYPE', vehicle_id)
+            traci.vehicletype.setLength(vehicle_id, float(p['length']))
+            traci.vehicletype.setMaxSpeed(vehicle_id, self.config['network']['max_speed'])
+            traci.vehicletype.setAccel(vehicle_id, p['accel'])
+            traci.vehicletype.setDecel(vehicle_id, p['decel'])
+            traci.vehicletype.setSpeedFactor(vehicle_id, p['speed_factor'])
+            traci.vehicletype.setSpeedDeviation(vehicle_id, 0)
+            traci.route.add(f'route_{run_id}', [self.track_edge(slot)])
+            traci.vehicle.add(vehicle_id, f'route_{run_id}', typeID=vehicle_id,
+                              depart='0', departSpeed=str(p['depart_speed']))
+            slots[vehicle_id] = slot
+        
+        variables = (tc.VAR_LANEPOSITION, tc.VAR_SPEED, tc.VAR_ACCELERATION)
+        n_steps = int(round(end / self.step_length)) + 1
+        columns = np.empty((len(batch), len(FCD_COLUMNS), n_steps), dtype=np.float32)
+        counts = np.zeros(len(batch), dtype=np.int64)
+        clearing = np.array([self.clearing_pos(p) for _, p in batch])
+        cleared = np.zeros(len(batch), dtype=bool)
+        stop_early = self.early_stop().get('enabled', False)
+        
+        for step in range(n_steps):
+            # Stop stepping as soon as every train's rear is past the crossing
+            if traci.simulation.getMinExpectedNumber() == 0 or (stop_early and cleared.all()):
+                break
+            traci.simulationStep()
+            
+            # Values are rounded like FCD output (precision 2) so features match the file backend
+            step_time = round(step * self.step_length, 2)
+            states = dict(traci.vehicle.getAllSubscriptionResults())
+            for vehicle_id in traci.simulation.getDepartedIDList():
+                traci.vehicle.subscribe(vehicle_id, variables)
+                states[vehicle_id] = {
+                    tc.VAR_LANEPOSITION: traci.vehicle.getLanePosition(vehicle_id),
+                    tc.VAR_SPEED: traci.vehicle.getSpeed(vehicle_id),
+                    tc.VAR_ACCELERATION: traci.vehicle.getAcceleration(vehicle_id)
+                }
+            
+            for vehicle_id, values in states.items():
+                slot = slots.get(vehicle_id)
+                if slot is None or not values:
+                    continue
+                columns[slot, :, counts[slot]] = (step_time,) + tuple(round(values[v], 2) for v in variables)
+                cleared[slot] |= columns[slot, 1, counts[slot]] >= clearing[slot]
+                counts[slot] += 1
+        
+        return self.build_trajectories(columns, counts, batch)
+    
+    def run_simulation_numpy(self, batch, seed=None):
+        """Integrate SUMO's Krauss free-flow speed update for a whole batch at once"""
+        dt = self.step_length
+        n_steps = int(round(self.end_time(batch) / dt)) + 1
+        max_speed = self.config['network']['max_speed']
+        track_length = self.config['network']['track_length']
+        
+        params = [p for _, p in batch]
+        accel = np.array([p['accel'] for p in params], dtype=float)
+        decel = np.array([p['decel'] for p in params], dtype=float)
+        v_max = np.minimum(max_speed, max_speed * np.array([p['speed_factor'] for p in params], dtype=float))
+        speed = np.array([p['depart_speed'] for p in params], dtype=float)
+        pos = np.array([p['length'] for p in params], dtype=float) + DEPART_POS_EPS
+        acceleration = np.zeros(len(batch))
+        
+        # Each run draws from its own stream, so results do not depend on batch composition
+        noise = np.stack([
+            np.random.default_rng(self.run_seed_sequence(run_id)).random(n_steps) for run_id, _ in batch
+        ], axis=1)
+        samples = np.empty((n_steps, len(FCD_COLUMNS), len(batch)), dtype=np.float32)
+        counts = np.zeros(len(batch), dtype=np.int64)
+        active = np.ones(len(batch), dtype=bool)
+        clearing = np.array([self.clearing_pos(p) for p in params])
+        stop_early = self.early_stop().get('enabled', False)
+        
+        for step in range(n_steps):
+            if step > 0:
+                # Krauss without a leader: accelerate, dawdle, never brake harder than decel
+                v_next = np.minimum(speed + accel * dt, v_max)
+                dawdle = KRAUSS_SIGMA * np.where(v_next < accel, v_next, accel) * noise[step] * dt
+                v_next = np.maximum(np.maximum(v_next - dawdle, 0.0), np.maximum(speed - decel * dt, 0.0))
+                acceleration = (v_next - speed) / dt
+                speed = v_next
+                pos = pos + speed * dt
+                active &= pos <= track_length
+                if not active.any():
+                    break
+            
+            # Trains only ever leave, so each run's samples stay a prefix of the step axis
+            samples[step, 0] = round(step * dt, 2)
+            samples[step, 1:] = np.round((pos, speed, acceleration), 2)
+            counts += active
+            if stop_early and (samples[step, 1] >= clearing).all():
+                break
+        
+        return self.build_trajectories(samples.transpose(2, 1, 0), counts, batch)
+    
+    def simulate_batch(self, batch, seed=None):
+        """Simulate a batch and extract features, one (trajectory, features) per run"""
+        if self.backend == 'numpy':
+            trajectories = self.run_simulation_numpy(batch, seed)
+        elif self.backend == 'traci':
+            trajectories = self.run_simulation_traci(batch, seed)
+        else:
+            trajectories = self.run_simulation(batch, seed)
+        
+        stop_early = self.early_stop().get('enabled', False)
+        valid = {}
+        for run_id, params in batch:
+            trajectory_df = trajectories.get(run_id)
+            if trajectory_df is None or len(trajectory_df) <= 10:
+                continue
+            if stop_early and trajectory_df['pos'].max() < self.clearing_pos(params):
+                # The end time was too tight: fail the run instead of keeping a truncated trajectory
+                Logger.log(f"Run {run_id} failed: rear had not cleared the crossing at "
+                           f"t={trajectory_df['time'].max():.1f}s, raise training.early_stop.margin")
+                continue
+            valid[run_id] = trajectory_df
+        
+        features = {}
+        if valid:
+            rows = self.extract_features_batch(pd.concat(valid.values(), ignore_index=True))
+            features = {row['run_id']: row for row in rows.to_dict('records')}
+        
+        return [(valid[run_id], features.get(run_id)) if run_id in valid else (None, None)
+                for run_id, _ in batch]
+    
+    def iter_runs(self, tasks, workers=1, batch_size=1, cache=None):
+        """Yield (trajectory, features) per task, in task order, simulating only cache misses"""
+        # numpy runs do not depend on batch composition, so they are cached and regrouped per run
+        lookup_size = 1 if self.backend == 'numpy' else batch_size
+        units = self.make_batches(tasks, lookup_size)
+        cached = [self.load_cached(batch, seed, cache) for batch, seed in units]
+        pending = [unit for unit, hit in zip(units, cached) if hit is None]
+        
+        n_pending = sum(len(batch) for batch, _ in pending)
+        if cache is not None:
+            Logger.log(f"Cache: {len(tasks) - n_pending} runs cached, {n_pending} to simulate")
         
-        fcd_file = f'temp_fcd_{run_id}.xml'
-        if not Path(fcd_file).exists():
+        if self.backend == 'numpy':
+            pending = self.make_batches([(run_id, params, seed) for batch, seed in pending
+                                         for run_id, params in batch], batch_size)
+        
+        simulated_batches = self.simulate_batches(pending, workers)
+        simulated = (result for results in simulated_batches for result in results)
+        try:
+            for (batch, seed), results in zip(units, cached):
+                if results is None:
+                    results = [next(simulated) for _ in batch]
+                    self.store_cached(batch, seed, results, cache)
+                yield from results
+        finally:
+            simulated_batches.close()
+    
+    def simulate_batches(self, batches, workers=1):
+        """Yield per-batch results in order, on a process pool when workers > 1"""
+        if workers <= 1 or len(batches) <= 1:
+            for batch, seed in batches:
+                yield self.simulate_batch(batch, seed)
+            return
+        
+        scratch_root = self.output_dir / 'scratch'
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.config_path, str(scratch_root), self.backend)
+            ) as pool:
+                yield from pool.map(_simulate_task, batches)
+        finally:
+            shutil.rmtree(scratch_root, ignore_errors=True)
+    
+    def open_cache(self, enabled=True):
+        """Open the run cache configured under training.cache, if enabled"""
+        settings = self.config['training'].get('cache', {})
+        if not enabled or not settings.get('enabled', False):
             return None
+        return RunCache(self.output_dir / 'cache', settings.get('max_size_mb', 1000))
+    
+    def engine_version(self):
+        """Version string of whatever produces trajectories for this backend"""
+        if self.backend == 'numpy':
+            return f'numpy-krauss-sigma{KRAUSS_SIGMA}'
+        if not hasattr(self, '_sumo_version'):
+            result = subprocess.run(['sumo', '--version'], capture_output=True, text=True)
+            self._sumo_version = result.stdout.splitlines()[0] if result.stdout else 'unknown'
+        return self._sumo_version
+    
+    def cache_key(self, batch, seed, slot):
+        """Hash everything that determines the trajectory of one run in a batch"""
+        run_id, params = batch[slot]
+        key = {
+            'params': params,
+            'seed': self.run_seed(run_id) if self.backend == 'numpy' else seed,
+            'network': self.config['network'],
+            'sensors': self.sensors,
+            'sim_duration': self.config['training']['sim_duration'],
+            'retention': self.config['training'].get('retention', {}),
+            'early_stop': self.early_stop(),
+            'step_length': self.step_length,
+            'interpolate': self.interpolate,
+            'backend': self.backend,
+            'engine': self.engine_version()
+        }
+        if self.backend != 'numpy' and len(batch) > 1:
+            # Batched SUMO runs share one random stream, so the rest of the batch matters too
+            key['batch'] = [p for _, p in batch]
+            key['slot'] = slot
+        return RunCache.make_key(key)
+    
+    def load_cached(self, batch, seed, cache):
+        """Cached results for a whole batch, or None if any run is missing"""
+        if cache is None:
+            return None
+        
+        results = []
+        for slot, (run_id, params) in enumerate(batch):
+            entry = cache.get(self.cache_key(batch, seed, slot))
+            if entry is None:
+                return None
+            arrays, features = entry
+            if features is not None:
+                features['run_id'] = run_id
+            results.append((self.trajectory_frame(arrays, run_id, params), features))
+        return results
+    
+    def store_cached(self, batch, seed, results, cache):
+        """Store every successfully simulated run of a batch"""
+        if cache is None:
+            return
+        
+        for slot, (trajectory_df, features) in enumerate(results):
+            if trajectory_df is None:
+                continue
+            arrays = {name: trajectory_df[name].to_numpy() for name in FCD_COLUMNS}
+            cache.put(self.cache_key(batch, seed, slot), arrays, features)
+    
+    def parse_fcd(self, fcd_file, batch):
+        """Stream SUMO FCD output into one trajectory per train_<run_id>"""
+        slots = {f'train_{run_id}': slot for slot, (run_id, _) in enumerate(batch)}
+        capacity = int(self.config['training']['sim_duration'] / self.step_length) + 2
+        columns = np.empty((len(batch), len(FCD_COLUMNS), capacity), dtype=np.float32)
+        counts = np.zeros(len(batch), dtype=np.int64)
+        
+        step_time = 0.0
+        root = None
+        try:
+            for event, elem in ET.iterparse(fcd_file, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                    elif elem.tag == 'timestep':
+                        step_time = float(elem.get('time'))
+                    elif elem.tag == 'vehicle':
+                        slot = slots.get(elem.get('id'))
+                        if slot is None:
+                            continue
+                        n = counts[slot]
+                        if n == columns.shape[2]:
+                            columns = np.concatenate([columns, np.empty_like(columns)], axis=2)
+                        columns[slot, :, n] = (
+                            step_time,
+                            float(elem.get('pos')),
+                            float(elem.get('speed')),
+                            float(elem.get('acceleration', 0))
+                        )
+                        counts[slot] = n + 1
+                elif elem.tag == 'timestep':
+                    elem.clear()
+                    root.clear()
+        except ET.ParseError:
+            return {}
         
-        data = self.parse_fcd(fcd_file, run_id, train_params)
-        Path(fcd_file).unlink(missing_ok=True)
+        return self.build_trajectories(columns, counts, batch)
+    
+    def build_trajectories(self, columns, counts, batch):
+        """Turn per-slot float32 sample columns into one DataFrame per run"""
+        data = {}
+        for slot, (run_id, train_params) in enumerate(batch):
+            n = counts[slot]
+            if n == 0:
+                continue
+            keep = self.retention_mask(columns[slot, 1, :n], train_params['length'])
+            arrays = {name: columns[slot, c, :n][keep] for c, name in enumerate(FCD_COLUMNS)}
+            data[run_id] = self.trajectory_frame(arrays, run_id, train_params)
         
         return data
     
-    def parse_fcd(self, fcd_file, run_id, train_params):
-        """Parse SUMO FCD output"""
+    def retention_mask(self, pos, train_length, mode=None):
+        """Samples to keep under training.retention: full, windowed or decimated"""
+        retention = self.config['training'].get('retention', {})
+        mode = mode or retention.get('mode', 'full')
+        if mode == 'full':
+            return np.ones(len(pos), dtype=bool)
+        
+        # Windows around every sensor and the point where the rear clears the crossing
+        window = retention.get('window', 25.0)
+        keep = np.zeros(len(pos), dtype=bool)
+        for center in list(self.sensors.values()) + [self.sensors['crossing'] + train_length]:
+            keep |= (pos >= center - window) & (pos <= center + window)
+            # Coarse steps can jump the whole window; keep the samples either side for interpolation
+            i = np.searchsorted(pos, center)
+            keep[max(i - 1, 0):i + 1] = True
+        
+        if mode == 'decimated':
+            keep[::retention.get('decimate', 10)] = True
+            keep[-1:] = True
+        elif mode != 'windowed':
+            raise ValueError(f"Unknown retention mode '{mode}'")
+        
+        return keep
+    
+    def trajectory_frame(self, arrays, run_id, train_params):
+        """Build the trajectory DataFrame of one run from its sample columns"""
+        run_df = pd.DataFrame(arrays)
+        run_df['length'] = train_params['length']
+        run_df['run_id'] = run_id
+        run_df['scenario'] = train_params['scenario']
+        return run_df
+    
+    def parse_fcd_etree(self, fcd_file, batch):
+        """Parse SUMO FCD output with ET.parse (reference for benchmarking)"""
         try:
             tree = ET.parse(fcd_file)
             root = tree.getroot()
         except:
-            return None
+            return {}
         
-        data = []
+        runs = {f'train_{run_id}': (run_id, params) for run_id, params in batch}
+        data = {run_id: [] for run_id, _ in batch}
         for timestep in root.findall('timestep'):
             time = float(timestep.get('time'))
             for vehicle in timestep.findall('vehicle'):
-                if vehicle.get('id').startswith('train_'):
-                    data.append({
+                run = runs.get(vehicle.get('id'))
+                if run is not None:
+                    run_id, train_params = run
+                    data[run_id].append({
                         'time': time,
                         'pos': float(vehicle.get('pos')),
                         'speed': float(vehicle.get('speed')),
@@ -184,24 +708,168 @@ class TrainingDataGenerator:
                         'scenario': train_params['scenario']
                     })
         
-        return pd.DataFrame(data) if data else None
+        return {run_id: pd.DataFrame(rows) for run_id, rows in data.items() if rows}
+    
+    def write_synthetic_fcd(self, fcd_file, batch):
+        """Write an FCD file in SUMO's layout for constant-acceleration trains"""
+        max_speed = self.config['network']['max_speed']
+        dt = self.step_length
+        n_steps = int(self.config['training']['sim_duration'] / dt) + 1
+        state = {run_id: [float(p['length']), float(p['depart_speed'])] for run_id, p in batch}
+        
+        with open(fcd_file, 'w') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n<fcd-export>\n')
+            for step in range(n_steps):
+                f.write(f'    <timestep time="{step * dt:.2f}">\n')
+                for run_id, p in batch:
+                    pos, speed = state[run_id]
+                    f.write(f'        <vehicle id="train_{run_id}" x="{pos:.2f}" y="0.00" angle="90.00" '
+                            f'type="train_{run_id}" speed="{speed:.2f}" pos="{pos:.2f}" lane="track_0" slope="0.00"/>\n')
+                    speed = min(max_speed, speed + p['accel'] * dt)
+                    state[run_id] = [pos + speed * dt, speed]
+                f.write('    </timestep>\n')
+            f.write('</fcd-export>\n')
+    
+    def benchmark_fcd(self, n_trains=1, repeats=5):
+        """Compare the streaming FCD parser against ET.parse"""
+        Logger.section(f"Benchmarking FCD parsers ({n_trains} trains, {repeats} repeats)")
+        
+        batch = list(enumerate(self.generate_train_params(n_trains)))
+        fcd_file = self.fcd_path('bench')
+        self.write_synthetic_fcd(fcd_file, batch)
+        Logger.log(f"Synthetic FCD: {fcd_file.stat().st_size / 1e6:.1f} MB")
+        
+        results = {}
+        for name, parser in (('etree', self.parse_fcd_etree), ('stream', self.parse_fcd)):
+            times = []
+            for _ in range(repeats):
+                start = perf_counter()
+                parser(fcd_file, batch)
+                times.append(perf_counter() - start)
+            
+            tracemalloc.start()
+            results[name] = parser(fcd_file, batch)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            Logger.log(f"{name:>6}: {np.median(times) * 1000:.1f} ms median, {peak / 1e6:.1f} MB peak")
+        
+        fcd_file.unlink(missing_ok=True)
+        
+        for run_id, _ in batch:
+            reference, streamed = results['etree'][run_id], results['stream'][run_id]
+            diff = max(np.max(np.abs(reference[c].to_numpy() - streamed[c].to_numpy())) for c in FCD_COLUMNS)
+            if len(reference) != len(streamed) or diff > 1e-3:
+                Logger.log(f"MISMATCH in run {run_id}: max difference {diff:.2e}")
+                return False
+        
+        Logger.log("Parsers agree on all runs")
+        return True
+    
+    def extract_features_batch(self, trajectories):
+        """Extract the features of every run in concatenated trajectories with whole-array operations"""
+        codes, run_ids = pd.factorize(trajectories['run_id'])
+        time = trajectories['time'].to_numpy(dtype=float)
+        same_run = codes[1:] == codes[:-1]
+        if (codes[1:] < codes[:-1]).any() or (same_run & (time[1:] < time[:-1])).any():
+            order = np.lexsort((time, codes))
+            trajectories = trajectories.iloc[order]
+            codes, time = codes[order], time[order]
+        
+        pos = trajectories['pos'].to_numpy(dtype=float)
+        speed = trajectories['speed'].to_numpy(dtype=float)
+        
+        n_runs = len(run_ids)
+        starts = np.searchsorted(codes, np.arange(n_runs))
+        ends = np.r_[starts[1:], len(codes)]
+        train_length = trajectories['length'].iloc[starts].to_numpy()
+        scenario = trajectories['scenario'].iloc[starts].to_numpy()
+        
+        # Positions never decrease within a run, so (run, pos) keys are sorted across the whole table.
+        # A power-of-two span keeps run offsets exact; distinct float32 positions stay distinct below ~1e8 runs.
+        pos_min = pos.min()
+        span = 2.0 ** np.ceil(np.log2(pos.max() - pos_min + 2))
+        offsets = np.arange(n_runs) * span
+        keys = offsets[codes] + (pos - pos_min)
+        
+        def trigger(target):
+            """(found, time, speed) per run where pos first reaches target"""
+            i = np.searchsorted(keys, offsets + (np.maximum(target, pos_min) - pos_min))
+            found = i < ends
+            i = np.minimum(i, len(pos) - 1)
+            t, v = time[i], speed[i]
+            if self.interpolate:
+                prev = np.maximum(i - 1, 0)
+                step = found & (i > starts) & (pos[i] > pos[prev])
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    frac = (target - pos[prev]) / (pos[i] - pos[prev])
+                    t = np.where(step, time[prev] + frac * (time[i] - time[prev]), t)
+                    v = np.where(step, speed[prev] + frac * (speed[i] - speed[prev]), v)
+            return found, t, v
+        
+        triggers = {sensor_id: trigger(sensor_pos) for sensor_id, sensor_pos in self.sensors.items()}
+        crossing_pos = self.sensors['crossing']
+        rear_found, rear_crossing_time, _ = trigger(crossing_pos + train_length)
+        
+        _, s0_time, s0_speed = triggers['s0']
+        _, s1_time, s1_speed = triggers['s1']
+        _, s2_time, s2_speed = triggers['s2']
+        crossing_time = triggers['crossing'][1]
+        s0_pos, s1_pos, s2_pos = self.sensors['s0'], self.sensors['s1'], self.sensors['s2']
+        
+        time_01 = s1_time - s0_time
+        time_12 = s2_time - s1_time
+        valid = np.logical_and.reduce([found for found, _, _ in triggers.values()])
+        valid &= rear_found & (time_01 > 0) & (time_12 > 0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            accel_01 = (s1_speed - s0_speed) / time_01
+            accel_12 = (s2_speed - s1_speed) / time_12
+            distance_remaining = crossing_pos - s2_pos
+            moving = s2_speed > 0
+            time_to_crossing = np.where(moving, distance_remaining / s2_speed, 0)
+            
+            features = pd.DataFrame({
+                'distance_remaining': np.full(n_runs, distance_remaining),
+                'train_length': train_length,
+                'last_speed': s2_speed,
+                'speed_change': s2_speed - s0_speed,
+                'time_01': time_01,
+                'time_12': time_12,
+                'avg_speed_01': (s1_pos - s0_pos) / time_01,
+                'avg_speed_12': (s2_pos - s1_pos) / time_12,
+                'speed_0': s0_speed,
+                'speed_1': s1_speed,
+                'accel_01': accel_01,
+                'accel_12': accel_12,
+                'accel_trend': accel_12 - accel_01,
+                'predicted_crossing_speed': np.clip(s2_speed + accel_12 * time_to_crossing, 5.0, 50.0),
+                'eta_actual': crossing_time - s2_time,
+                'etd_actual': rear_crossing_time - s2_time,
+                'eta_physics': np.where(moving, distance_remaining / s2_speed, 0),
+                'etd_physics': np.where(moving, (distance_remaining + train_length) / s2_speed, 0),
+                'scenario': scenario,
+                'run_id': run_ids
+            })
+        
+        return features[valid].reset_index(drop=True)
     
     def extract_features(self, run_df):
         """Extract 14 features from trajectory (poster version)"""
         run_df = run_df.sort_values('time')
         train_length = run_df['length'].iloc[0]
         scenario = run_df['scenario'].iloc[0]
+        samples = [run_df[c].to_numpy(dtype=float) for c in ('time', 'pos', 'speed', 'acceleration')]
         
         # Find sensor trigger times
         triggers = {}
         for sensor_id, sensor_pos in self.sensors.items():
-            mask = run_df['pos'] >= sensor_pos
-            if mask.any():
-                idx = mask.idxmax()
+            state = self.trigger_state(*samples, sensor_pos)
+            if state is not None:
                 triggers[sensor_id] = {
-                    'time': run_df.loc[idx, 'time'],
-                    'speed': run_df.loc[idx, 'speed'],
-                    'accel': run_df.loc[idx, 'acceleration'],
+                    'time': state[0],
+                    'speed': state[1],
+                    'accel': state[2],
                     'pos': sensor_pos
                 }
         
@@ -225,10 +893,10 @@ class TrainingDataGenerator:
         crossing_pos = triggers['crossing']['pos']
         
         # Find rear crossing time
-        rear_crossing_mask = run_df['pos'] >= (crossing_pos + train_length)
-        if not rear_crossing_mask.any():
+        rear_crossing = self.trigger_state(*samples, crossing_pos + train_length)
+        if rear_crossing is None:
             return None
-        rear_crossing_time = run_df.loc[rear_crossing_mask.idxmax(), 'time']
+        rear_crossing_time = rear_crossing[0]
         
         # Calculate timing features
         time_01 = s1_time - s0_time
@@ -285,6 +953,205 @@ class TrainingDataGenerator:
             'run_id': run_df['run_id'].iloc[0]
         }
     
+    def trigger_state(self, time, pos, speed, accel, target):
+        """(time, speed, acceleration) when pos first reaches target, interpolated between samples"""
+        i = int(np.argmax(pos >= target))
+        if pos[i] < target:
+            return None
+        if not self.interpolate or i == 0 or pos[i] <= pos[i - 1]:
+            return float(time[i]), float(speed[i]), float(accel[i])
+        
+        # Acceleration is constant over a step, so only time and speed are interpolated
+        frac = (target - pos[i - 1]) / (pos[i] - pos[i - 1])
+        return (float(time[i - 1] + frac * (time[i] - time[i - 1])),
+                float(speed[i - 1] + frac * (speed[i] - speed[i - 1])),
+                float(accel[i]))
+    
+    def validate_numpy_backend(self, n_runs=100):
+        """Report per-feature error of the numpy backend against SUMO runs"""
+        Logger.section(f"Validating numpy backend against SUMO ({n_runs} runs)")
+        
+        self.check_sumo()
+        if not self.generate_network():
+            return None
+        
+        batch = list(enumerate(self.generate_train_params(n_runs)))
+        seeds = self.generate_run_seeds(n_runs)
+        
+        reference = {}
+        for (run_id, params), seed in zip(batch, seeds):
+            reference.update(self.run_simulation([(run_id, params)], seed))
+        emulated = self.run_simulation_numpy(batch, seeds[0])
+        
+        pairs = []
+        for run_id, _ in batch:
+            if run_id not in reference or run_id not in emulated:
+                continue
+            expected = self.extract_features(reference[run_id])
+            actual = self.extract_features(emulated[run_id])
+            if expected is not None and actual is not None:
+                pairs.append((expected, actual))
+        
+        if not pairs:
+            Logger.log("No runs produced features with both backends")
+            return None
+        
+        report = {'n_runs': len(pairs), 'features': {}}
+        Logger.log(f"{'feature':<26}{'MAE':>10}{'rel. error':>12}")
+        for name, value in pairs[0][0].items():
+            if name in ('scenario', 'run_id'):
+                continue
+            expected = np.array([e[name] for e, _ in pairs], dtype=float)
+            actual = np.array([a[name] for _, a in pairs], dtype=float)
+            mae = float(np.mean(np.abs(actual - expected)))
+            scale = float(np.mean(np.abs(expected)))
+            relative = mae / scale if scale > 0 else 0.0
+            report['features'][name] = {'mae': mae, 'relative_error': relative}
+            Logger.log(f"{name:<26}{mae:>10.4f}{relative * 100:>11.2f}%")
+        
+        report_path = self.output_dir / 'backend_validation.json'
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        Logger.log(f"Saved: {report_path}")
+        
+        return report
+    
+    def check_retention(self, n_runs=200):
+        """Assert that every retention mode leaves extracted features unchanged"""
+        Logger.section(f"Checking trajectory retention on {n_runs} runs")
+        
+        if self.backend != 'numpy' and not self.generate_network():
+            return False
+        
+        batch = list(enumerate(self.generate_train_params(n_runs)))
+        retention = self.config['training'].setdefault('retention', {})
+        configured_mode = retention.get('mode', 'full')
+        retention['mode'] = 'full'
+        try:
+            trajectories = self.simulate_runs(batch, self.generate_run_seeds(n_runs))
+        finally:
+            retention['mode'] = configured_mode
+        
+        reference = {run_id: self.extract_features(run_df) for run_id, run_df in trajectories.items()}
+        total_rows = sum(len(run_df) for run_df in trajectories.values())
+        
+        passed = True
+        for mode in ('windowed', 'decimated'):
+            kept_rows = 0
+            mismatches = 0
+            for run_id, run_df in trajectories.items():
+                keep = self.retention_mask(run_df['pos'].to_numpy(), run_df['length'].iloc[0], mode)
+                retained = run_df[keep].reset_index(drop=True)
+                kept_rows += len(retained)
+                if self.extract_features(retained) != reference[run_id]:
+                    mismatches += 1
+            
+            Logger.log(f"{mode:>9}: keeps {kept_rows / total_rows * 100:.1f}% of samples, "
+                       f"{mismatches} runs with changed features")
+            passed &= mismatches == 0
+        
+        Logger.log("Retention check " + ("passed" if passed else "FAILED"))
+        return passed
+    
+    def check_sampling(self, n_samples=100000, n_chunks=4):
+        """Time each sampling method, check chunked draws match one draw, report discrepancy"""
+        from scipy.stats import qmc
+        Logger.section(f"Checking parameter sampling ({n_samples} samples, {n_chunks} chunks)")
+        
+        passed = True
+        Logger.log(f"{'method':>8}{'ms':>10}{'chunks':>10}{'discrepancy':>14}")
+        for method in ('random', 'sobol', 'lhs'):
+            sampler = self.param_sampler(method)
+            start = perf_counter()
+            full = sampler.sample(n_samples)
+            elapsed = perf_counter() - start
+            
+            bounds = np.linspace(0, n_samples, n_chunks + 1).astype(int)
+            chunks = np.concatenate([sampler.sample(n_samples, a, b - a) for a, b in zip(bounds[:-1], bounds[1:])])
+            consistent = np.array_equal(chunks, full)
+            passed &= consistent
+            
+            # Centered L2 discrepancy of the unit-cube points (lower is more even coverage)
+            n_points = min(n_samples, 4096)
+            discrepancy = qmc.discrepancy(sampler.unit_samples(0, n_points, n_points))
+            Logger.log(f"{method:>8}{elapsed * 1000:>10.1f}{'match' if consistent else 'DIFFER':>10}{discrepancy:>14.2e}")
+        
+        Logger.log("Sampling check " + ("passed" if passed else "FAILED"))
+        return passed
+    
+    def simulate_runs(self, batch, seeds):
+        """Trajectories of independent single-train runs (numpy simulates them in one batch)"""
+        if self.backend == 'numpy':
+            return self.run_simulation_numpy(batch)
+        
+        trajectories = {}
+        for (run_id, params), seed in zip(batch, seeds):
+            trajectories.update(self.run_simulation([(run_id, params)], seed))
+        return trajectories
+    
+    def compare_step_lengths(self, n_runs=100, step_lengths=STEP_LENGTHS):
+        """Report ETA/ETD label error per step length, with and without trigger interpolation"""
+        Logger.section(f"Comparing step lengths {step_lengths} on {n_runs} runs ({self.backend} backend)")
+        
+        batch = list(enumerate(self.generate_train_params(n_runs)))
+        seeds = self.generate_run_seeds(n_runs)
+        configured = self.step_length, self.interpolate
+        
+        labels = {}
+        stats = {}
+        try:
+            for step_length in sorted(step_lengths):
+                self.step_length = step_length
+                if self.backend != 'numpy' and not self.generate_network():
+                    return None
+                
+                start = perf_counter()
+                trajectories = self.simulate_runs(batch, seeds)
+                elapsed = perf_counter() - start
+                stats[step_length] = (elapsed / n_runs, sum(len(df) for df in trajectories.values()) / max(len(trajectories), 1))
+                
+                for interpolate in (False, True):
+                    self.interpolate = interpolate
+                    features = {run_id: self.extract_features(df) for run_id, df in trajectories.items()}
+                    labels[step_length, interpolate] = {
+                        run_id: (f['eta_actual'], f['etd_actual']) for run_id, f in features.items() if f is not None
+                    }
+        finally:
+            self.step_length, self.interpolate = configured
+        
+        # Reference labels: the finest step, interpolated
+        reference = labels[min(step_lengths), True]
+        
+        report = {'n_runs': n_runs, 'backend': self.backend, 'reference_step_length': min(step_lengths), 'results': []}
+        Logger.log(f"{'step':>6}{'interp':>8}{'runs':>6}{'ETA MAE':>10}{'ETD MAE':>10}{'ETA max':>10}"
+                   f"{'rows/run':>10}{'ms/run':>9}")
+        for (step_length, interpolate), runs in labels.items():
+            common = [run_id for run_id in runs if run_id in reference]
+            errors = np.array([np.subtract(runs[run_id], reference[run_id]) for run_id in common]).reshape(-1, 2)
+            mae = np.abs(errors).mean(axis=0) if len(errors) else np.full(2, np.nan)
+            eta_max = float(np.abs(errors[:, 0]).max()) if len(errors) else float('nan')
+            seconds, rows = stats[step_length]
+            
+            report['results'].append({
+                'step_length': step_length,
+                'interpolate': interpolate,
+                'n_runs': len(common),
+                'eta_mae': float(mae[0]),
+                'etd_mae': float(mae[1]),
+                'eta_max_error': eta_max,
+                'rows_per_run': rows,
+                'seconds_per_run': seconds
+            })
+            Logger.log(f"{step_length:>6}{'yes' if interpolate else 'no':>8}{len(common):>6}{mae[0]:>10.4f}"
+                       f"{mae[1]:>10.4f}{eta_max:>10.4f}{rows:>10.0f}{seconds * 1000:>9.1f}")
+        
+        report_path = self.output_dir / 'step_length_report.json'
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        Logger.log(f"Saved: {report_path}")
+        
+        return report
+    
     def plot_results(self, trajectories, features):
         """Create visualization (poster Fig 5, 9-12)"""
         fig, axes = plt.subplots(2, 2, figsize=(14, 10))
@@ -344,57 +1211,325 @@ class TrainingDataGenerator:
         Logger.log(f"Saved: {plot_path}")
         plt.close()
     
-    def generate(self, n_samples=None):
+    def trajectories_path(self):
+        """Where generate stores trajectories for the configured output format"""
+        if self.output_format == 'csv':
+            return self.output_dir / 'trajectories.csv'
+        return self.output_dir / 'trajectories'
+    
+    def features_path(self):
+        """Where generate stores features for the configured output format"""
+        if self.output_format == 'csv':
+            return self.output_dir / 'features.csv'
+        return self.output_dir / 'features'
+    
+    def load_trajectories(self, run_ids=None):
+        """Read stored trajectories (memory-mapped for the npy format)"""
+        path = self.trajectories_path()
+        if self.output_format == 'csv':
+            # Samples are float32 in memory and in the npy format; read them back the same way
+            trajectories = pd.read_csv(path, dtype={name: np.float32 for name in FCD_COLUMNS})
+            return trajectories if run_ids is None else trajectories[trajectories['run_id'].isin(run_ids)]
+        if run_ids is None:
+            return read_table(path)
+        return pd.concat([read_partition(path, run_id) for run_id in run_ids], ignore_index=True)
+    
+    def reextract_features(self):
+        """Recompute features from stored trajectories with the batched extractor"""
+        Logger.section("Re-extracting features from stored trajectories")
+        
+        start = perf_counter()
+        trajectories = self.load_trajectories()
+        loaded = perf_counter()
+        features = self.extract_features_batch(trajectories)
+        extracted = perf_counter()
+        
+        Logger.log(f"Loaded {len(trajectories)} samples in {loaded - start:.2f}s")
+        Logger.log(f"Extracted {len(features)} feature rows in {extracted - loaded:.2f}s")
+        
+        if self.output_format == 'csv':
+            features.to_csv(self.features_path(), index=False)
+        else:
+            write_table(features, self.features_path(), categorical=['scenario'])
+        Logger.log(f"Saved: {self.features_path()}")
+        
+        return features
+    
+    def benchmark_extraction(self, n_runs=1000):
+        """Compare per-run and batched feature extraction on numpy-backend trajectories"""
+        Logger.section(f"Benchmarking feature extraction ({n_runs} runs)")
+        
+        batch = list(enumerate(self.generate_train_params(n_runs)))
+        trajectories = {}
+        for i in range(0, n_runs, NUMPY_BATCH_SIZE):
+            trajectories.update(self.run_simulation_numpy(batch[i:i + NUMPY_BATCH_SIZE]))
+        combined = pd.concat(trajectories.values(), ignore_index=True)
+        
+        start = perf_counter()
+        reference = [self.extract_features(run_df) for run_df in trajectories.values()]
+        per_run = perf_counter() - start
+        
+        start = perf_counter()
+        batched = self.extract_features_batch(combined)
+        vectorized = perf_counter() - start
+        
+        Logger.log(f"per-run: {per_run:.2f}s ({per_run / n_runs * 1e6:.0f} us/run)")
+        Logger.log(f"batched: {vectorized:.3f}s ({vectorized / n_runs * 1e6:.1f} us/run), "
+                   f"{per_run / vectorized:.0f}x faster")
+        
+        expected = pd.DataFrame([f for f in reference if f is not None])
+        if not expected.equals(batched.astype(expected.dtypes.to_dict())) or list(expected.columns) != list(batched.columns):
+            Logger.log("MISMATCH between per-run and batched features")
+            return False
+        
+        Logger.log(f"Extractors agree on all {len(batched)} runs")
+        return True
+    
+    def generation_fingerprint(self, n_samples, batch_size):
+        """Hash of every setting that changes what a generation run produces"""
+        training = {k: v for k, v in self.config['training'].items() if k not in ('workers', 'cache')}
+        return RunCache.make_key({
+            'n_samples': n_samples,
+            'batch_size': batch_size,
+            'backend': self.backend,
+            'training': training,
+            'network': self.config['network'],
+            'sensors': self.sensors
+        })
+    
+    def generate(self, n_samples=None, workers=None, batch_size=None, use_cache=True, resume=False):
         """Run complete data generation pipeline"""
         if n_samples is None:
             n_samples = self.config['training']['n_samples']
+        if workers is None:
+            workers = self.config['training'].get('workers', 1)
+        batch_size = self.resolve_batch_size(n_samples, batch_size)
         
-        Logger.section(f"Generating {n_samples} training samples")
+        Logger.section(f"Generating {n_samples} training samples "
+                       f"({self.backend} backend, {workers} workers, {batch_size} trains per simulation)")
         
-        if not self.generate_network():
+        if self.backend != 'numpy' and not self.generate_network(batch_size):
             return False
         
+        checkpoint = GenerationCheckpoint(
+            self.output_dir / 'checkpoint',
+            self.generation_fingerprint(n_samples, batch_size),
+            self.config['training'].get('checkpoint_every', 100),
+            self.output_format
+        )
+        try:
+            done = checkpoint.start(resume)
+        except ValueError as e:
+            Logger.log(f"ERROR: {e}. Rerun without --resume to start over.")
+            return False
+        if done:
+            Logger.log(f"Resuming: {len(done)} runs already finished")
+        
         train_params = self.generate_train_params(n_samples)
-        all_trajectories = []
-        all_features = []
-        successful = 0
+        seeds = self.generate_run_seeds(n_samples)
+        tasks = [task for task in zip(range(n_samples), train_params, seeds) if task[0] not in done]
         
-        for i, params in enumerate(train_params):
-            trajectory_df = self.run_simulation(params, i)
-            
-            if trajectory_df is not None and len(trajectory_df) > 10:
-                all_trajectories.append(trajectory_df)
+        # Keep a handful of trajectories (reservoir sample) for the plots instead of all of them
+        plot_samples = []
+        n_trajectories = 0
+        
+        cache = self.open_cache(use_cache)
+        
+        try:
+            for i, (trajectory_df, features) in enumerate(self.iter_runs(tasks, workers, batch_size, cache), len(done)):
+                checkpoint.add(tasks[i - len(done)][0], trajectory_df, features)
                 
-                features = self.extract_features(trajectory_df)
-                if features is not None:
-                    all_features.append(features)
-                    successful += 1
-            
-            if (i + 1) % 100 == 0:
-                Logger.log(f"Progress: {successful}/{i+1} ({successful/(i+1)*100:.1f}%)")
+                if trajectory_df is not None:
+                    n_trajectories += 1
+                    if len(plot_samples) < 5:
+                        plot_samples.append(trajectory_df)
+                    elif np.random.randint(n_trajectories) < 5:
+                        plot_samples[np.random.randint(5)] = trajectory_df
+                
+                successful = checkpoint.successful
+                if (i + 1) % 100 == 0:
+                    Logger.log(f"Progress: {successful}/{i+1} ({successful/(i+1)*100:.1f}%)")
+        finally:
+            self.close_traci()
+            checkpoint.flush()
         
-        if not all_trajectories or not all_features:
-            Logger.log("No successful simulations")
-            return False
+        if cache is not None:
+            removed, size = cache.evict()
+            Logger.log(f"Cache: {size / 1e6:.1f} MB on disk, {removed} entries evicted")
         
         # Save results
-        trajectories = pd.concat(all_trajectories, ignore_index=True)
-        trajectories.to_csv(self.output_dir / 'trajectories.csv', index=False)
+        features = checkpoint.finalize(self.output_dir)
+        if features.empty:
+            Logger.log("No successful simulations")
+            return False
+        checkpoint.remove()
         
-        features = pd.DataFrame(all_features)
-        features.to_csv(self.output_dir / 'features.csv', index=False)
+        self.log_summary(features)
+        if plot_samples:
+            self.plot_results(pd.concat(plot_samples, ignore_index=True), features)
         
-        Logger.log(f"\nGenerated {successful} samples")
+        return True
+    
+    def resolve_batch_size(self, n_samples, batch_size=None):
+        """Trains per simulation: training.batch_size, or a large batch for the numpy backend"""
+        if batch_size is None:
+            batch_size = self.config['training'].get('batch_size', 1)
+        if self.backend == 'numpy' and batch_size == 1:
+            batch_size = min(n_samples, NUMPY_BATCH_SIZE)
+        return batch_size
+    
+    def log_summary(self, features):
+        """Log dataset statistics and the output paths"""
+        Logger.log(f"\nGenerated {len(features)} samples")
         Logger.log(f"ETA mean: {features['eta_actual'].mean():.2f}s")
         Logger.log(f"ETD mean: {features['etd_actual'].mean():.2f}s")
         Logger.log(f"Physics baseline ETA error: {np.mean(np.abs(features['eta_actual'] - features['eta_physics'])):.3f}s")
         Logger.log(f"Physics baseline ETD error: {np.mean(np.abs(features['etd_actual'] - features['etd_physics'])):.3f}s")
         Logger.log(f"\nSaved:")
-        Logger.log(f"  {self.output_dir / 'trajectories.csv'}")
-        Logger.log(f"  {self.output_dir / 'features.csv'}")
+        Logger.log(f"  {self.trajectories_path()}")
+        Logger.log(f"  {self.features_path()}")
+    
+    def open_queue(self, queue_dir):
+        """Work queue in queue_dir with the lease from training.queue"""
+        return WorkQueue(queue_dir, self.config['training'].get('queue', {}).get('lease_seconds', 600))
+    
+    def coordinate_queue(self, queue_dir, n_samples=None, batch_size=None):
+        """Publish a generation job to a work queue, wait for the workers, then merge the shards"""
+        if n_samples is None:
+            n_samples = self.config['training']['n_samples']
+        settings = self.config['training'].get('queue', {})
+        # The numpy backend's automatic batch grows only up to one chunk, so chunks stay shareable
+        batch_size = self.resolve_batch_size(min(n_samples, settings.get('chunk_size', 500)), batch_size)
+        
+        # Whole batches per chunk, so batched runs match a single-machine generate
+        chunk_size = -(-settings.get('chunk_size', 500) // batch_size) * batch_size
+        queue = self.open_queue(queue_dir)
+        job = queue.create({
+            'fingerprint': self.generation_fingerprint(n_samples, batch_size),
+            'n_samples': n_samples,
+            'batch_size': batch_size,
+            'chunk_size': chunk_size
+        })
+        if job['fingerprint'] != self.generation_fingerprint(n_samples, batch_size):
+            Logger.log(f"ERROR: {queue_dir} holds a job with different settings. Use an empty queue directory.")
+            return False
         
-        self.plot_results(trajectories, features)
+        n_chunks = queue.n_chunks(job)
+        Logger.section(f"Coordinating {queue_dir}: {n_samples} runs in {n_chunks} chunks of {job['chunk_size']}")
+        Logger.log(f"Start workers with: python train_data.py --queue {queue_dir} --queue-action work")
+        
+        last = None
+        while True:
+            status = queue.status(job)
+            if status != last:
+                Logger.log(f"Chunks: {status['done']}/{n_chunks} done, {status['claimed']} claimed, "
+                           f"{status['expired']} expired leases, {status['pending']} pending")
+                last = status
+            if status['done'] == n_chunks:
+                break
+            sleep(settings.get('poll_seconds', 10))
+        
+        return self.merge_queue(queue, job)
+    
+    def work_queue(self, queue_dir, workers=None, use_cache=True):
+        """Claim and simulate chunks of a queued job until every chunk is done"""
+        queue = self.open_queue(queue_dir)
+        job = queue.load_job()
+        if job is None:
+            Logger.log(f"ERROR: No job in {queue_dir}. Start a coordinator first.")
+            return False
+        if job['fingerprint'] != self.generation_fingerprint(job['n_samples'], job['batch_size']):
+            Logger.log(f"ERROR: Job in {queue_dir} was created with different settings than {self.config_path}")
+            return False
+        if workers is None:
+            workers = self.config['training'].get('workers', 1)
+        
+        n_chunks = queue.n_chunks(job)
+        Logger.section(f"Working on {queue_dir} as {queue.token} ({self.backend} backend, {workers} workers)")
+        
+        if self.backend != 'numpy' and not self.generate_network(job['batch_size']):
+            return False
+        cache = self.open_cache(use_cache)
+        
+        finished = 0
+        try:
+            while True:
+                chunk = next((chunk for chunk in range(n_chunks) if queue.claim(chunk)), None)
+                if chunk is not None:
+                    finished += self.run_chunk(queue, job, chunk, workers, cache)
+                    continue
+                
+                # Everything left is leased to other workers; wait in case a lease expires
+                if queue.status(job)['done'] == n_chunks:
+                    break
+                sleep(self.config['training'].get('queue', {}).get('poll_seconds', 10))
+        finally:
+            self.close_traci()
+        
+        Logger.log(f"Queue finished, this worker committed {finished} chunks")
+        return True
+    
+    def run_chunk(self, queue, job, chunk, workers, cache):
+        """Simulate one claimed chunk into a shard; returns 1 if this worker's shard was committed"""
+        start, count = queue.chunk_range(job, chunk)
+        Logger.log(f"Chunk {chunk}: runs {start}-{start + count - 1}")
+        
+        params = self.generate_train_params(job['n_samples'], start, count)
+        tasks = [(start + i, p, self.run_seed(start + i)) for i, p in enumerate(params)]
+        
+        shard = GenerationCheckpoint(
+            queue.shard_tmp_dir(chunk),
+            job['fingerprint'],
+            self.config['training'].get('checkpoint_every', 100),
+            self.output_format
+        )
+        shard.start()
+        
+        renewed = perf_counter()
+        for (run_id, _, _), (trajectory_df, features) in zip(tasks, self.iter_runs(tasks, workers, job['batch_size'], cache)):
+            shard.add(run_id, trajectory_df, features)
+            if perf_counter() - renewed > queue.lease_seconds / 4:
+                queue.heartbeat(chunk)
+                renewed = perf_counter()
+        shard.flush()
+        
+        if not queue.commit(chunk, shard.checkpoint_dir):
+            Logger.log(f"Chunk {chunk} was already committed by another worker")
+            return 0
+        return 1
+    
+    def queue_status(self, queue_dir):
+        """Log chunk progress of a queued job"""
+        queue = self.open_queue(queue_dir)
+        job = queue.load_job()
+        if job is None:
+            Logger.log(f"No job in {queue_dir}")
+            return False
+        
+        status = queue.status(job)
+        Logger.log(f"{job['n_samples']} runs in {queue.n_chunks(job)} chunks of {job['chunk_size']}: "
+                   + ', '.join(f"{count} {state}" for state, count in status.items()))
+        return True
+    
+    def merge_queue(self, queue, job):
+        """Combine all committed shards into the usual trajectory and feature outputs"""
+        Logger.section(f"Merging {queue.n_chunks(job)} shards")
+        
+        merged = GenerationCheckpoint(queue.queue_dir / 'merge', job['fingerprint'], output_format=self.output_format)
+        merged.start()
+        for chunk in range(queue.n_chunks(job)):
+            merged.absorb(queue.shard_dir(chunk))
+        
+        features = merged.finalize(self.output_dir)
+        merged.remove()
+        queue.clean()
+        if features.empty:
+            Logger.log("No successful simulations")
+            return False
         
+        self.log_summary(features)
+        sample_ids = np.random.choice(features['run_id'], min(5, len(features)), replace=False)
+        self.plot_results(self.load_trajectories(sample_ids), features)
         return True
 
 
@@ -403,8 +1538,55 @@ if __name__ == '__main__':
     
     parser = argparse.ArgumentParser(description='Generate ML training data')
     parser.add_argument('--samples', type=int, help='Number of samples to generate')
+    parser.add_argument('--workers', type=int, help='Parallel SUMO processes (default: training.workers)')
+    parser.add_argument('--batch-size', type=int, help='Trains per SUMO simulation (default: training.batch_size)')
+    parser.add_argument('--backend', choices=TrainingDataGenerator.BACKENDS, help='Simulation backend (default: training.backend)')
+    parser.add_argument('--no-cache', action='store_true', help='Simulate every run, ignoring outputs/cache')
+    parser.add_argument('--resume', action='store_true', help='Continue an interrupted run from outputs/checkpoint')
+    parser.add_argument('--bench-fcd', action='store_true', help='Benchmark FCD parsers on a synthetic file')
+    parser.add_argument('--validate-numpy', type=int, nargs='?', const=100, metavar='N',
+                        help='Compare numpy backend features against N SUMO runs')
+    parser.add_argument('--check-retention', type=int, nargs='?', const=200, metavar='N',
+                        help='Assert retention modes keep features unchanged on N runs')
+    parser.add_argument('--extract', action='store_true', help='Recompute features from stored trajectories')
+    parser.add_argument('--bench-extract', type=int, nargs='?', const=1000, metavar='N',
+                        help='Benchmark per-run against batched feature extraction on N runs')
+    parser.add_argument('--check-sampling', type=int, nargs='?', const=100000, metavar='N',
+                        help='Time sampling methods on N samples and check chunked draws are identical')
+    parser.add_argument('--compare-steps', type=int, nargs='?', const=100, metavar='N',
+                        help=f'Report label accuracy at step lengths {STEP_LENGTHS} on N runs')
+    parser.add_argument('--queue', metavar='DIR', help='Shared work queue directory for multi-process/multi-node runs')
+    parser.add_argument('--queue-action', choices=('coordinate', 'work', 'status'), default='work',
+                        help='coordinate: publish the job, wait and merge; work: process chunks; status: show progress')
     parser.add_argument('--config', default='config.yaml', help='Config file path')
     args = parser.parse_args()
     
-    generator = TrainingDataGenerator(args.config)
-    generator.generate(args.samples)
\ No newline at end of file
+    generator = TrainingDataGenerator(args.config, args.backend)
+    if args.queue:
+        if args.queue_action == 'coordinate':
+            ok = generator.coordinate_queue(args.queue, args.samples, args.batch_size)
+        elif args.queue_action == 'work':
+            ok = generator.work_queue(args.queue, args.workers, not args.no_cache)
+        else:
+            ok = generator.queue_status(args.queue)
+        if not ok:
+            raise SystemExit(1)
+    elif args.bench_fcd:
+        generator.benchmark_fcd(args.batch_size or 1)
+    elif args.validate_numpy:
+        generator.validate_numpy_backend(args.validate_numpy)
+    elif args.check_retention:
+        if not generator.check_retention(args.check_retention):
+            raise SystemExit(1)
+    elif args.extract:
+        generator.reextract_features()
+    elif args.bench_extract:
+        if not generator.benchmark_extraction(args.bench_extract):
+            raise SystemExit(1)
+    elif args.check_sampling:
+        if not generator.check_sampling(args.check_sampling):
+            raise SystemExit(1)
+    elif args.compare_steps:
+        generator.compare_step_lengths(args.compare_steps)
+    else:
+        generator.generate(args.samples, args.workers, args.batch_size, not args.no_cache, args.resume)
\ No newline at end of file
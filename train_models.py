@@ -2,9 +2,10 @@
 Train Random Forest models for ETA/ETD prediction
 Poster results: ETA MAE=0.031s (R²=0.986), ETD MAE=0.058s (R²=0.99)
 Models: ETA (10 trees), ETD (5 trees), 14 features each
-Usage: python train_models.py
+Usage: python train_models.py [--search] [--out-of-core] [--compress] [--update NEW_FEATURES]
 """
 
+import os
 import pandas as pd
 import numpy as np
 import pickle
@@ -12,13 +13,68 @@ import json
 import yaml
 import matplotlib.pyplot as plt
 from pathlib import Path
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split, KFold, ParameterGrid, ParameterSampler
+from concurrent.futures import ProcessPoolExecutor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from time import perf_counter
 from utils.logger import Logger
+from utils.columnar import read_table
+from utils.cache import RunCache, json_default
+from utils.forest import FlatForest, FEATURE_COLS
+from utils.backends import BACKENDS, FOREST_BACKENDS
+from utils.streaming import iter_chunks, hash_fraction, RunningStats, RunningErrors, Reservoir
+
+
+SEARCH_PARAMS = ('n_estimators', 'max_depth', 'min_samples_split', 'min_samples_leaf')
+
+TARGET_COLS = ('eta_actual', 'etd_actual', 'eta_physics', 'etd_physics')
+
+# Out-of-core memory model: bytes per bootstrap row beyond its float32 features (target, weight, sklearn's
+# sample index and sort buffers) and copies of a chunk alive while it is parsed and typed
+SAMPLE_OVERHEAD_BYTES = 40
+CHUNK_COPIES = 3
+
+_search = None
+
+
+def _init_search_worker(X, targets, n_folds, random_state, forest_class):
+    """Keep the feature matrix, fold indices and forest class in the worker; one thread per fit"""
+    global _search
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(1)
+    
+    folds = list(KFold(n_folds, shuffle=True, random_state=random_state).split(X))
+    _search = {'X': X, 'targets': targets, 'folds': folds, 'random_state': random_state,
+               'forest_class': forest_class}
+
+
+def _search_task(task):
+    """Fit and score one (target, params, fold) in a pool worker"""
+    target, params, fold = task
+    train_idx, test_idx = _search['folds'][fold]
+    X, y = _search['X'], _search['targets'][target]
+    
+    model = _search['forest_class'](random_state=_search['random_state'], n_jobs=1, **params)
+    start = perf_counter()
+    model.fit(X[train_idx], y[train_idx])
+    fit_seconds = perf_counter() - start
+    
+    start = perf_counter()
+    predictions = model.predict(X[test_idx])
+    predict_seconds = perf_counter() - start
+    
+    return {
+        'mae': float(mean_absolute_error(y[test_idx], predictions)),
+        'fit_seconds': fit_seconds,
+        'predict_us_per_row': predict_seconds / len(test_idx) * 1e6
+    }
 
 
 class ModelTrainer:
+    # All 14 features (poster version)
+    FEATURE_COLS = FEATURE_COLS
+    
     def __init__(self, config_path='config.yaml'):
         with open(config_path) as f:
             self.config = yaml.safe_load(f)
@@ -26,37 +82,34 @@ class ModelTrainer:
         self.output_dir = Path('outputs')
         self.plots_dir = self.output_dir / 'plots'
         self.plots_dir.mkdir(parents=True, exist_ok=True)
+        self.n_jobs = -1
     
-    def load_features(self):
-        """Load extracted features"""
-        features_path = self.output_dir / 'features.csv'
+    def features_path(self):
+        """Extracted features for the configured output format, or None (with a hint) if missing"""
+        if self.config['training'].get('output_format', 'csv') == 'csv':
+            features_path = self.output_dir / 'features.csv'
+        else:
+            features_path = self.output_dir / 'features'
         
         if not features_path.exists():
             Logger.log(f"ERROR: Features file not found: {features_path}")
             Logger.log("Run: python train_data.py")
             return None
+        return features_path
+    
+    def load_features(self):
+        """Load extracted features (CSV or memory-mapped npy table)"""
+        features_path = self.features_path()
+        if features_path is None:
+            return None
         
-        return pd.read_csv(features_path)
+        if features_path.suffix == '.csv':
+            return pd.read_csv(features_path)
+        return read_table(features_path)
     
     def prepare_data(self, features_df, target_col):
         """Split data into train/test sets"""
-        # All 14 features (poster version)
-        feature_cols = [
-            'distance_remaining',
-            'train_length',
-            'last_speed',
-            'speed_change',
-            'time_01',
-            'time_12',
-            'avg_speed_01',
-            'avg_speed_12',
-            'speed_0',
-            'speed_1',
-            'accel_01',
-            'accel_12',
-            'accel_trend',
-            'predicted_crossing_speed'
-        ]
+        feature_cols = list(self.FEATURE_COLS)
         
         X = features_df[feature_cols]
         y = features_df[target_col]
@@ -68,17 +121,44 @@ class ModelTrainer:
         
         return X_train, X_test, y_train, y_test, feature_cols
     
+    def split_data(self, features_df, target_col, split='rows'):
+        """Train/test sets as a model was trained on: prepare_data's row split, or the out-of-core run_id split"""
+        if split != 'run_id':
+            return self.prepare_data(features_df, target_col)
+        
+        feature_cols = list(self.FEATURE_COLS)
+        test = self.is_test(features_df['run_id'].to_numpy())
+        X = features_df[feature_cols]
+        y = features_df[target_col]
+        return X[~test], X[test], y[~test], y[test], feature_cols
+    
+    def forest_backend(self):
+        """Configured backend; only backends that compile to flat arrays are deployable"""
+        backend = self.config['model'].get('backend', 'random_forest')
+        if backend not in FOREST_BACKENDS:
+            raise ValueError(f"model.backend must be one of {FOREST_BACKENDS} for trained models, got '{backend}' "
+                             f"(compare the others with compare_backends.py)")
+        return BACKENDS[backend]
+    
+    def forest_class(self):
+        """sklearn forest of the configured backend"""
+        return self.forest_backend().estimator_class
+    
+    def tree_class(self):
+        """sklearn tree the configured forest backend is built from"""
+        return self.forest_backend().tree_class
+    
     def train_eta_model(self, X_train, y_train):
         """Train ETA model with Random Forest (10 trees - poster)"""
         Logger.log("\nTraining ETA model (10 trees, 14 features)")
         
-        model = RandomForestRegressor(
+        model = self.forest_class()(
             n_estimators=self.config['model']['eta_n_estimators'],
             max_depth=self.config['model']['eta_max_depth'],
             min_samples_split=self.config['model']['eta_min_samples_split'],
             min_samples_leaf=self.config['model']['eta_min_samples_leaf'],
             random_state=self.config['model']['random_state'],
-            n_jobs=-1
+            n_jobs=self.n_jobs
         )
         
         model.fit(X_train, y_train)
@@ -88,18 +168,106 @@ class ModelTrainer:
         """Train ETD model with Random Forest (5 trees - poster)"""
         Logger.log("\nTraining ETD model (5 trees, 14 features)")
         
-        model = RandomForestRegressor(
+        model = self.forest_class()(
             n_estimators=self.config['model']['etd_n_estimators'],
             max_depth=self.config['model']['etd_max_depth'],
             min_samples_split=self.config['model']['etd_min_samples_split'],
             min_samples_leaf=self.config['model']['etd_min_samples_leaf'],
             random_state=self.config['model']['random_state'],
-            n_jobs=-1
+            n_jobs=self.n_jobs
         )
         
         model.fit(X_train, y_train)
         return model
     
+    def shared_targets(self, Y):
+        """ETA plus ETD, or ETA plus the clearing time ETD - ETA for the residual variant"""
+        Y = np.asarray(Y, dtype=float).copy()
+        if self.config['model']['shared'].get('target', 'residual') == 'residual':
+            Y[:, 1] -= Y[:, 0]
+        return Y
+    
+    def shared_predictions(self, predictions):
+        """Undo shared_targets: (ETA, ETD) columns from the shared model's outputs"""
+        predictions = np.array(predictions, dtype=float, ndmin=2)
+        if self.config['model']['shared'].get('target', 'residual') == 'residual':
+            predictions[:, 1] += predictions[:, 0]
+        return predictions
+    
+    def train_shared_model(self, X_train, Y_train):
+        """Train one multi-output forest that predicts ETA and ETD in a single traversal"""
+        settings = self.config['model']['shared']
+        Logger.log(f"\nTraining shared ETA/ETD model ({settings['n_estimators']} trees, "
+                   f"{settings.get('target', 'residual')} targets)")
+        
+        model = self.forest_class()(
+            n_estimators=settings['n_estimators'],
+            max_depth=settings['max_depth'],
+            min_samples_split=settings['min_samples_split'],
+            min_samples_leaf=settings['min_samples_leaf'],
+            random_state=self.config['model']['random_state'],
+            n_jobs=self.n_jobs
+        )
+        
+        model.fit(X_train, self.shared_targets(Y_train))
+        return model
+    
+    def compare_shared(self, features_df, separate_models, separate_train_seconds):
+        """Train the shared model and compare accuracy and cost with the two separate forests"""
+        X_train, X_test, Y_train, Y_test, _ = self.prepare_data(features_df, ['eta_actual', 'etd_actual'])
+        
+        start = perf_counter()
+        model = self.train_shared_model(X_train, Y_train)
+        train_seconds = perf_counter() - start
+        
+        # Batch cost through sklearn, hot-path cost as single rows through the flat arrays
+        start = perf_counter()
+        predictions = self.shared_predictions(model.predict(X_test))
+        predict_seconds = perf_counter() - start
+        start = perf_counter()
+        for separate in separate_models:
+            separate.predict(X_test)
+        separate_predict_seconds = perf_counter() - start
+        
+        shared_flat = FlatForest.from_sklearn(model)
+        separate_flat = [FlatForest.from_sklearn(separate) for separate in separate_models]
+        rows = X_test.to_numpy(dtype=np.float32)[:500]
+        start = perf_counter()
+        for x in rows:
+            shared_flat.predict_one(x)
+        single = (perf_counter() - start) / len(rows)
+        start = perf_counter()
+        for x in rows:
+            for forest in separate_flat:
+                forest.predict_one(x)
+        separate_single = (perf_counter() - start) / len(rows)
+        
+        results = {
+            'type': 'RandomForest (multi-output)',
+            'target': self.config['model']['shared'].get('target', 'residual'),
+            'n_estimators': model.n_estimators,
+            'max_depth': model.max_depth,
+            'n_nodes': shared_flat.n_nodes,
+            'separate_n_nodes': sum(forest.n_nodes for forest in separate_flat),
+            'train_seconds': train_seconds,
+            'separate_train_seconds': separate_train_seconds,
+            'predict_us_per_row': predict_seconds / len(X_test) * 1e6,
+            'separate_predict_us_per_row': separate_predict_seconds / len(X_test) * 1e6,
+            'single_row_us': single * 1e6,
+            'separate_single_row_us': separate_single * 1e6
+        }
+        for i, name in enumerate(('eta', 'etd')):
+            results[f'{name}_test_mae'] = float(mean_absolute_error(Y_test.iloc[:, i], predictions[:, i]))
+            results[f'{name}_test_r2'] = float(r2_score(Y_test.iloc[:, i], predictions[:, i]))
+        
+        Logger.log(f"ETA test MAE: {results['eta_test_mae']:.3f}s, ETD test MAE: {results['etd_test_mae']:.3f}s")
+        Logger.log(f"Training: {train_seconds:.2f}s vs {separate_train_seconds:.2f}s for two forests")
+        Logger.log(f"Single-row prediction: {results['single_row_us']:.1f}us vs {results['separate_single_row_us']:.1f}us")
+        
+        targets = ['eta_actual', 'etd_actual - eta_actual' if results['target'] == 'residual' else 'etd_actual']
+        self.save_model(model, results, 'shared_model.pkl', targets)
+        return results
+    
     def evaluate_model(self, model, X_train, X_test, y_train, y_test, features_df, target_col, physics_col, feature_cols):
         """Calculate performance metrics (poster Table 2)"""
         y_train_pred = model.predict(X_train)
@@ -123,7 +291,9 @@ class ModelTrainer:
             'feature_importances': model.feature_importances_.tolist(),
             'feature_names': feature_cols,
             'n_estimators': model.n_estimators,
-            'max_depth': model.max_depth
+            'max_depth': model.max_depth,
+            'split': 'rows',
+            'type': type(model).__name__.replace('Regressor', '')
         }
         
         Logger.log(f"Train MAE: {train_mae:.3f}s")
@@ -220,8 +390,8 @@ class ModelTrainer:
         Logger.log(f"\nSaved: {plot_path}")
         plt.close()
     
-    def save_model(self, model, metrics, filename):
-        """Save trained model"""
+    def save_model(self, model, metrics, filename, targets):
+        """Save trained model (pickle) and its sklearn-free flat artifact"""
         model_data = {
             'model': model,
             'metrics': metrics,
@@ -229,24 +399,59 @@ class ModelTrainer:
             'sklearn_version': __import__('sklearn').__version__
         }
         
+        # Written aside and renamed, so a concurrent reader never sees a partial pickle
         model_path = self.output_dir / filename
-        with open(model_path, 'wb') as f:
+        tmp_path = model_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
             pickle.dump(model_data, f)
+        os.replace(tmp_path, model_path)
         
         Logger.log(f"Saved: {model_path}")
+        
+        artifact_path = FlatForest.from_sklearn(model).save(
+            model_path.with_suffix(''), **self.artifact_metadata(metrics, targets, model_data['sklearn_version'])
+        )
+        Logger.log(f"Saved: {artifact_path}/")
+    
+    def load_model_data(self, name):
+        """Load a pickled model dict (model, metrics, config), or None if it has not been trained"""
+        model_path = self.output_dir / f'{name}_model.pkl'
+        if not model_path.exists():
+            Logger.log(f"ERROR: Model not found: {model_path}")
+            Logger.log("Run: python train_models.py")
+            return None
+        
+        with open(model_path, 'rb') as f:
+            return pickle.load(f)
+    
+    def artifact_metadata(self, metrics, targets, sklearn_version):
+        """model.json fields describing where a flat artifact came from"""
+        return {
+            'feature_names': list(self.FEATURE_COLS),
+            'targets': list(targets),
+            'metrics': metrics,
+            'config': self.config['model'],
+            # Changes whenever the data generation or model settings behind the artifact change
+            'config_hash': RunCache.make_key(self.config['model'], self.config['training'], self.config['sensors']),
+            'sklearn_version': sklearn_version
+        }
     
-    def save_results(self, eta_metrics, etd_metrics, features_df):
+    def dataset_summary(self, features_df):
+        """Sample count and target statistics of the loaded features"""
+        return {
+            'n_samples': len(features_df),
+            'eta_mean': float(features_df['eta_actual'].mean()),
+            'eta_std': float(features_df['eta_actual'].std()),
+            'etd_mean': float(features_df['etd_actual'].mean()),
+            'etd_std': float(features_df['etd_actual'].std())
+        }
+    
+    def save_results(self, eta_metrics, etd_metrics, dataset, shared_metrics=None):
         """Save evaluation results (poster Table 2)"""
         results = {
-            'dataset': {
-                'n_samples': len(features_df),
-                'eta_mean': float(features_df['eta_actual'].mean()),
-                'eta_std': float(features_df['eta_actual'].std()),
-                'etd_mean': float(features_df['etd_actual'].mean()),
-                'etd_std': float(features_df['etd_actual'].std())
-            },
+            'dataset': dataset,
             'eta_model': {
-                'type': 'RandomForest',
+                'type': eta_metrics.get('type', 'RandomForest'),
                 'n_estimators': eta_metrics['n_estimators'],
                 'max_depth': eta_metrics['max_depth'],
                 'n_features': 14,
@@ -258,7 +463,7 @@ class ModelTrainer:
                 'improvement_percent': eta_metrics['improvement_percent']
             },
             'etd_model': {
-                'type': 'RandomForest',
+                'type': etd_metrics.get('type', 'RandomForest'),
                 'n_estimators': etd_metrics['n_estimators'],
                 'max_depth': etd_metrics['max_depth'],
                 'n_features': 14,
@@ -270,10 +475,15 @@ class ModelTrainer:
                 'improvement_percent': etd_metrics['improvement_percent']
             }
         }
+        if shared_metrics is not None:
+            results['shared_model'] = shared_metrics
         
+        # Merged into the existing file, so the search and update sections survive a retrain
         results_path = self.output_dir / 'model_results.json'
+        model_results = json.loads(results_path.read_text()) if results_path.exists() else {}
+        model_results.update(results)
         with open(results_path, 'w') as f:
-            json.dump(results, f, indent=2)
+            json.dump(model_results, f, indent=2, default=json_default)
         
         Logger.log(f"Saved: {results_path}")
         
@@ -302,7 +512,451 @@ class ModelTrainer:
         Logger.log(f"  Test R²: {etd['test_r2']:.3f}")
         Logger.log(f"  Physics baseline: {etd['physics_baseline']:.3f}s")
         Logger.log(f"  Improvement: {etd['improvement_percent']:.1f}%")
+        
+        if 'shared_model' in results:
+            shared = results['shared_model']
+            Logger.log(f"\nShared Model (multi-output, {shared['n_estimators']} trees, {shared['target']} targets)")
+            Logger.log(f"  ETA Test MAE: {shared['eta_test_mae']:.3f}s, ETD Test MAE: {shared['etd_test_mae']:.3f}s")
+            Logger.log(f"  Nodes: {shared['n_nodes']} vs {shared['separate_n_nodes']} in two forests")
+            Logger.log(f"  Training: {shared['train_seconds']:.2f}s vs {shared['separate_train_seconds']:.2f}s")
+            Logger.log(f"  Prediction: {shared['single_row_us']:.1f}us vs {shared['separate_single_row_us']:.1f}us per row")
+    
+    def search_candidates(self, name):
+        """Hyperparameter sets to cross-validate for one target, always including the configured one"""
+        settings = self.config['model'].get('search', {})
+        grid = {param: settings.get('grid', {}).get(param, [self.config['model'][f'{name}_{param}']])
+                for param in SEARCH_PARAMS}
+        
+        if settings.get('method', 'grid') == 'random':
+            candidates = list(ParameterSampler(grid, settings.get('n_iter', 20), random_state=self.config['model']['random_state']))
+        else:
+            candidates = list(ParameterGrid(grid))
+        
+        configured = {param: self.config['model'][f'{name}_{param}'] for param in SEARCH_PARAMS}
+        candidates = [dict(c) for c in candidates]
+        if configured not in candidates:
+            candidates.append(configured)
+        return candidates, configured
+    
+    def search(self, workers=None):
+        """k-fold cross-validated hyperparameter search for both forests on a process pool"""
+        settings = self.config['model'].get('search', {})
+        n_folds = settings.get('folds', 5)
+        if workers is None:
+            workers = settings.get('workers', 1)
+        
+        features_df = self.load_features()
+        if features_df is None:
+            return None
+        
+        # One matrix for every fold and candidate; workers receive it once through the initializer
+        X = features_df[list(self.FEATURE_COLS)].to_numpy(dtype=np.float32)
+        targets = {name: features_df[f'{name}_actual'].to_numpy() for name in ('eta', 'etd')}
+        
+        candidates = {name: self.search_candidates(name) for name in targets}
+        tasks = [(name, params, fold) for name, (params_list, _) in candidates.items()
+                 for params in params_list for fold in range(n_folds)]
+        Logger.section(f"Searching {sum(len(c[0]) for c in candidates.values())} candidates x {n_folds} folds "
+                       f"({len(tasks)} fits, {workers} workers)")
+        
+        start = perf_counter()
+        init_args = (X, targets, n_folds, self.config['model']['random_state'], self.forest_class())
+        if workers <= 1:
+            _init_search_worker(*init_args)
+            scores = [_search_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_search_worker, initargs=init_args) as pool:
+                scores = list(pool.map(_search_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+        elapsed = perf_counter() - start
+        
+        # Scores are grouped by candidate index; grouping on the values would drop max_depth=None as NaN
+        rows = pd.DataFrame([dict(target=name, candidate=candidates[name][0].index(params), fold=fold, **score)
+                             for (name, params, fold), score in zip(tasks, scores)])
+        results = {'folds': n_folds, 'method': settings.get('method', 'grid'), 'workers': workers,
+                   'n_samples': len(X), 'seconds': elapsed}
+        
+        for name, (params_list, configured) in candidates.items():
+            summary = (rows[rows['target'] == name]
+                       .groupby('candidate')
+                       .agg(mae_mean=('mae', 'mean'), mae_std=('mae', 'std'), fit_seconds=('fit_seconds', 'mean'),
+                            predict_us_per_row=('predict_us_per_row', 'mean'))
+                       .sort_values(['mae_mean', 'fit_seconds']))
+            # Object columns keep the grid values as given (ints stay ints, None stays None)
+            params = pd.DataFrame({param: pd.Series([params_list[i][param] for i in summary.index], dtype=object)
+                                   for param in SEARCH_PARAMS})
+            summary = pd.concat([params, summary.reset_index(drop=True)], axis=1)
+            summary['configured'] = [all(row[p] == configured[p] for p in SEARCH_PARAMS) for _, row in summary.iterrows()]
+            summary.insert(0, 'rank', np.arange(1, len(summary) + 1))
+            results[name] = summary.to_dict('records')
             
+            Logger.log(f"\n{name.upper()} ({n_folds}-fold CV MAE)")
+            Logger.log(f"{'rank':>4}{'trees':>7}{'depth':>7}{'split':>7}{'leaf':>6}{'MAE':>9}{'± std':>8}"
+                       f"{'fit s':>8}{'us/row':>8}")
+            shown = summary[(summary['rank'] <= 5) | summary['configured']]
+            for row in shown.itertuples():
+                Logger.log(f"{row.rank:>4}{row.n_estimators:>7}{str(row.max_depth):>7}{row.min_samples_split:>7}"
+                           f"{row.min_samples_leaf:>6}{row.mae_mean:>9.4f}{row.mae_std:>8.4f}{row.fit_seconds:>8.2f}"
+                           f"{row.predict_us_per_row:>8.2f}{'  (configured)' if row.configured else ''}")
+        
+        Logger.log(f"\nSearch took {elapsed:.1f}s")
+        
+        # Kept next to the last training run's results
+        results_path = self.output_dir / 'model_results.json'
+        model_results = json.loads(results_path.read_text()) if results_path.exists() else {}
+        model_results['search'] = results
+        with open(results_path, 'w') as f:
+            json.dump(model_results, f, indent=2, default=json_default)
+        Logger.log(f"Saved: {results_path}")
+        
+        return results
+    
+    def stream_features(self, features_path):
+        """Feature chunks with float32 features, float64 targets and the run id"""
+        settings = self.config['model'].get('out_of_core', {})
+        dtypes = {col: np.float32 for col in self.FEATURE_COLS}
+        dtypes.update({col: np.float64 for col in TARGET_COLS})
+        dtypes['run_id'] = np.int64
+        return iter_chunks(features_path, settings.get('chunk_rows', 200000), dtypes)
+    
+    def is_test(self, run_ids):
+        """Hold out runs by a hash of their id, so the split needs no shuffle and holds across chunks"""
+        return hash_fraction(run_ids, self.config['model']['random_state']) < self.config['model']['test_size']
+    
+    def scan_features(self, features_path):
+        """First streaming pass: row counts, target statistics and physics baselines"""
+        stats = {col: RunningStats() for col in ('eta_actual', 'etd_actual')}
+        physics = {name: 0.0 for name in ('eta', 'etd')}
+        n_train = 0
+        for chunk in self.stream_features(features_path):
+            n_train += int((~self.is_test(chunk['run_id'].to_numpy())).sum())
+            for col, running in stats.items():
+                running.update(chunk[col].to_numpy())
+            for name in physics:
+                physics[name] += float(np.abs(chunk[f'{name}_actual'] - chunk[f'{name}_physics']).sum())
+        
+        n_samples = stats['eta_actual'].n
+        dataset = {'n_samples': n_samples}
+        for name in ('eta', 'etd'):
+            dataset[f'{name}_mean'] = stats[f'{name}_actual'].mean
+            dataset[f'{name}_std'] = stats[f'{name}_actual'].std
+        return dataset, n_train, {name: total / n_samples for name, total in physics.items()}
+    
+    def bootstrap_plan(self, n_train, n_estimators):
+        """Poisson bootstrap rate and trees sampled per pass so the samples stay within the memory budget"""
+        settings = self.config['model'].get('out_of_core', {})
+        n_features = len(self.FEATURE_COLS)
+        chunk_bytes = CHUNK_COPIES * settings.get('chunk_rows', 200000) * (4 * n_features + 8 * len(TARGET_COLS) + 8)
+        capacity = (settings.get('memory_mb', 1024) * 2 ** 20 - chunk_bytes) // (4 * n_features + SAMPLE_OVERHEAD_BYTES)
+        if capacity <= 0:
+            raise ValueError(f"out_of_core.memory_mb is too small for chunks of {settings.get('chunk_rows', 200000)} rows")
+        
+        # Poisson(rate) counts keep a fraction 1 - exp(-rate) of the rows, each with its count as weight.
+        # Fitting concatenates a tree's sample into contiguous arrays, so one extra tree's worth must fit too
+        rate = settings.get('max_samples') or 1.0
+        if n_train * (1 - np.exp(-rate)) > capacity / 2:
+            rate = -np.log1p(-capacity / 2 / n_train)
+        rows_per_tree = n_train * (1 - np.exp(-rate))
+        per_pass = int(max(1, min(n_estimators, capacity // rows_per_tree - 1)))
+        return float(rate), per_pass, int(rows_per_tree)
+    
+    def fit_streaming_forest(self, name, features_path, n_train):
+        """Forest of the configured backend whose trees each fit a Poisson bootstrap drawn in a streaming pass"""
+        params = {param: self.config['model'][f'{name}_{param}'] for param in SEARCH_PARAMS}
+        seed = self.config['model']['random_state']
+        rate, per_pass, rows_per_tree = self.bootstrap_plan(n_train, params['n_estimators'])
+        n_passes = -(-params['n_estimators'] // per_pass)
+        Logger.log(f"\nTraining {name.upper()} model ({params['n_estimators']} trees, bootstrap rate {rate:.3f}, "
+                   f"~{rows_per_tree} rows per tree, {per_pass} trees per pass, {n_passes} passes)")
+        
+        # Unfitted tree of the configured backend; every streamed tree is a reseeded clone of it
+        template = self.tree_class()(
+            max_depth=params['max_depth'],
+            min_samples_split=params['min_samples_split'],
+            min_samples_leaf=params['min_samples_leaf']
+        )
+        trees = []
+        for first in range(0, params['n_estimators'], per_pass):
+            group = range(first, min(first + per_pass, params['n_estimators']))
+            rngs = [np.random.default_rng([seed, tree]) for tree in group]
+            samples = [([], [], []) for _ in group]
+            
+            for chunk in self.stream_features(features_path):
+                train = chunk[~self.is_test(chunk['run_id'].to_numpy())]
+                X = train[list(self.FEATURE_COLS)].to_numpy()
+                y = train[f'{name}_actual'].to_numpy()
+                for rng, (X_parts, y_parts, weights) in zip(rngs, samples):
+                    counts = rng.poisson(rate, len(train))
+                    keep = counts > 0
+                    X_parts.append(X[keep])
+                    y_parts.append(y[keep])
+                    weights.append(counts[keep])
+            
+            for tree in group:
+                X_parts, y_parts, weights = samples.pop(0)
+                estimator = clone(template).set_params(random_state=seed + tree)
+                estimator.fit(np.concatenate(X_parts), np.concatenate(y_parts),
+                              sample_weight=np.concatenate(weights).astype(np.float64))
+                trees.append(estimator)
+        
+        # Same object the in-memory path pickles, so compile/export/verify work unchanged
+        model = self.forest_class()(random_state=seed, n_jobs=1, bootstrap=True, **params)
+        model.estimators_ = trees
+        model.estimator_ = template
+        model.n_outputs_ = 1
+        model.n_features_in_ = len(self.FEATURE_COLS)
+        model.feature_names_in_ = np.array(self.FEATURE_COLS, dtype=object)
+        return model
+    
+    def evaluate_streaming(self, models, features_path, physics):
+        """Chunked train/test errors of both forests, in the metrics format of evaluate_model"""
+        settings = self.config['model'].get('out_of_core', {})
+        forests = {name: FlatForest.from_sklearn(model) for name, model in models.items()}
+        errors = {(name, split): RunningErrors(settings.get('plot_samples', 20000) if split == 'test' else 0)
+                  for name in models for split in ('train', 'test')}
+        
+        for chunk in self.stream_features(features_path):
+            test = self.is_test(chunk['run_id'].to_numpy())
+            X = chunk[list(self.FEATURE_COLS)].to_numpy()
+            for name, forest in forests.items():
+                y = chunk[f'{name}_actual'].to_numpy()
+                predictions = forest.predict(X)
+                errors[name, 'train'].update(y[~test], predictions[~test])
+                errors[name, 'test'].update(y[test], predictions[test])
+        
+        results = {}
+        for name, model in models.items():
+            test = errors[name, 'test']
+            improvement = (physics[name] - test.mae) / physics[name] * 100
+            metrics = {
+                'train_mae': float(errors[name, 'train'].mae),
+                'test_mae': float(test.mae),
+                'test_rmse': test.rmse,
+                'test_r2': float(test.r2),
+                'physics_baseline': float(physics[name]),
+                'improvement_percent': float(improvement),
+                'feature_importances': model.feature_importances_.tolist(),
+                'feature_names': list(self.FEATURE_COLS),
+                'n_estimators': model.n_estimators,
+                'max_depth': model.max_depth,
+                'split': 'run_id'
+            }
+            
+            Logger.log(f"\n{name.upper()} train MAE: {metrics['train_mae']:.3f}s")
+            Logger.log(f"{name.upper()} test MAE: {metrics['test_mae']:.3f}s")
+            Logger.log(f"{name.upper()} test RMSE: {metrics['test_rmse']:.3f}s")
+            Logger.log(f"{name.upper()} test R²: {metrics['test_r2']:.3f}")
+            Logger.log(f"Physics baseline: {metrics['physics_baseline']:.3f}s")
+            Logger.log(f"Improvement: {improvement:.1f}%")
+            results[name] = (metrics, *test.samples())
+        
+        return results
+    
+    def train_out_of_core(self):
+        """Training pipeline that streams the features in chunks instead of loading them"""
+        Logger.section("Training Random Forest models out of core")
+        
+        features_path = self.features_path()
+        if features_path is None:
+            return False
+        
+        start = perf_counter()
+        dataset, n_train, physics = self.scan_features(features_path)
+        Logger.log(f"Scanned {dataset['n_samples']} samples in {perf_counter() - start:.1f}s")
+        Logger.log(f"Split by run id: {n_train} train, {dataset['n_samples'] - n_train} test")
+        
+        models = {}
+        for name in ('eta', 'etd'):
+            start = perf_counter()
+            models[name] = self.fit_streaming_forest(name, features_path, n_train)
+            Logger.log(f"Trained in {perf_counter() - start:.1f}s")
+        
+        evaluated = self.evaluate_streaming(models, features_path, physics)
+        for name, model in models.items():
+            self.save_model(model, evaluated[name][0], f'{name}_model.pkl', [f'{name}_actual'])
+        if self.config['model'].get('shared', {}).get('enabled', False):
+            Logger.log("Shared model is only trained in memory; skipped")
+        
+        (eta_metrics, eta_test, eta_pred), (etd_metrics, etd_test, etd_pred) = evaluated['eta'], evaluated['etd']
+        results = self.save_results(eta_metrics, etd_metrics, dataset)
+        self.plot_results(eta_metrics, etd_metrics, eta_test, eta_pred, etd_test, etd_pred)
+        self.print_summary(results)
+        
+        return True
+    
+    def history(self, split, held_out=True):
+        """Chunks of already-seen feature rows: held out from the current models, or their train rows"""
+        features_path = self.features_path()
+        if features_path is None:
+            return
+        columns = list(self.FEATURE_COLS) + list(TARGET_COLS) + ['run_id']
+        
+        if split == 'run_id':
+            for chunk in self.stream_features(features_path):
+                yield chunk.loc[self.is_test(chunk['run_id'].to_numpy()) == held_out, columns]
+        else:
+            # Same train_test_split call as train(), so these are exactly its train or test rows
+            features_df = self.load_features()
+            X_train, X_test, _, _, _ = self.prepare_data(features_df, 'eta_actual')
+            yield features_df.loc[(X_test if held_out else X_train).index, columns]
+    
+    def load_update(self, path):
+        """New feature rows (CSV file or npy table) to update the models with, or None if missing"""
+        path = Path(path)
+        if not path.exists():
+            Logger.log(f"ERROR: New features not found: {path}")
+            return None
+        return pd.read_csv(path) if path.suffix == '.csv' else read_table(path)
+    
+    def update_rows(self, new, pending, retained, rng):
+        """Rows the new trees bootstrap from: new and pending rows plus retained_fraction drawn from the train sample"""
+        fresh = pd.concat([pending, new], ignore_index=True) if len(pending) else new
+        fraction = self.config['model'].get('incremental', {}).get('retained_fraction', 0.75)
+        n_retained = min(len(retained), int(round(len(fresh) * fraction / (1 - fraction))))
+        if n_retained == 0:
+            return fresh
+        sample = retained.iloc[rng.choice(len(retained), n_retained, replace=False)][list(new.columns)]
+        return pd.concat([fresh, sample], ignore_index=True)
+    
+    def update_forest(self, name, model, X_train, y_train, n_updates):
+        """Warm-start new trees on the update rows, then evict the oldest beyond the rolling window"""
+        settings = self.config['model'].get('incremental', {})
+        window = settings.get('max_trees') or self.config['model'][f'{name}_n_estimators']
+        n_new = min(settings.get('trees_per_update', 2), window)
+        
+        model.set_params(warm_start=True, n_estimators=len(model.estimators_) + n_new,
+                         random_state=self.config['model']['random_state'] + n_updates, n_jobs=self.n_jobs)
+        model.fit(X_train, y_train)
+        model.set_params(warm_start=False)
+        
+        n_evicted = max(0, len(model.estimators_) - window)
+        model.estimators_ = model.estimators_[n_evicted:]
+        model.n_estimators = len(model.estimators_)
+        return model, n_new, n_evicted
+    
+    def update_metrics(self, name, model, metrics, X_train, y_train, holdout):
+        """Metrics of an updated forest: train MAE on the rows it was updated with, test metrics on the holdout"""
+        y_test = holdout[f'{name}_actual']
+        test_pred = model.predict(holdout[list(self.FEATURE_COLS)])
+        test_mae = float(mean_absolute_error(y_test, test_pred))
+        physics_error = float(np.mean(np.abs(y_test - holdout[f'{name}_physics'])))
+        return dict(
+            metrics,
+            train_mae=float(mean_absolute_error(y_train, model.predict(X_train))),
+            test_mae=test_mae,
+            test_rmse=float(np.sqrt(mean_squared_error(y_test, test_pred))),
+            test_r2=float(r2_score(y_test, test_pred)),
+            physics_baseline=physics_error,
+            improvement_percent=(physics_error - test_mae) / physics_error * 100,
+            holdout_mae=test_mae,
+            feature_importances=model.feature_importances_.tolist(),
+            n_estimators=model.n_estimators,
+            max_depth=model.max_depth
+        )
+    
+    def update(self, new_path):
+        """Fold newly arrived runs into the trained forests; cost scales with the new rows only"""
+        Logger.section("Updating models with new runs")
+        settings = self.config['model'].get('incremental', {})
+        
+        new_df = self.load_update(new_path)
+        model_data = {name: self.load_model_data(name) for name in ('eta', 'etd')}
+        if new_df is None or any(data is None for data in model_data.values()):
+            return False
+        
+        # New runs are split by run id; the held-out ones join a reservoir spanning every run seen so far
+        test = self.is_test(new_df['run_id'].to_numpy())
+        train_df = new_df[~test]
+        Logger.log(f"Loaded {len(new_df)} new samples: {len(train_df)} to train, {int(test.sum())} held out")
+        
+        seed = self.config['model']['random_state']
+        split = model_data['eta']['metrics'].get('split', 'rows')
+        reservoir_path = self.output_dir / 'holdout.npz'
+        reservoir = Reservoir.load(reservoir_path, settings.get('reservoir_size', 5000), seed)
+        columns = list(self.FEATURE_COLS) + list(TARGET_COLS) + ['run_id']
+        if reservoir.n_seen == 0:
+            for chunk in self.history(split):
+                reservoir.update(chunk)
+            Logger.log(f"Seeded holdout reservoir with {len(reservoir)} of {reservoir.n_seen} held-out history rows")
+        reservoir.update(new_df.loc[test, columns])
+        holdout = reservoir.frame()
+        Logger.log(f"Holdout reservoir: {len(holdout)} rows sampled from {reservoir.n_seen}")
+        
+        # A uniform sample of every train row seen, mixed into the new trees so they do not fit the new runs only
+        retained_path = self.output_dir / 'train_sample.npz'
+        retained = Reservoir.load(retained_path, settings.get('train_sample_size', 5000), seed + 1)
+        if retained.n_seen == 0:
+            for chunk in self.history(split, held_out=False):
+                retained.update(chunk)
+            Logger.log(f"Seeded train sample with {len(retained)} of {retained.n_seen} train history rows")
+        
+        if len(train_df) == 0 or len(holdout) == 0:
+            Logger.log("Nothing to train on or evaluate with; models left unchanged")
+            reservoir.save(reservoir_path)
+            retained.save(retained_path)
+            return False
+        
+        X_holdout = holdout[list(self.FEATURE_COLS)]
+        max_increase = settings.get('max_mae_increase', 0.05)
+        entry = {'new_samples': len(new_df), 'train_samples': len(train_df), 'holdout_samples': len(holdout)}
+        published = {}
+        for name, data in model_data.items():
+            model, metrics = data['model'], data['metrics']
+            y_holdout = holdout[f'{name}_actual']
+            old_mae = float(mean_absolute_error(y_holdout, model.predict(X_holdout)))
+            
+            # Train rows of earlier unpublished updates (capped) are fitted again with the new ones
+            train_cols = list(self.FEATURE_COLS) + [f'{name}_actual']
+            pending_path = self.output_dir / f'pending_{name}.npz'
+            pending = Reservoir.load(pending_path, settings.get('pending_size', 5000), seed)
+            n_updates = metrics.get('n_updates', 0) + 1
+            fit_df = self.update_rows(train_df[train_cols], pending.frame(), retained.frame(),
+                                      np.random.default_rng([seed, n_updates]))
+            X_fit, y_fit = fit_df[list(self.FEATURE_COLS)], fit_df[f'{name}_actual']
+            
+            start = perf_counter()
+            model, n_new, n_evicted = self.update_forest(name, model, X_fit, y_fit, n_updates)
+            fit_seconds = perf_counter() - start
+            new_mae = float(mean_absolute_error(y_holdout, model.predict(X_holdout)))
+            
+            publish = new_mae <= old_mae * (1 + max_increase)
+            Logger.log(f"\n{name.upper()}: +{n_new} trees on {len(fit_df)} rows ({len(train_df)} new, {len(pending)} "
+                       f"pending, {len(fit_df) - len(train_df) - len(pending)} retained), "
+                       f"-{n_evicted} oldest ({model.n_estimators} total) in {fit_seconds:.2f}s")
+            Logger.log(f"Holdout MAE: {old_mae:.4f}s -> {new_mae:.4f}s "
+                       f"({'publishing' if publish else f'worse by more than {max_increase:.0%}, not published'})")
+            
+            if publish:
+                metrics = self.update_metrics(name, model, dict(metrics, n_updates=n_updates), X_fit, y_fit, holdout)
+                self.save_model(model, metrics, f'{name}_model.pkl', [f'{name}_actual'])
+                pending_path.unlink(missing_ok=True)
+                published[name] = metrics
+            else:
+                pending.update(train_df[train_cols])
+                pending.save(pending_path)
+                Logger.log(f"Kept {len(pending)} train rows pending for the next update")
+            entry[name] = {'trees_added': n_new, 'trees_evicted': n_evicted, 'n_estimators': model.n_estimators,
+                           'fit_samples': len(fit_df), 'fit_seconds': fit_seconds, 'holdout_mae_before': old_mae,
+                           'holdout_mae_after': new_mae, 'published': bool(publish)}
+        
+        reservoir.save(reservoir_path)
+        retained.update(train_df[columns])
+        retained.save(retained_path)
+        
+        # Update history next to the last training run's results, whose model sections follow the published models
+        results_path = self.output_dir / 'model_results.json'
+        model_results = json.loads(results_path.read_text()) if results_path.exists() else {}
+        for name, metrics in published.items():
+            section = model_results.setdefault(f'{name}_model', {})
+            section.update({key: metrics[key] for key in ('n_estimators', 'max_depth', 'train_mae', 'test_mae',
+                                                          'test_rmse', 'test_r2', 'physics_baseline',
+                                                          'improvement_percent')})
+        model_results.setdefault('updates', []).append(entry)
+        with open(results_path, 'w') as f:
+            json.dump(model_results, f, indent=2, default=json_default)
+        Logger.log(f"Saved: {results_path}")
+        
+        return True
+    
     def train(self):
         """Run complete training pipeline"""
         Logger.section("Training Random Forest models (Poster version)")
@@ -317,25 +971,33 @@ class ModelTrainer:
         X_train, X_test, y_train, y_test, feature_cols = self.prepare_data(features_df, 'eta_actual')
         Logger.log(f"Split: {len(X_train)} train, {len(X_test)} test")
         
+        start = perf_counter()
         eta_model = self.train_eta_model(X_train, y_train)
+        train_seconds = perf_counter() - start
         eta_metrics, eta_test, eta_pred = self.evaluate_model(
             eta_model, X_train, X_test, y_train, y_test,
             features_df, 'eta_actual', 'eta_physics', feature_cols
         )
-        self.save_model(eta_model, eta_metrics, 'eta_model.pkl')
+        self.save_model(eta_model, eta_metrics, 'eta_model.pkl', ['eta_actual'])
         
         # Train ETD model
         X_train, X_test, y_train, y_test, feature_cols = self.prepare_data(features_df, 'etd_actual')
         
+        start = perf_counter()
         etd_model = self.train_etd_model(X_train, y_train)
+        train_seconds += perf_counter() - start
         etd_metrics, etd_test, etd_pred = self.evaluate_model(
             etd_model, X_train, X_test, y_train, y_test,
             features_df, 'etd_actual', 'etd_physics', feature_cols
         )
-        self.save_model(etd_model, etd_metrics, 'etd_model.pkl')
+        self.save_model(etd_model, etd_metrics, 'etd_model.pkl', ['etd_actual'])
+        
+        shared_metrics = None
+        if self.config['model'].get('shared', {}).get('enabled', False):
+            shared_metrics = self.compare_shared(features_df, (eta_model, etd_model), train_seconds)
         
         # Save results and visualizations
-        results = self.save_results(eta_metrics, etd_metrics, features_df)
+        results = self.save_results(eta_metrics, etd_metrics, self.dataset_summary(features_df), shared_metrics)
         self.plot_results(eta_metrics, etd_metrics, eta_test, eta_pred, etd_test, etd_pred)
         self.print_summary(results)
         
@@ -346,8 +1008,26 @@ if __name__ == '__main__':
     import argparse
     
     parser = argparse.ArgumentParser(description='Train Random Forest models')
+    parser.add_argument('--compress', action='store_true', help='Then map size vs accuracy of compressed models')
+    parser.add_argument('--search', action='store_true', help='Cross-validated hyperparameter search instead of training')
+    parser.add_argument('--workers', type=int, help='Parallel fits for --search (default: model.search.workers)')
+    parser.add_argument('--out-of-core', action='store_true',
+                        help='Stream features in chunks within model.out_of_core.memory_mb (also via enabled: true)')
+    parser.add_argument('--update', metavar='FEATURES',
+                        help='Add trees trained on new runs (features CSV or npy table) instead of retraining')
     parser.add_argument('--config', default='config.yaml', help='Config file path')
     args = parser.parse_args()
     
     trainer = ModelTrainer(args.config)
-    trainer.train()
\ No newline at end of file
+    if args.search:
+        trainer.search(args.workers)
+    elif args.update:
+        trainer.update(args.update)
+    else:
+        if args.out_of_core or trainer.config['model'].get('out_of_core', {}).get('enabled', False):
+            trained = trainer.train_out_of_core()
+        else:
+            trained = trainer.train()
+        if trained and args.compress:
+            from compress_models import ModelCompressor
+            ModelCompressor(args.config).run()
\ No newline at end of file
@@ -0,0 +1,137 @@
+import pickle
+from abc import ABC, abstractmethod
+
+import numpy as np
+from sklearn.ensemble import ExtraTreesRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeRegressor, ExtraTreeRegressor
+
+from utils.forest import FlatForest
+
+
+class Backend(ABC):
+    """A regressor for one target: fit on float32 features plus the physics estimate, predict in batch or per row"""
+    
+    name = None
+    
+    def __init__(self, params=None, random_state=0, n_jobs=1):
+        self.params = dict(params or {})
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+    
+    def fit(self, X, y, physics):
+        """Train on feature rows X, targets y and the matching physics estimates"""
+        return self
+    
+    @abstractmethod
+    def predict(self, X, physics):
+        """Predictions for a batch of rows"""
+    
+    def predict_one(self, x, physics):
+        """Prediction for a single row, on the path a deployment would call"""
+        return float(self.predict(np.asarray(x, dtype=np.float32)[None], np.array([physics]))[0])
+    
+    @abstractmethod
+    def serialized_bytes(self):
+        """Size of what would be deployed"""
+
+
+class RandomForestBackend(Backend):
+    """Bagged trees, served from the flat arrays like the trained models"""
+    
+    name = 'random_forest'
+    estimator_class = RandomForestRegressor
+    tree_class = DecisionTreeRegressor
+    
+    def fit(self, X, y, physics):
+        self.model = self.estimator_class(random_state=self.random_state, n_jobs=self.n_jobs, **self.params).fit(X, y)
+        self.forest = FlatForest.from_sklearn(self.model)
+        return self
+    
+    def predict(self, X, physics):
+        return self.forest.predict(X)
+    
+    def predict_one(self, x, physics):
+        return self.forest.predict_one(x)
+    
+    def serialized_bytes(self):
+        return sum(getattr(self.forest, name).nbytes for name in FlatForest.ARRAYS)
+
+
+class ExtraTreesBackend(RandomForestBackend):
+    """Randomized-threshold trees; same flat serving path as the random forest"""
+    
+    name = 'extra_trees'
+    estimator_class = ExtraTreesRegressor
+    tree_class = ExtraTreeRegressor
+
+
+class HistGradientBoostingBackend(Backend):
+    """Boosted trees on binned features, served by sklearn"""
+    
+    name = 'hist_gradient_boosting'
+    
+    def fit(self, X, y, physics):
+        self.model = HistGradientBoostingRegressor(random_state=self.random_state, **self.params).fit(X, y)
+        return self
+    
+    def predict(self, X, physics):
+        return self.model.predict(X)
+    
+    def serialized_bytes(self):
+        return len(pickle.dumps(self.model))
+
+
+class LinearResidualBackend(Backend):
+    """Ridge regression on the physics estimate's error, folded into one weight vector"""
+    
+    name = 'linear_residual'
+    
+    def fit(self, X, y, physics):
+        scaler = StandardScaler().fit(X)
+        ridge = Ridge(**self.params).fit(scaler.transform(X), np.asarray(y) - np.asarray(physics))
+        # Undo the scaling so a prediction is physics + intercept + x . coef on raw features
+        self.coef = ridge.coef_ / scaler.scale_
+        self.intercept = float(ridge.intercept_ - self.coef @ scaler.mean_)
+        self.coef_list = self.coef.tolist()
+        return self
+    
+    def predict(self, X, physics):
+        return np.asarray(physics) + self.intercept + np.asarray(X, dtype=np.float64) @ self.coef
+    
+    def predict_one(self, x, physics):
+        return physics + self.intercept + sum(w * v for w, v in zip(self.coef_list, x))
+    
+    def serialized_bytes(self):
+        return (len(self.coef) + 1) * np.dtype(np.float32).itemsize
+
+
+class PhysicsBackend(Backend):
+    """The constant-acceleration estimate already in the features (eta_physics / etd_physics)"""
+    
+    name = 'physics'
+    
+    def predict(self, X, physics):
+        return np.asarray(physics, dtype=np.float64)
+    
+    def predict_one(self, x, physics):
+        return physics
+    
+    def serialized_bytes(self):
+        return 0
+
+
+BACKENDS = {backend.name: backend for backend in (
+    RandomForestBackend, ExtraTreesBackend, HistGradientBoostingBackend, LinearResidualBackend, PhysicsBackend
+)}
+
+# Backends whose models compile to flat artifacts and can replace the random forest in train_models.py
+FOREST_BACKENDS = ('random_forest', 'extra_trees')
+
+
+def make_backend(name, params=None, random_state=0, n_jobs=1):
+    """Instantiate a registered backend by name"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}', expected one of {tuple(BACKENDS)}")
+    return BACKENDS[name](params, random_state, n_jobs)
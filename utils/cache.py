@@ -0,0 +1,76 @@
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+def json_default(value):
+    """JSON fallback for numpy scalars"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class RunCache:
+    """Content-addressed store of simulated runs with size-capped LRU eviction"""
+    
+    def __init__(self, cache_dir, max_size_mb=1000):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+    
+    @staticmethod
+    def make_key(*parts):
+        """Hash any JSON-serializable description of a run"""
+        blob = json.dumps(parts, sort_keys=True, default=json_default)
+        return hashlib.sha256(blob.encode()).hexdigest()
+    
+    def path(self, key):
+        """Entry path, sharded by the first two hex digits"""
+        return self.cache_dir / key[:2] / f'{key}.npz'
+    
+    def get(self, key):
+        """Return (columns, features) for a key, or None on a miss"""
+        path = self.path(key)
+        try:
+            with np.load(path) as entry:
+                columns = {name: entry[name] for name in entry.files if name != 'features'}
+                features = json.loads(str(entry['features']))
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        os.utime(path)
+        return columns, features
+    
+    def put(self, key, columns, features):
+        """Store trajectory columns and the extracted feature row (or None)"""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        buffer = io.BytesIO()
+        np.savez(buffer, features=json.dumps(features, default=json_default), **columns)
+        
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_bytes(buffer.getvalue())
+        os.replace(tmp_path, path)
+    
+    def evict(self):
+        """Delete least recently used entries until the cache fits its size cap"""
+        entries = []
+        for path in self.cache_dir.glob('*/*.npz'):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        
+        return removed, total
@@ -0,0 +1,197 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import json_default
+from utils.columnar import ColumnarWriter, write_table
+
+
+def _to_ranges(run_ids):
+    """Compress run ids into sorted [start, stop) ranges"""
+    ranges = []
+    for run_id in sorted(run_ids):
+        if ranges and ranges[-1][1] == run_id:
+            ranges[-1][1] = run_id + 1
+        else:
+            ranges.append([run_id, run_id + 1])
+    return ranges
+
+
+def _from_ranges(ranges):
+    """Expand [start, stop) ranges back into a set of run ids"""
+    return {run_id for start, stop in ranges for run_id in range(start, stop)}
+
+
+class GenerationCheckpoint:
+    """Feature rows, trajectory chunks and a manifest of finished runs, flushed every N runs"""
+    
+    def __init__(self, checkpoint_dir, fingerprint, flush_every=100, output_format='csv'):
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.fingerprint = fingerprint
+        self.flush_every = flush_every
+        self.output_format = output_format
+        self.part_suffix = '.csv' if output_format == 'csv' else '.npz'
+        
+        self.features_path = self.checkpoint_dir / 'features.jsonl'
+        self.manifest_path = self.checkpoint_dir / 'manifest.json'
+        self.manifest = None
+        
+        self.pending_ids = []
+        self.pending_trajectories = []
+        self.pending_features = []
+    
+    @property
+    def successful(self):
+        """Runs with features, flushed or not"""
+        return self.manifest['successful'] + len(self.pending_features)
+    
+    def start(self, resume=False):
+        """Pick up a previous run when resuming, else start empty; returns finished run ids"""
+        if resume and self.manifest_path.exists():
+            manifest = json.loads(self.manifest_path.read_text())
+            if manifest['fingerprint'] != self.fingerprint:
+                raise ValueError(f"Checkpoint in {self.checkpoint_dir} was made with different settings")
+            self.manifest = manifest
+            
+            # Drop anything written after the last manifest update
+            with open(self.features_path, 'a') as f:
+                f.truncate(manifest['features_bytes'])
+            for part in self.checkpoint_dir.glob(f'trajectories_*{self.part_suffix}'):
+                if part.name not in manifest['parts']:
+                    part.unlink()
+            
+            return _from_ranges(manifest['done'])
+        
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+        self.checkpoint_dir.mkdir(parents=True)
+        self.features_path.touch()
+        self.manifest = {
+            'fingerprint': self.fingerprint,
+            'done': [],
+            'successful': 0,
+            'parts': [],
+            'features_bytes': 0
+        }
+        self.write_manifest()
+        return set()
+    
+    def add(self, run_id, trajectory_df, features):
+        """Record one finished run (trajectory/features may be None on failure)"""
+        self.pending_ids.append(run_id)
+        if trajectory_df is not None:
+            self.pending_trajectories.append(trajectory_df)
+        if features is not None:
+            self.pending_features.append(features)
+        
+        if len(self.pending_ids) >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        """Append pending rows and trajectories to disk, then commit the manifest"""
+        if not self.pending_ids:
+            return
+        
+        if self.pending_trajectories:
+            part = f'trajectories_{len(self.manifest["parts"]):05d}{self.part_suffix}'
+            tmp_path = self.checkpoint_dir / f'{part}.tmp'
+            self.write_part(pd.concat(self.pending_trajectories, ignore_index=True), tmp_path)
+            os.replace(tmp_path, self.checkpoint_dir / part)
+            self.manifest['parts'].append(part)
+        
+        with open(self.features_path, 'a') as f:
+            for features in self.pending_features:
+                f.write(json.dumps(features, default=json_default) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        
+        done = _from_ranges(self.manifest['done']) | set(self.pending_ids)
+        self.manifest['done'] = _to_ranges(done)
+        self.manifest['successful'] += len(self.pending_features)
+        self.manifest['features_bytes'] = self.features_path.stat().st_size
+        self.write_manifest()
+        
+        self.pending_ids = []
+        self.pending_trajectories = []
+        self.pending_features = []
+    
+    def write_manifest(self):
+        """Atomically replace the manifest"""
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.manifest, indent=2))
+        os.replace(tmp_path, self.manifest_path)
+    
+    def write_part(self, trajectories, path):
+        """Write one trajectory chunk in the checkpoint's part format"""
+        if self.output_format == 'csv':
+            trajectories.to_csv(path, index=False)
+            return
+        
+        with open(path, 'wb') as f:
+            np.savez(f, **{name: values if values.dtype.kind in 'biuf' else values.astype(str)
+                           for name, values in ((name, trajectories[name].to_numpy()) for name in trajectories.columns)})
+    
+    def read_part(self, part):
+        """Load one trajectory chunk written by write_part"""
+        with np.load(self.checkpoint_dir / part) as arrays:
+            return pd.DataFrame({name: arrays[name] for name in arrays.files})
+    
+    def absorb(self, other_dir):
+        """Append the flushed runs of another checkpoint directory (e.g. a work queue shard)"""
+        other_dir = Path(other_dir)
+        manifest = json.loads((other_dir / 'manifest.json').read_text())
+        
+        with open(other_dir / 'features.jsonl', 'rb') as f, open(self.features_path, 'ab') as out:
+            out.write(f.read(manifest['features_bytes']))
+        
+        for part in manifest['parts']:
+            name = f'trajectories_{len(self.manifest["parts"]):05d}{self.part_suffix}'
+            try:
+                os.link(other_dir / part, self.checkpoint_dir / name)
+            except OSError:
+                shutil.copyfile(other_dir / part, self.checkpoint_dir / name)
+            self.manifest['parts'].append(name)
+        
+        done = _from_ranges(self.manifest['done']) | _from_ranges(manifest['done'])
+        self.manifest['done'] = _to_ranges(done)
+        self.manifest['successful'] += manifest['successful']
+        self.manifest['features_bytes'] = self.features_path.stat().st_size
+        self.write_manifest()
+    
+    def finalize(self, output_dir):
+        """Merge all chunks into the final outputs and return the features DataFrame"""
+        self.flush()
+        output_dir = Path(output_dir)
+        
+        with open(self.features_path) as f:
+            features = pd.DataFrame([json.loads(line) for line in f])
+        if features.empty:
+            return features
+        
+        if self.output_format == 'csv':
+            features.to_csv(output_dir / 'features.csv', index=False)
+            
+            with open(output_dir / 'trajectories.csv', 'w') as out:
+                for i, part in enumerate(self.manifest['parts']):
+                    with open(self.checkpoint_dir / part) as f:
+                        header = f.readline()
+                        if i == 0:
+                            out.write(header)
+                        shutil.copyfileobj(f, out)
+        else:
+            write_table(features, output_dir / 'features', categorical=['scenario'])
+            
+            writer = ColumnarWriter(output_dir / 'trajectories', categorical=['scenario'],
+                                    float_dtype=np.float32, partition_col='run_id')
+            for part in self.manifest['parts']:
+                writer.append(self.read_part(part))
+            writer.close()
+        
+        return features
+    
+    def remove(self):
+        """Delete the checkpoint once its outputs are safely written"""
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
@@ -0,0 +1,136 @@
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+FORMAT_VERSION = 1
+
+
+class ColumnarWriter:
+    """Streams DataFrame chunks into one memory-mappable .npy file per column"""
+    
+    def __init__(self, table_dir, categorical=(), float_dtype=None, partition_col=None):
+        self.table_dir = Path(table_dir)
+        self.categorical = set(categorical)
+        self.float_dtype = np.dtype(float_dtype) if float_dtype else None
+        self.partition_col = partition_col
+        
+        shutil.rmtree(self.table_dir, ignore_errors=True)
+        self.table_dir.mkdir(parents=True)
+        
+        self.columns = None
+        self.categories = {}
+        self.files = {}
+        self.n_rows = 0
+        self.partition_keys = []
+        self.partition_offsets = [0]
+    
+    def column_dtype(self, series):
+        """Storage dtype of one column"""
+        if series.name in self.categorical:
+            return np.dtype(np.int16)
+        if self.float_dtype is not None and series.dtype.kind == 'f':
+            return self.float_dtype
+        return series.dtype
+    
+    def append(self, df):
+        """Append rows; with a partition column, each key's rows must arrive contiguously"""
+        if self.columns is None:
+            self.columns = {name: self.column_dtype(df[name]) for name in df.columns}
+            self.files = {name: open(self.table_dir / f'{name}.bin', 'wb') for name in df.columns}
+            self.categories = {name: [] for name in self.categorical}
+        
+        for name, dtype in self.columns.items():
+            values = df[name]
+            if name in self.categorical:
+                known = self.categories[name]
+                for value in pd.unique(values):
+                    if value not in known:
+                        known.append(value)
+                values = values.map({value: code for code, value in enumerate(known)})
+            self.files[name].write(np.ascontiguousarray(values.to_numpy(), dtype=dtype).tobytes())
+        
+        if self.partition_col is not None:
+            keys = df[self.partition_col].to_numpy()
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            self.partition_keys.extend(keys[starts].tolist())
+            self.partition_offsets.extend((self.n_rows + np.r_[starts[1:], len(keys)]).tolist())
+        
+        self.n_rows += len(df)
+    
+    def close(self):
+        """Turn the raw column files into .npy arrays and write schema.json"""
+        schema = {'format_version': FORMAT_VERSION, 'n_rows': self.n_rows, 'columns': []}
+        
+        for name, dtype in (self.columns or {}).items():
+            self.files[name].close()
+            raw_path = self.table_dir / f'{name}.bin'
+            with open(self.table_dir / f'{name}.npy', 'wb') as out:
+                header = {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': (self.n_rows,)}
+                np.lib.format.write_array_header_2_0(out, header)
+                with open(raw_path, 'rb') as raw:
+                    shutil.copyfileobj(raw, out)
+            raw_path.unlink()
+            
+            column = {'name': name, 'dtype': dtype.str, 'file': f'{name}.npy'}
+            if name in self.categorical:
+                column['categories'] = self.categories[name]
+            schema['columns'].append(column)
+        
+        if self.partition_col is not None:
+            np.save(self.table_dir / 'partition_keys.npy', np.array(self.partition_keys, dtype=np.int64))
+            np.save(self.table_dir / 'partition_offsets.npy', np.array(self.partition_offsets, dtype=np.int64))
+            schema['partition'] = {
+                'column': self.partition_col,
+                'keys': 'partition_keys.npy',
+                'offsets': 'partition_offsets.npy'
+            }
+        
+        (self.table_dir / 'schema.json').write_text(json.dumps(schema, indent=2))
+
+
+def write_table(df, table_dir, categorical=(), float_dtype=None, partition_col=None):
+    """Write a whole DataFrame as a columnar table"""
+    writer = ColumnarWriter(table_dir, categorical, float_dtype, partition_col)
+    writer.append(df)
+    writer.close()
+
+
+def read_schema(table_dir):
+    """Load a table's schema.json"""
+    return json.loads((Path(table_dir) / 'schema.json').read_text())
+
+
+def read_table(table_dir, columns=None, rows=None):
+    """Open a table as a DataFrame backed by memory-mapped columns (no copy)"""
+    table_dir = Path(table_dir)
+    schema = read_schema(table_dir)
+    
+    data = {}
+    for column in schema['columns']:
+        if columns is not None and column['name'] not in columns:
+            continue
+        values = np.load(table_dir / column['file'], mmap_mode='r')
+        if rows is not None:
+            values = values[rows]
+        if 'categories' in column:
+            values = pd.Categorical.from_codes(values, categories=column['categories'])
+        data[column['name']] = values
+    
+    return pd.DataFrame(data, copy=False)
+
+
+def read_partition(table_dir, key, columns=None):
+    """Rows of one partition key (e.g. one run_id) as a zero-copy slice"""
+    table_dir = Path(table_dir)
+    partition = read_schema(table_dir)['partition']
+    keys = np.load(table_dir / partition['keys'], mmap_mode='r')
+    offsets = np.load(table_dir / partition['offsets'], mmap_mode='r')
+    
+    i = np.searchsorted(keys, key)
+    if i == len(keys) or keys[i] != key:
+        return None
+    return read_table(table_dir, columns, slice(int(offsets[i]), int(offsets[i + 1])))
@@ -0,0 +1,389 @@
+import json
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from utils.cache import json_default
+
+
+# Version of the artifact layout written by FlatForest.save()
+FORMAT_VERSION = 1
+
+# Feature columns in the order the forests index them (train_models.py trains on these)
+FEATURE_COLS = [
+    'distance_remaining',
+    'train_length',
+    'last_speed',
+    'speed_change',
+    'time_01',
+    'time_12',
+    'avg_speed_01',
+    'avg_speed_12',
+    'speed_0',
+    'speed_1',
+    'accel_01',
+    'accel_12',
+    'accel_trend',
+    'predicted_crossing_speed'
+]
+
+
+class FlatForest:
+    """Random forest packed into flat node arrays for fast single-row and batch prediction"""
+    
+    ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'roots')
+    
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, n_features, header=None):
+        # Memory-mapped arrays of the right dtype pass through without a copy
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.max_depth = int(max_depth)
+        self.n_features = int(n_features)
+        self.header = header or {}
+        
+        self._nodes = None
+        self._children = None
+    
+    @property
+    def nodes(self):
+        """Per-node (feature, threshold, left, right) lists; Python lists beat numpy indexing for one row"""
+        if self._nodes is None:
+            self._nodes = list(zip(self.feature.tolist(), self.threshold.tolist(), self.left.tolist(), self.right.tolist()))
+            self.leaf_values = self.value.tolist()
+            self.root_list = self.roots.tolist()
+        return self._nodes
+    
+    @property
+    def children(self):
+        """Batch walk table: child of node n is children[2 * n + (x <= threshold)]"""
+        if self._children is None:
+            self._children = np.stack([self.right, self.left], axis=1).ravel().astype(np.intp)
+        return self._children
+    
+    @classmethod
+    def from_sklearn(cls, model):
+        """Pack a fitted RandomForestRegressor (or a single decision tree)"""
+        trees = [est.tree_ for est in getattr(model, 'estimators_', [model])]
+        
+        feature, threshold, left, right, value, roots = [], [], [], [], [], []
+        offset = 0
+        for tree in trees:
+            node_ids = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            
+            # Leaves point at themselves, so walking extra levels is a no-op
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+            left.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+            right.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+            value.append(tree.value[:, :, 0])
+            roots.append(offset)
+            offset += tree.node_count
+        
+        return cls(
+            np.concatenate(feature), np.concatenate(threshold), np.concatenate(left), np.concatenate(right),
+            np.concatenate(value), roots, max(tree.max_depth for tree in trees), model.n_features_in_
+        )
+    
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        """Load an artifact directory written by save() (memory-mapped), or convert a legacy model pickle"""
+        path = Path(path)
+        if path.suffix == '.pkl':
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            forest = cls.from_sklearn(data['model'])
+            forest.header = {'metrics': data.get('metrics', {}), 'sklearn_version': data.get('sklearn_version')}
+            return forest
+        
+        # Resolve the version symlink once, so a concurrent save cannot mix two versions
+        path = path.resolve()
+        header = json.loads((path / 'model.json').read_text())
+        if header.get('format') != 'flat_forest' or header.get('format_version', 0) > FORMAT_VERSION:
+            raise ValueError(f"{path} is not a flat_forest artifact this version can read "
+                             f"(format {header.get('format')!r}, version {header.get('format_version')})")
+        
+        arrays = [np.load(path / header['arrays'][name]['file'], mmap_mode=mmap_mode) for name in cls.ARRAYS]
+        return cls(*arrays, header['max_depth'], header['n_features'], header)
+    
+    @classmethod
+    def load_trained(cls, output_dir, name):
+        """outputs/<name>_model artifact, falling back to the <name>_model.pkl pickle; None if neither exists"""
+        for path in (Path(output_dir) / f'{name}_model', Path(output_dir) / f'{name}_model.pkl'):
+            if path.exists():
+                return cls.load(path)
+        return None
+    
+    def save(self, path, **metadata):
+        """Write the artifact: one .npy per array plus model.json (format, shapes, metadata), swapped in atomically"""
+        path = Path(path)
+        # Each save is a new version directory; path is a symlink to the current one
+        version_path = path.with_name(f'.{path.name}.v{time.time_ns()}')
+        version_path.mkdir(parents=True)
+        
+        header = dict(self.header, **metadata)
+        header.update({
+            'format': 'flat_forest',
+            'format_version': FORMAT_VERSION,
+            'n_trees': self.n_trees,
+            'n_nodes': self.n_nodes,
+            'n_outputs': self.n_outputs,
+            'max_depth': self.max_depth,
+            'n_features': self.n_features,
+            'arrays': {}
+        })
+        for name in self.ARRAYS:
+            array = np.ascontiguousarray(getattr(self, name))
+            np.save(version_path / f'{name}.npy', array)
+            header['arrays'][name] = {'file': f'{name}.npy', 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        (version_path / 'model.json').write_text(json.dumps(header, indent=2, default=json_default))
+        
+        # An artifact directory from before versioning becomes the first version
+        if path.is_dir() and not path.is_symlink():
+            os.replace(path, path.with_name(f'.{path.name}.v0'))
+            os.symlink(f'.{path.name}.v0', path)
+        
+        # Swapping the symlink is atomic: a load sees either the complete old or the complete new version
+        previous = os.readlink(path) if path.is_symlink() else None
+        link_path = path.with_name(f'.{path.name}.{os.getpid()}.link')
+        link_path.unlink(missing_ok=True)
+        os.symlink(version_path.name, link_path)
+        os.replace(link_path, path)
+        
+        # Keep the previous version for loads that resolved the old link; readers holding mappings keep them
+        for old_path in path.parent.glob(f'.{path.name}.v*'):
+            if old_path.name not in (version_path.name, previous):
+                shutil.rmtree(old_path, ignore_errors=True)
+        self.header = header
+        return path
+    
+    @staticmethod
+    def remove(path):
+        """Delete an artifact written by save(): the symlink and its version directories (True if one existed)"""
+        path = Path(path)
+        existed = path.exists() or path.is_symlink()
+        if path.is_symlink():
+            path.unlink()
+        else:
+            shutil.rmtree(path, ignore_errors=True)
+        for version_path in path.parent.glob(f'.{path.name}.v*'):
+            shutil.rmtree(version_path, ignore_errors=True)
+        return existed
+    
+    @property
+    def n_trees(self):
+        return len(self.roots)
+    
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+    
+    @property
+    def n_outputs(self):
+        return self.value.shape[1]
+    
+    @property
+    def is_split(self):
+        """Mask of internal (non-leaf) nodes"""
+        return self.left != np.arange(self.n_nodes)
+    
+    def compress(self, n_trees=None, max_depth=None, merge_tolerance=None):
+        """Smaller forest: first n_trees trees, cut at max_depth, subtrees with leaf spread <= tolerance merged"""
+        roots = self.roots[:n_trees].tolist()
+        internal = self.is_split
+        
+        # Leaf value range under every node, filled children-first (children always follow parents in sklearn order)
+        leaf_min = self.value[:, 0].copy()
+        leaf_max = self.value[:, 0].copy()
+        for node in np.flatnonzero(internal)[::-1].tolist():
+            left, right = self.left[node], self.right[node]
+            leaf_min[node] = min(leaf_min[left], leaf_min[right])
+            leaf_max[node] = max(leaf_max[left], leaf_max[right])
+        
+        # Internal nodes keep sklearn's mean target, so a cut node simply becomes a leaf with that value
+        order, is_leaf, depth_reached = [], [], 0
+        stack = [(root, 0) for root in roots[::-1]]
+        while stack:
+            node, depth = stack.pop()
+            depth_reached = max(depth_reached, depth)
+            leaf = (not internal[node] or (max_depth is not None and depth >= max_depth)
+                    or (merge_tolerance is not None and leaf_max[node] - leaf_min[node] <= merge_tolerance))
+            order.append(node)
+            is_leaf.append(leaf)
+            if not leaf:
+                stack.append((int(self.right[node]), depth + 1))
+                stack.append((int(self.left[node]), depth + 1))
+        
+        order = np.array(order)
+        is_leaf = np.array(is_leaf)
+        position = np.zeros(self.n_nodes, dtype=np.int64)
+        position[order] = np.arange(len(order))
+        new_ids = np.arange(len(order))
+        
+        return FlatForest(
+            np.where(is_leaf, 0, self.feature[order]),
+            np.where(is_leaf, np.inf, self.threshold[order]),
+            np.where(is_leaf, new_ids, position[self.left[order]]),
+            np.where(is_leaf, new_ids, position[self.right[order]]),
+            self.value[order],
+            position[roots],
+            depth_reached,
+            self.n_features
+        )
+    
+    def predict_one(self, x):
+        """Predict a single feature row (sequence of n_features numbers)"""
+        # Trees compare float32 features against float64 thresholds, exactly as sklearn does
+        x = np.asarray(x, dtype=np.float32).tolist()
+        nodes = self.nodes
+        
+        total = [0.0] * self.n_outputs
+        for node in self.root_list:
+            feature, threshold, left, right = nodes[node]
+            while left != right:
+                node = left if x[feature] <= threshold else right
+                feature, threshold, left, right = nodes[node]
+            for k, v in enumerate(self.leaf_values[node]):
+                total[k] += v
+        
+        total = [t / self.n_trees for t in total]
+        return total[0] if len(total) == 1 else total
+    
+    def apply(self, X, chunk_size=4096):
+        """Leaf node index of every row in every tree, shape (n_rows, n_trees)"""
+        X = np.asarray(X, dtype=np.float32)
+        leaves = np.empty((len(X), self.n_trees), dtype=np.intp)
+        roots = self.roots.astype(np.intp)
+        
+        # Chunks keep the (rows, trees) temporaries cache-sized
+        for start in range(0, len(X), chunk_size):
+            chunk = np.ascontiguousarray(X[start:start + chunk_size])
+            flat = chunk.ravel()
+            row_offsets = (np.arange(len(chunk)) * self.n_features)[:, None]
+            nodes = np.broadcast_to(roots, (len(chunk), self.n_trees))
+            
+            # All trees advance one level per step; finished rows sit on their self-looping leaf
+            for _ in range(self.max_depth):
+                go_left = flat.take(row_offsets + self.feature.take(nodes)) <= self.threshold.take(nodes)
+                nodes = self.children.take(2 * nodes + go_left)
+            leaves[start:start + len(chunk)] = nodes
+        
+        return leaves
+    
+    def predict(self, X):
+        """Predict a batch of rows (array or DataFrame with columns in training order)"""
+        values = self.value[self.apply(X)]
+        
+        # Summed tree by tree, in the same order and precision as sklearn's forest
+        total = np.zeros(values.shape[::2])
+        for t in range(self.n_trees):
+            total += values[:, t]
+        total /= self.n_trees
+        return total[:, 0] if self.n_outputs == 1 else total
+
+
+# Quantized thresholds and leaves use +/-Q_RANGE, leaving headroom below int16 limits for clamped features
+Q_RANGE = 32500
+LEAF_FEATURE = 0xFF
+NODE_BYTES = 5
+# Right children and tree roots are uint16 node indices
+MAX_NODES = 0x10000
+
+
+def feature_scale(forests, n_features):
+    """Per-feature float32 (offset, step) so every split threshold maps into int16"""
+    offset = np.zeros(n_features, dtype=np.float32)
+    step = np.ones(n_features, dtype=np.float32)
+    splits = [(forest.feature[forest.is_split], forest.threshold[forest.is_split]) for forest in forests]
+    for f in range(n_features):
+        thresholds = np.concatenate([threshold[feature == f] for feature, threshold in splits])
+        if len(thresholds) == 0:
+            continue
+        lo, hi = thresholds.min(), thresholds.max()
+        step[f] = (hi - lo) / Q_RANGE / 2 if hi > lo else 1.0
+        offset[f] = lo + Q_RANGE * float(step[f])
+    return offset, step
+
+
+def quantize_features(X, offset, step):
+    """Features to int16 the way the firmware does it (float32 arithmetic, floor, clamp)"""
+    X = np.asarray(X, dtype=np.float32)
+    q = np.floor((X - offset) / step)
+    return np.clip(q, -32768, 32767).astype(np.int16)
+
+
+class QuantizedForest:
+    """Forest in preorder with int16 thresholds and leaves, as laid out in the Arduino PROGMEM tables"""
+    
+    def __init__(self, forest, offset, step):
+        if forest.n_nodes > MAX_NODES:
+            raise ValueError(f"Forest has {forest.n_nodes} nodes, more than the {MAX_NODES} uint16 node indices address")
+        self.n_trees = forest.n_trees
+        
+        # Preorder puts each left child right after its parent, so nodes only store the right child
+        order = []
+        for root in forest.roots.tolist():
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                order.append(node)
+                if forest.left[node] != node:
+                    stack.append(int(forest.right[node]))
+                    stack.append(int(forest.left[node]))
+        order = np.array(order)
+        position = np.empty(forest.n_nodes, dtype=np.int64)
+        position[order] = np.arange(len(order))
+        
+        is_leaf = forest.left[order] == order
+        leaf_values = forest.value[order, 0]
+        lo, hi = leaf_values[is_leaf].min(), leaf_values[is_leaf].max()
+        self.value_step = np.float32((hi - lo) / Q_RANGE / 2 if hi > lo else 1.0)
+        self.value_offset = np.float32(lo + Q_RANGE * float(self.value_step))
+        
+        # A float32 feature goes left iff it is <= the largest float32 not above the threshold
+        features = forest.feature[order]
+        thresholds = forest.threshold[order].astype(np.float32)
+        thresholds = np.where(thresholds > forest.threshold[order], np.nextafter(thresholds, np.float32(-np.inf)), thresholds)
+        split_q = quantize_features(thresholds, offset[features], step[features])
+        leaf_q = np.round((leaf_values - self.value_offset) / self.value_step)
+        
+        self.feature = np.where(is_leaf, LEAF_FEATURE, features).astype(np.uint8)
+        self.value = np.where(is_leaf, leaf_q, split_q).astype(np.int16)
+        self.right = np.where(is_leaf, 0, position[forest.right[order]]).astype(np.uint16)
+        self.roots = position[forest.roots].astype(np.uint16)
+        self.offset = offset
+        self.step = step
+    
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+    
+    @property
+    def flash_bytes(self):
+        """PROGMEM size of the node table and tree roots"""
+        return self.n_nodes * NODE_BYTES + 2 * self.n_trees
+    
+    def predict(self, X):
+        """Predict exactly as the firmware traversal does"""
+        qx = quantize_features(X, self.offset, self.step).astype(np.int32)
+        rows = np.arange(len(qx))
+        total = np.zeros(len(qx), dtype=np.int64)
+        
+        for root in self.roots.tolist():
+            nodes = np.full(len(qx), root, dtype=np.int64)
+            active = self.feature[nodes] != LEAF_FEATURE
+            while active.any():
+                go_left = qx[rows, np.where(active, self.feature[nodes], 0)] <= self.value[nodes]
+                nodes = np.where(active, np.where(go_left, nodes + 1, self.right[nodes]), nodes)
+                active = self.feature[nodes] != LEAF_FEATURE
+            total += self.value[nodes]
+        
+        return self.value_offset + self.value_step * (total.astype(np.float32) / np.float32(self.n_trees))
@@ -0,0 +1,95 @@
+import warnings
+
+import numpy as np
+
+
+METHODS = ('random', 'sobol', 'lhs')
+
+# Unit-cube dimensions per sample: scenario, speed, accel, decel, length
+N_DIMS = 5
+
+PARAM_DTYPE = np.dtype([
+    ('run_id', np.int64),
+    ('scenario', np.int16),
+    ('depart_speed', np.float64),
+    ('accel', np.float64),
+    ('decel', np.float64),
+    ('length', np.int64),
+    ('speed_factor', np.float64)
+])
+
+
+class ParameterSampler:
+    """Vectorized train parameter draws as a structured array, sliceable by run id"""
+    
+    def __init__(self, scenarios, train_lengths, seed, method='sobol'):
+        if method not in METHODS:
+            raise ValueError(f"Unknown sampling method '{method}', expected one of {METHODS}")
+        self.method = method
+        self.seed = seed
+        
+        self.scenario_names = list(scenarios.keys())
+        weights = np.array([s.get('weight', 1.0) for s in scenarios.values()], dtype=float)
+        self.cum_weights = np.cumsum(weights / weights.sum())
+        self.low = np.array([[s[k][0] for k in ('speed', 'accel', 'decel')] for s in scenarios.values()], dtype=float)
+        self.high = np.array([[s[k][1] for k in ('speed', 'accel', 'decel')] for s in scenarios.values()], dtype=float)
+        self.train_lengths = np.asarray(train_lengths)
+    
+    def unit_samples(self, start, count, n_total):
+        """Points in [0, 1)^N_DIMS for run ids start .. start + count"""
+        if self.method == 'random':
+            # Every sample uses exactly N_DIMS doubles, so any slice can jump straight to its stream position
+            bit_generator = np.random.PCG64(self.seed)
+            bit_generator.advance(int(start) * N_DIMS)
+            return np.random.Generator(bit_generator).random((count, N_DIMS))
+        
+        from scipy.stats import qmc
+        if self.method == 'sobol':
+            engine = qmc.Sobol(N_DIMS, scramble=True, seed=self.seed)
+            if start > 0:
+                engine.fast_forward(int(start))
+            with warnings.catch_warnings():
+                # Slices of the sequence are rarely powers of two; the full sequence keeps its balance
+                warnings.simplefilter('ignore', UserWarning)
+                return engine.random(count)
+        
+        # A Latin hypercube is stratified over the whole design, so slices come from the full draw
+        return qmc.LatinHypercube(N_DIMS, seed=self.seed).random(n_total)[start:start + count]
+    
+    def sample(self, n_total, start=0, count=None):
+        """Parameters for run ids start .. start + count out of an n_total design"""
+        if count is None:
+            count = n_total - start
+        u = self.unit_samples(start, count, n_total)
+        
+        params = np.empty(count, dtype=PARAM_DTYPE)
+        params['run_id'] = np.arange(start, start + count)
+        
+        scenario = np.minimum(np.searchsorted(self.cum_weights, u[:, 0], side='right'), len(self.scenario_names) - 1)
+        params['scenario'] = scenario
+        
+        # Continuous ranges are stratified within the chosen scenario
+        values = self.low[scenario] + u[:, 1:4] * (self.high[scenario] - self.low[scenario])
+        params['depart_speed'] = values[:, 0]
+        params['accel'] = values[:, 1]
+        params['decel'] = values[:, 2]
+        
+        params['length'] = self.train_lengths[np.minimum((u[:, 4] * len(self.train_lengths)).astype(int),
+                                                         len(self.train_lengths) - 1)]
+        params['speed_factor'] = 1.0
+        return params
+    
+    def to_dicts(self, params):
+        """Convert a structured parameter array into per-run dicts"""
+        columns = zip(*(params[name].tolist() for name in ('depart_speed', 'accel', 'decel', 'length', 'speed_factor', 'scenario')))
+        return [
+            {
+                'depart_speed': depart_speed,
+                'accel': accel,
+                'decel': decel,
+                'length': length,
+                'speed_factor': speed_factor,
+                'scenario': self.scenario_names[scenario]
+            }
+            for depart_speed, accel, decel, length, speed_factor, scenario in columns
+        ]
@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.columnar import read_schema, read_table
+
+
+def iter_chunks(path, chunk_rows, dtypes):
+    """DataFrame chunks of a CSV file or columnar table with the given column dtypes"""
+    path = Path(path)
+    if path.is_dir():
+        n_rows = read_schema(path)['n_rows']
+        for start in range(0, n_rows, chunk_rows):
+            chunk = read_table(path, list(dtypes), slice(start, start + chunk_rows))
+            yield chunk.astype(dtypes)
+    else:
+        yield from pd.read_csv(path, usecols=list(dtypes), dtype=dtypes, chunksize=chunk_rows)
+
+
+def hash_fraction(keys, seed=0):
+    """Uniform value in [0, 1) per integer key (splitmix64), the same however the rows are chunked"""
+    z = np.asarray(keys, dtype=np.int64).astype(np.uint64) + np.uint64((seed * 0x9E3779B97F4A7C15) % 2 ** 64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) / 2.0 ** 53
+
+
+class RunningStats:
+    """Count, mean and variance of a stream of values (Chan et al. pairwise update)"""
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, values):
+        """Fold one chunk of values into the running moments"""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        n, mean = len(values), values.mean()
+        delta = mean - self.mean
+        total = self.n + n
+        self.m2 += ((values - mean) ** 2).sum() + delta ** 2 * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+    
+    @property
+    def std(self):
+        """Sample standard deviation, as pandas computes it"""
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else float('nan')
+
+
+class RunningErrors:
+    """MAE, RMSE and R² of predictions accumulated chunk by chunk, keeping the first rows for plots"""
+    
+    def __init__(self, keep=0):
+        self.keep = keep
+        self.actual = RunningStats()
+        self.abs_sum = 0.0
+        self.sq_sum = 0.0
+        self.kept = ([], [])
+        self.n_kept = 0
+    
+    def update(self, y, predictions):
+        """Add one chunk of targets and predictions"""
+        y = np.asarray(y, dtype=np.float64)
+        errors = np.asarray(predictions, dtype=np.float64) - y
+        self.actual.update(y)
+        self.abs_sum += np.abs(errors).sum()
+        self.sq_sum += (errors ** 2).sum()
+        
+        if self.n_kept < self.keep:
+            take = self.keep - self.n_kept
+            self.kept[0].append(y[:take])
+            self.kept[1].append(predictions[:take])
+            self.n_kept += len(y[:take])
+    
+    @property
+    def mae(self):
+        """Mean absolute error so far"""
+        return self.abs_sum / self.actual.n
+    
+    @property
+    def rmse(self):
+        """Root mean squared error so far"""
+        return float(np.sqrt(self.sq_sum / self.actual.n))
+    
+    @property
+    def r2(self):
+        """Coefficient of determination so far"""
+        return 1.0 - self.sq_sum / self.actual.m2
+    
+    def samples(self):
+        """(actual, predicted) arrays of the kept rows"""
+        return tuple(np.concatenate(part) if part else np.empty(0) for part in self.kept)
+
+
+class Reservoir:
+    """Uniform sample of at most size rows from every chunk ever added (Algorithm R), persisted as .npz"""
+    
+    def __init__(self, size, seed=0, columns=None, n_seen=0):
+        self.size = size
+        self.columns = columns
+        self.n_seen = n_seen
+        # Seeded by the stream position, so resuming from disk continues deterministically
+        self.rng = np.random.default_rng([seed, n_seen])
+    
+    @classmethod
+    def load(cls, path, size, seed=0):
+        """Reservoir saved at path, or an empty one if there is none"""
+        path = Path(path)
+        if not path.exists():
+            return cls(size, seed)
+        with np.load(path) as saved:
+            n_seen = int(saved['n_seen'])
+            columns = {name: saved[name] for name in saved.files if name != 'n_seen'}
+        return cls(size, seed, columns, n_seen)
+    
+    def save(self, path):
+        """Write the sample and stream position, replacing the file atomically"""
+        path = Path(path)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, n_seen=self.n_seen, **self.columns)
+        os.replace(tmp_path, path)
+    
+    def __len__(self):
+        return 0 if self.columns is None else len(next(iter(self.columns.values())))
+    
+    def update(self, chunk):
+        """Offer a DataFrame chunk of rows; each row seen so far stays with probability size / n_seen"""
+        values = {name: chunk[name].to_numpy() for name in chunk.columns}
+        fill = min(len(chunk), self.size - len(self))
+        if self.columns is None:
+            self.columns = {name: column[:fill].copy() for name, column in values.items()}
+        elif fill > 0:
+            self.columns = {name: np.concatenate([self.columns[name], values[name][:fill]]) for name in self.columns}
+        
+        # Row t of the stream (0-based) replaces a uniform slot in [0, t] if that slot is in the sample
+        t = self.n_seen + fill + np.arange(len(chunk) - fill)
+        slots = (self.rng.random(len(t)) * (t + 1)).astype(np.int64)
+        rows = np.flatnonzero(slots < self.size) + fill
+        # Keep the last row per slot, as the sequential algorithm would
+        last = len(rows) - 1 - np.unique(slots[rows - fill][::-1], return_index=True)[1]
+        for name, column in self.columns.items():
+            column[slots[rows[last] - fill]] = values[name][rows[last]]
+        
+        self.n_seen += len(chunk)
+    
+    def frame(self):
+        """The sample as a DataFrame"""
+        return pd.DataFrame(self.columns or {}, copy=False)
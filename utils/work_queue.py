@@ -0,0 +1,156 @@
+import json
+import math
+import os
+import shutil
+import socket
+import time
+import uuid
+from pathlib import Path
+
+
+class WorkQueue:
+    """Generation job split into chunks and shared through a directory (local disk or NFS)"""
+    
+    def __init__(self, queue_dir, lease_seconds=600):
+        self.queue_dir = Path(queue_dir)
+        self.job_path = self.queue_dir / 'job.json'
+        self.claims_dir = self.queue_dir / 'claims'
+        self.shards_dir = self.queue_dir / 'shards'
+        self.lease_seconds = lease_seconds
+        self.token = f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}'
+    
+    def create(self, job):
+        """Publish job.json unless a job already exists; returns the job on disk"""
+        self.claims_dir.mkdir(parents=True, exist_ok=True)
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = self.queue_dir / f'job.{self.token}.tmp'
+        tmp_path.write_text(json.dumps(job, indent=2))
+        try:
+            # link() fails if the target exists, also on NFS, so only one coordinator wins
+            os.link(tmp_path, self.job_path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp_path.unlink()
+        
+        return self.load_job()
+    
+    def load_job(self):
+        """The queued job, or None if the directory holds none"""
+        if not self.job_path.exists():
+            return None
+        return json.loads(self.job_path.read_text())
+    
+    @staticmethod
+    def n_chunks(job):
+        """Number of chunks in a job"""
+        return math.ceil(job['n_samples'] / job['chunk_size'])
+    
+    @staticmethod
+    def chunk_range(job, chunk):
+        """(start, count) of the run ids in one chunk"""
+        start = chunk * job['chunk_size']
+        return start, min(job['chunk_size'], job['n_samples'] - start)
+    
+    def claim_path(self, chunk):
+        """Lease file of a chunk; its mtime is the last renewal"""
+        return self.claims_dir / f'chunk_{chunk:05d}.claim'
+    
+    def shard_dir(self, chunk):
+        """Committed results of a chunk"""
+        return self.shards_dir / f'chunk_{chunk:05d}'
+    
+    def shard_tmp_dir(self, chunk):
+        """Private directory a worker fills before committing the shard"""
+        return self.shards_dir / f'.chunk_{chunk:05d}.{self.token}'
+    
+    def is_done(self, chunk):
+        """Whether a chunk's shard has been committed"""
+        return self.shard_dir(chunk).exists()
+    
+    def lease_age(self, path):
+        """Seconds since a claim was last renewed (None if it is gone)"""
+        try:
+            return time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+    
+    def claim(self, chunk):
+        """Try to take a chunk; True if this worker now holds its lease"""
+        if self.is_done(chunk):
+            return False
+        
+        path = self.claim_path(chunk)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            age = self.lease_age(path)
+            if age is None or age <= self.lease_seconds:
+                return False
+            # Expired: whoever renames the stale claim away gets to retry the exclusive create
+            try:
+                os.rename(path, path.with_name(f'{path.name}.expired.{self.token}'))
+            except FileNotFoundError:
+                return False
+            return self.claim(chunk)
+        
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'worker': self.token, 'claimed_at': time.time()}, f)
+        
+        if self.is_done(chunk):
+            self.release(chunk)
+            return False
+        return True
+    
+    def heartbeat(self, chunk):
+        """Renew this worker's lease on a chunk"""
+        try:
+            os.utime(self.claim_path(chunk))
+        except FileNotFoundError:
+            pass
+    
+    def release(self, chunk):
+        """Drop the claim on a chunk if this worker still holds it"""
+        path = self.claim_path(chunk)
+        try:
+            if json.loads(path.read_text())['worker'] == self.token:
+                path.unlink()
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+    
+    def commit(self, chunk, tmp_dir):
+        """Move a finished shard into place; False if another worker got there first"""
+        # Chunks are deterministic, so after a lease takeover race the first complete shard simply wins
+        try:
+            os.rename(tmp_dir, self.shard_dir(chunk))
+            committed = True
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            committed = False
+        
+        self.release(chunk)
+        for stale in self.claims_dir.glob(f'{self.claim_path(chunk).name}.expired.*'):
+            stale.unlink(missing_ok=True)
+        return committed
+    
+    def status(self, job):
+        """Chunk counts: done, claimed (live lease), expired and pending"""
+        counts = {'done': 0, 'claimed': 0, 'expired': 0, 'pending': 0}
+        for chunk in range(self.n_chunks(job)):
+            if self.is_done(chunk):
+                counts['done'] += 1
+                continue
+            age = self.lease_age(self.claim_path(chunk))
+            if age is None:
+                counts['pending'] += 1
+            elif age > self.lease_seconds:
+                counts['expired'] += 1
+            else:
+                counts['claimed'] += 1
+        return counts
+    
+    def clean(self):
+        """Remove unfinished shard directories left behind by dead workers"""
+        for tmp_dir in self.shards_dir.glob('.chunk_*'):
+            shutil.rmtree(tmp_dir, ignore_errors=True)